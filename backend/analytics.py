@@ -0,0 +1,238 @@
+"""
+Backlink analytics rollups, materialized with $merge into backlink_rollups.
+
+One rollup document per (dim, key[, month]):
+
+    project         per projectId: count, DA/SS avg/min/max, histograms, status counts
+    category        the same per categoryId
+    creator         the same per createdByUserId
+    category_month  the same per categoryId and createdAt month
+    contributor     per contribution userId: contributions, backlinks, projects
+
+refresh() is incremental: only groups touched since the last run's
+watermark (backlinks.updatedAt, contributions.createdAt) are recomputed,
+plus groups recorded by mark_dirty() for deletes and moves, which the
+watermark can't see. Reads never touch the raw collections.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+from .models import (
+    analytics_dirty_collection,
+    analytics_state_collection,
+    backlink_contributions_collection,
+    backlink_rollups_collection,
+    backlinks_collection,
+)
+
+HISTOGRAM_BINS = 10  # 0-9, 10-19, ..., 90+
+STATUSES = ("approved", "pending", "rejected")
+# re-read this much before the watermark, for writes that committed late
+OVERLAP = timedelta(minutes=1)
+STATE_ID = "backlinks"
+
+
+class Dimension(NamedTuple):
+    collection: object
+    field: str                 # group key field; also what "touched" is tracked by
+    watermark_field: str
+    monthly: bool = False
+
+
+DIMENSIONS: Dict[str, Dimension] = {
+    "project": Dimension(backlinks_collection, "projectId", "updatedAt"),
+    "category": Dimension(backlinks_collection, "categoryId", "updatedAt"),
+    "creator": Dimension(backlinks_collection, "createdByUserId", "updatedAt"),
+    "category_month": Dimension(backlinks_collection, "categoryId", "updatedAt", monthly=True),
+    "contributor": Dimension(backlink_contributions_collection, "userId", "createdAt"),
+}
+
+
+def _bin(field: str) -> dict:
+    return {"$min": [{"$floor": {"$divide": [{"$ifNull": [f"${field}", 0]}, 10]}}, HISTOGRAM_BINS - 1]}
+
+
+def _backlink_metrics() -> dict:
+    group = {
+        "backlinks": {"$sum": 1},
+        "avgDa": {"$avg": "$da"},
+        "avgSs": {"$avg": "$ss"},
+        "minDa": {"$min": "$da"},
+        "maxDa": {"$max": "$da"},
+        "minSs": {"$min": "$ss"},
+        "maxSs": {"$max": "$ss"},
+        "points": {"$sum": {"$ifNull": ["$contribute.points", 0]}},
+    }
+    # fixed-width histogram bins as plain sums: no per-group arrays in memory
+    for name in ("da", "ss"):
+        for b in range(HISTOGRAM_BINS):
+            group[f"{name}{b}"] = {"$sum": {"$cond": [{"$eq": [_bin(name), b]}, 1, 0]}}
+    for status in STATUSES:
+        group[f"status_{status}"] = {"$sum": {"$cond": [{"$eq": ["$status", status]}, 1, 0]}}
+    return group
+
+
+def _backlink_projection() -> dict:
+    return {
+        "backlinks": 1,
+        "avgDa": {"$round": ["$avgDa", 2]},
+        "avgSs": {"$round": ["$avgSs", 2]},
+        "minDa": 1,
+        "maxDa": 1,
+        "minSs": 1,
+        "maxSs": 1,
+        "points": 1,
+        "daHistogram": [f"$da{b}" for b in range(HISTOGRAM_BINS)],
+        "ssHistogram": [f"$ss{b}" for b in range(HISTOGRAM_BINS)],
+        "byStatus": {status: f"$status_{status}" for status in STATUSES},
+    }
+
+
+def _pipeline(dim: str, spec: Dimension, match: dict, run_at: datetime) -> List[dict]:
+    key = {"$ifNull": [f"${spec.field}", ""]}
+    group_id = {"$concat": [f"{dim}|", key]}
+    month = None
+    if spec.monthly:
+        month = {"$ifNull": [{"$dateToString": {"format": "%Y-%m", "date": "$createdAt"}}, "unknown"]}
+        group_id = {"$concat": [f"{dim}|", key, "|", month]}
+
+    if spec.collection is backlink_contributions_collection:
+        metrics = {
+            "contributions": {"$sum": 1},
+            "backlinkIds": {"$addToSet": "$backlinkId"},
+            "projectIds": {"$addToSet": "$projectId"},
+            "lastContributionAt": {"$max": "$createdAt"},
+        }
+        projection = {
+            "contributions": 1,
+            "backlinks": {"$size": "$backlinkIds"},
+            "projects": {"$size": "$projectIds"},
+            "lastContributionAt": 1,
+        }
+    else:
+        metrics = _backlink_metrics()
+        projection = _backlink_projection()
+
+    group = {"_id": group_id, "key": {"$first": key}, **metrics}
+    if month is not None:
+        group["month"] = {"$first": month}
+
+    return [
+        {"$match": match},
+        {"$group": group},
+        {
+            "$project": {
+                "dim": {"$literal": dim},
+                "key": 1,
+                **({"month": 1} if month is not None else {}),
+                **projection,
+                "refreshedAt": {"$literal": run_at},
+            }
+        },
+        {
+            "$merge": {
+                "into": backlink_rollups_collection.name,
+                "on": "_id",
+                "whenMatched": "replace",
+                "whenNotMatched": "insert",
+            }
+        },
+    ]
+
+
+def _in(keys: Iterable[str]) -> dict:
+    keys = list(keys)
+    # "" is what the pipeline files missing/null references under
+    return {"$in": keys + [None] if "" in keys else keys}
+
+
+async def mark_dirty(backlink: Optional[dict] = None, contributor_ids: Iterable[str] = ()) -> None:
+    """
+    Record groups a write removed something from (a delete, or an update
+    that moved a backlink to another project/category); the watermark scan
+    only sees where documents are now.
+    """
+    now = datetime.utcnow()
+    rows = []
+    if backlink:
+        for dim, spec in DIMENSIONS.items():
+            if spec.collection is backlinks_collection:
+                rows.append({"dim": dim, "key": backlink.get(spec.field) or "", "at": now})
+    rows.extend({"dim": "contributor", "key": uid or "", "at": now} for uid in contributor_ids)
+    if rows:
+        await analytics_dirty_collection.insert_many(rows)
+
+
+async def refresh(full: bool = False) -> dict:
+    run_at = datetime.utcnow()
+    state = await analytics_state_collection.find_one({"_id": STATE_ID})
+    watermark = None if full or not state else state.get("watermark")
+
+    dirty = []
+    touched: Dict[str, Set[str]] = {dim: set() for dim in DIMENSIONS}
+    if watermark is not None:
+        since = watermark - OVERLAP
+        dirty = await analytics_dirty_collection.find({}).to_list(length=None)
+        for row in dirty:
+            if row["dim"] in touched:
+                touched[row["dim"]].add(row["key"])
+
+        # one scan per source collection, shared by its dimensions
+        sources: Dict[int, List[str]] = {}
+        for dim, spec in DIMENSIONS.items():
+            sources.setdefault(id(spec.collection), []).append(dim)
+        for dims in sources.values():
+            spec = DIMENSIONS[dims[0]]
+            fields = {DIMENSIONS[d].field: 1 for d in dims}
+            cursor = spec.collection.find({spec.watermark_field: {"$gt": since}}, fields)
+            async for doc in cursor:
+                for d in dims:
+                    touched[d].add(doc.get(DIMENSIONS[d].field) or "")
+
+    refreshed = {}
+    for dim, spec in DIMENSIONS.items():
+        if watermark is not None and not touched[dim]:
+            continue
+        match = {} if watermark is None else {spec.field: _in(touched[dim])}
+        await spec.collection.aggregate(
+            _pipeline(dim, spec, match, run_at), allowDiskUse=True
+        ).to_list(length=None)
+
+        # groups that no longer have any documents weren't rewritten
+        stale = {"dim": dim, "refreshedAt": {"$lt": run_at}}
+        if watermark is not None:
+            stale["key"] = {"$in": list(touched[dim])}
+        await backlink_rollups_collection.delete_many(stale)
+        refreshed[dim] = "all" if watermark is None else len(touched[dim])
+
+    await analytics_state_collection.update_one(
+        {"_id": STATE_ID},
+        {"$set": {"watermark": run_at, "refreshedAt": run_at, "full": watermark is None}},
+        upsert=True,
+    )
+    if dirty:
+        await analytics_dirty_collection.delete_many({"_id": {"$in": [row["_id"] for row in dirty]}})
+    return {"refreshedAt": run_at, "full": watermark is None, "groups": refreshed}
+
+
+async def run_refresh_loop(interval_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await refresh()
+        except Exception as e:
+            print("Analytics refresh failed:", e)
+
+
+async def read_rollups(dim: str, key: Optional[str] = None) -> dict:
+    query = {"dim": dim}
+    if key is not None:
+        query["key"] = key
+    rows = await backlink_rollups_collection.find(query).sort([("key", 1), ("month", 1)]).to_list(length=None)
+    state = await analytics_state_collection.find_one({"_id": STATE_ID}) or {}
+    return {
+        "dim": dim,
+        "refreshedAt": state.get("refreshedAt"),
+        "rows": rows,
+    }
@@ -0,0 +1,197 @@
+"""
+Content-addressed media blobs in GridFS (bucket "media").
+
+A blob's id is the sha256 of its bytes, so the same upload is stored once.
+project_media documents reference it by blobId; the bytes are served by
+GET /api/media/blobs/{blobId}, which never changes for a given id and can
+be cached forever.
+
+media_blobs holds one document per hash: {_id: hash, refs, fileId}. Every
+put_blob adds a reference and every release_blob drops one; the GridFS
+file goes only when the atomic claim on refs <= 0 succeeds, so an upload
+that re-references the hash at the same moment can't be left dangling.
+recount_refs() rebuilds the counts from project_media if they ever drift
+(e.g. an upload whose media insert failed keeps its reference).
+"""
+import base64
+import binascii
+import hashlib
+import re
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+from gridfs.errors import NoFile
+from motor.motor_asyncio import AsyncIOMotorGridFSBucket
+from pymongo import ReturnDocument, UpdateOne
+
+from .database import db
+from .models import (
+    media_blobs_collection,
+    media_chunks_collection,
+    media_files_collection,
+    project_media_collection,
+)
+
+media_bucket = AsyncIOMotorGridFSBucket(db, bucket_name="media")
+
+_DATA_URL_RE = re.compile(r"^data:([^;,]*)(;[^,]*)?,(.*)$", re.S)
+_BLOB_ID_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def is_blob_id(value: str) -> bool:
+    return bool(_BLOB_ID_RE.match(value or ""))
+
+
+def decode_data_url(data_url: str) -> Tuple[bytes, str]:
+    """Return (bytes, content type) of a base64 data: URL; ValueError if malformed."""
+    match = _DATA_URL_RE.match(data_url or "")
+    if not match or ";base64" not in (match.group(2) or ""):
+        raise ValueError("Expected a base64 data: URL")
+    try:
+        data = base64.b64decode(match.group(3), validate=False)
+    except (binascii.Error, ValueError):
+        raise ValueError("Invalid base64 in data: URL")
+    return data, match.group(1) or "application/octet-stream"
+
+
+async def put_blob(data: bytes, content_type: str) -> dict:
+    """
+    Add a reference to the blob holding `data`, storing the bytes if no
+    file exists for the hash yet (or it vanished); return its metadata.
+    """
+    blob_id = hashlib.sha256(data).hexdigest()
+    meta = {"blobId": blob_id, "contentType": content_type, "size": len(data)}
+
+    # the reference is taken first: while refs > 0 release_blob can't claim the blob
+    ref = await media_blobs_collection.find_one_and_update(
+        {"_id": blob_id},
+        {"$inc": {"refs": 1}, "$setOnInsert": {"fileId": None}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    file_id = ref.get("fileId")
+    if file_id is not None and await media_files_collection.find_one({"_id": file_id}, {"_id": 1}):
+        return meta
+
+    new_id = await media_bucket.upload_from_stream(
+        blob_id, data, metadata={"sha256": blob_id, "contentType": content_type}
+    )
+    res = await media_blobs_collection.update_one(
+        {"_id": blob_id, "fileId": file_id}, {"$set": {"fileId": new_id}}
+    )
+    if res.modified_count == 0:
+        # a concurrent put of the same bytes stored them first
+        await media_bucket.delete(new_id)
+    return meta
+
+
+async def find_blob(blob_id: str) -> Optional[dict]:
+    if not is_blob_id(blob_id):
+        return None
+    ref = await media_blobs_collection.find_one({"_id": blob_id}, {"fileId": 1})
+    if ref is None or ref.get("fileId") is None:
+        return None
+    return await media_files_collection.find_one({"_id": ref["fileId"]})
+
+
+async def release_blob(blob_id: Optional[str]) -> bool:
+    """Drop one reference; delete the blob when it was the last. True if deleted."""
+    if not blob_id:
+        return False
+    ref = await media_blobs_collection.find_one_and_update(
+        {"_id": blob_id},
+        {"$inc": {"refs": -1}},
+        return_document=ReturnDocument.AFTER,
+    )
+    if ref is None or ref["refs"] > 0:
+        return False
+    # only one caller can claim it, and only while nobody re-referenced it
+    claimed = await media_blobs_collection.find_one_and_delete(
+        {"_id": blob_id, "refs": {"$lte": 0}}
+    )
+    if claimed is None:
+        return False
+    if claimed.get("fileId") is not None:
+        try:
+            await media_bucket.delete(claimed["fileId"])
+        except NoFile:
+            pass
+    return True
+
+
+async def recount_refs() -> dict:
+    """
+    Rebuild media_blobs from project_media (originals and thumbnails). Run
+    while no media is being added or deleted.
+    """
+    counts: Dict[str, int] = {}
+    cursor = project_media_collection.find(
+        {"blobId": {"$nin": [None, ""]}}, {"blobId": 1, "thumbnails": 1}
+    )
+    async for doc in cursor:
+        counts[doc["blobId"]] = counts.get(doc["blobId"], 0) + 1
+        for thumb in (doc.get("thumbnails") or {}).values():
+            if thumb.get("blobId"):
+                counts[thumb["blobId"]] = counts.get(thumb["blobId"], 0) + 1
+
+    ops = []
+    orphans = 0
+    async for file_doc in media_files_collection.find({}, {"metadata.sha256": 1}):
+        blob_id = (file_doc.get("metadata") or {}).get("sha256")
+        if not blob_id:
+            continue
+        refs = counts.pop(blob_id, 0)
+        if refs == 0:
+            orphans += 1
+        ops.append(
+            UpdateOne(
+                {"_id": blob_id},
+                {"$set": {"refs": refs, "fileId": file_doc["_id"]}},
+                upsert=True,
+            )
+        )
+    if ops:
+        await media_blobs_collection.bulk_write(ops, ordered=False)
+    # referenced by media but with no bytes stored
+    return {"blobs": len(ops), "unreferenced": orphans, "missing": len(counts)}
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single `bytes=` Range into inclusive (start, end). None means
+    serve the whole body (no header, or a multi-range we don't support);
+    ValueError means 416.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header[6:].strip().partition("-")
+    try:
+        if first == "":
+            # suffix range: the last N bytes
+            length = int(last)
+            if length <= 0:
+                raise ValueError
+            start, end = max(size - length, 0), size - 1
+        else:
+            start = int(first)
+            end = int(last) if last else size - 1
+    except ValueError:
+        raise ValueError("Malformed Range header")
+    end = min(end, size - 1)
+    if start > end or start >= size:
+        raise ValueError("Range not satisfiable")
+    return start, end
+
+
+async def iter_blob(file_doc: dict, start: int, end: int) -> AsyncIterator[bytes]:
+    """Yield bytes start..end (inclusive) reading only the chunks that cover them."""
+    chunk_size = file_doc["chunkSize"]
+    cursor = media_chunks_collection.find(
+        {
+            "files_id": file_doc["_id"],
+            "n": {"$gte": start // chunk_size, "$lte": end // chunk_size},
+        }
+    ).sort("n", 1)
+    async for chunk in cursor:
+        data = chunk["data"]
+        offset = chunk["n"] * chunk_size
+        yield bytes(data[max(start - offset, 0):min(end + 1 - offset, len(data))])
@@ -0,0 +1,213 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import List
+
+from playwright.async_api import async_playwright
+
+
+class BrowserPoolFull(Exception):
+    """Raised when the pool and its wait queue are both full."""
+
+
+class _PooledBrowser:
+    def __init__(self, browser):
+        self.browser = browser
+        self.active = 0          # contexts currently open on this browser
+        self.pages_served = 0
+        self.retired = False     # replaced in the pool, close once idle
+        self.replacement = None  # launch of the browser taking this slot over
+
+
+class BrowserPool:
+    """
+    Keeps `size` warm Chromium instances and hands out one isolated
+    BrowserContext per scrape.
+
+    - at most `size * contexts_per_browser` pages run at the same time
+    - at most `max_waiters` callers queue for a slot, the rest get BrowserPoolFull
+    - a browser is swapped for a fresh one after `max_pages_per_browser`
+      pages or as soon as it is found disconnected (crash)
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        contexts_per_browser: int = 2,
+        max_pages_per_browser: int = 100,
+        max_waiters: int = 20,
+        acquire_timeout: float = 30.0,
+    ):
+        self.size = max(1, size)
+        self.contexts_per_browser = max(1, contexts_per_browser)
+        self.max_pages_per_browser = max(1, max_pages_per_browser)
+        self.max_waiters = max(0, max_waiters)
+        self.acquire_timeout = acquire_timeout
+
+        self._playwright = None
+        self._slots: List[_PooledBrowser] = []
+        self._slots_lock = asyncio.Lock()
+        self._background = set()
+        self._capacity = asyncio.Semaphore(self.size * self.contexts_per_browser)
+        self._waiting = 0
+        self._launched = 0
+        self._recycled = 0
+
+    async def start(self) -> None:
+        if self._playwright is not None:
+            return
+        self._playwright = await async_playwright().start()
+        for _ in range(self.size):
+            self._slots.append(await self._launch())
+
+    async def stop(self) -> None:
+        for task in list(self._background):
+            task.cancel()
+        await asyncio.gather(*self._background, return_exceptions=True)
+        slots, self._slots = self._slots, []
+        for slot in slots:
+            await self._close_browser(slot)
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _launch(self) -> _PooledBrowser:
+        browser = await self._playwright.chromium.launch(headless=True)
+        self._launched += 1
+        return _PooledBrowser(browser)
+
+    async def _close_browser(self, slot: _PooledBrowser) -> None:
+        try:
+            await slot.browser.close()
+        except Exception:
+            pass
+
+    async def _replace(self, slot: _PooledBrowser) -> _PooledBrowser:
+        """
+        Swap `slot` for a fresh browser. The launch runs outside _slots_lock
+        so checkouts of the other browsers go on meanwhile; concurrent
+        callers for the same slot share one launch.
+        """
+        async with self._slots_lock:
+            if slot.replacement is None:
+                slot.replacement = asyncio.ensure_future(self._launch())
+            launch = slot.replacement
+        try:
+            fresh = await asyncio.shield(launch)
+        except Exception:
+            async with self._slots_lock:
+                if slot.replacement is launch:
+                    slot.replacement = None  # let the next caller retry
+            raise
+
+        to_close = []
+        async with self._slots_lock:
+            if not slot.retired:
+                slot.retired = True
+                if slot in self._slots:
+                    self._slots[self._slots.index(slot)] = fresh
+                    self._recycled += 1
+                else:
+                    to_close.append(fresh)  # the pool was stopped while launching
+                if slot.active == 0:
+                    to_close.append(slot)
+        for browser in to_close:
+            await self._close_browser(browser)
+        return fresh
+
+    def _replace_soon(self, slot: _PooledBrowser) -> None:
+        """Start replacing a crashed browser without waiting for it."""
+        if slot.replacement is not None:
+            return
+
+        async def run():
+            try:
+                await self._replace(slot)
+            except Exception as e:
+                print("Failed to relaunch browser:", e)
+
+        task = asyncio.ensure_future(run())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _checkout(self) -> _PooledBrowser:
+        while True:
+            async with self._slots_lock:
+                if self._playwright is None:
+                    raise RuntimeError("Browser pool is not started")
+                alive = [s for s in self._slots if s.browser.is_connected()]
+                for dead in self._slots:
+                    if dead not in alive:
+                        self._replace_soon(dead)
+                if alive:
+                    slot = min(alive, key=lambda s: s.active)
+                    slot.active += 1
+                    return slot
+                slot = min(self._slots, key=lambda s: s.active)
+            # every browser is down; wait for one to come back
+            await self._replace(slot)
+
+    async def _checkin(self, slot: _PooledBrowser, crashed: bool) -> None:
+        close = replace = False
+        async with self._slots_lock:
+            slot.active -= 1
+            slot.pages_served += 1
+            if slot.retired:
+                close = slot.active == 0
+            else:
+                worn_out = slot.pages_served >= self.max_pages_per_browser
+                replace = crashed or worn_out or not slot.browser.is_connected()
+        if close:
+            await self._close_browser(slot)
+        elif replace:
+            # don't hold the caller's capacity slot for a launch
+            self._replace_soon(slot)
+
+    async def _acquire_capacity(self) -> None:
+        if self._capacity.locked():
+            if self._waiting >= self.max_waiters:
+                raise BrowserPoolFull("All browsers are busy and the wait queue is full")
+            self._waiting += 1
+            try:
+                await asyncio.wait_for(self._capacity.acquire(), self.acquire_timeout)
+            except asyncio.TimeoutError:
+                raise BrowserPoolFull("Timed out waiting for a free browser")
+            finally:
+                self._waiting -= 1
+        else:
+            await self._capacity.acquire()
+
+    @asynccontextmanager
+    async def page(self):
+        """Yield a page in a fresh, isolated context; cleaned up on exit."""
+        await self._acquire_capacity()
+        try:
+            slot = await self._checkout()
+            context = None
+            crashed = False
+            try:
+                context = await slot.browser.new_context()
+                page = await context.new_page()
+                yield page
+            except Exception:
+                crashed = not slot.browser.is_connected()
+                raise
+            finally:
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception:
+                        crashed = crashed or not slot.browser.is_connected()
+                await self._checkin(slot, crashed)
+        finally:
+            self._capacity.release()
+
+    def stats(self) -> dict:
+        return {
+            "browsers": len(self._slots),
+            "activePages": sum(s.active for s in self._slots),
+            "capacity": self.size * self.contexts_per_browser,
+            "waiting": self._waiting,
+            "maxWaiters": self.max_waiters,
+            "launched": self._launched,
+            "recycled": self._recycled,
+        }
@@ -0,0 +1,50 @@
+"""
+Resolve id references on listed documents with one batched query per
+referenced collection, instead of the client downloading whole
+collections to join them.
+"""
+import asyncio
+from typing import List, NamedTuple, Optional
+
+from bson import ObjectId
+
+
+class Ref(NamedTuple):
+    field: str                        # reference field on the listed docs, e.g. "projectId"
+    target: str                       # key the resolved doc is stored under, e.g. "project"
+    collection: object
+    projection: dict
+    name_field: Optional[str] = None  # older docs store the name instead of the id
+
+
+async def _resolve(docs: List[dict], ref: Ref) -> None:
+    values = {doc.get(ref.field) for doc in docs if doc.get(ref.field)}
+    if not values:
+        for doc in docs:
+            doc[ref.target] = None
+        return
+
+    ids = [ObjectId(v) for v in values if ObjectId.is_valid(v)]
+    clauses: List[dict] = [{"_id": {"$in": ids}}] if ids else []
+    if ref.name_field:
+        clauses.append({ref.name_field: {"$in": list(values)}})
+    if not clauses:
+        found = []
+    else:
+        query = clauses[0] if len(clauses) == 1 else {"$or": clauses}
+        found = await ref.collection.find(query, ref.projection).to_list(length=None)
+
+    by_key = {}
+    for item in found:
+        item["_id"] = str(item["_id"])
+        if ref.name_field and item.get(ref.name_field):
+            by_key.setdefault(item[ref.name_field], item)
+        by_key[item["_id"]] = item  # ids win over names
+    for doc in docs:
+        doc[ref.target] = by_key.get(doc.get(ref.field))
+
+
+async def expand_refs(docs: List[dict], refs: List[Ref]) -> List[dict]:
+    """Set doc[ref.target] to the referenced document (or None) for every ref."""
+    await asyncio.gather(*(_resolve(docs, ref) for ref in refs))
+    return docs
@@ -0,0 +1,83 @@
+"""
+Offline parse-time / accuracy benchmark for backend.extractors.
+
+Corpus layout (saved profile pages, one folder per platform):
+
+    <corpus>/<platform>/<name>.html
+    <corpus>/<platform>/<name>.json   # expected {"posts": .., "followers": .., "following": ..}
+
+    python -m backend.extract_bench [<corpus>] [--repeat 20]
+
+The corpus defaults to backend/tests/fixtures/profiles, which
+tests/test_extractors.py also checks on every test run.
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+from .extractors import EXTRACTORS
+
+FIELDS = ("posts", "followers", "following")
+
+DEFAULT_CORPUS = Path(__file__).parent / "tests" / "fixtures" / "profiles"
+
+
+def run_benchmark(corpus: Path, repeat: int = 20) -> dict:
+    report = {}
+    for platform, extract in EXTRACTORS.items():
+        pages = sorted((corpus / platform).glob("*.html"))
+        if not pages:
+            continue
+
+        total_bytes = 0
+        total_seconds = 0.0
+        checked = 0
+        correct = 0
+        misses = []
+        for page in pages:
+            html = page.read_text(encoding="utf-8", errors="replace")
+            total_bytes += len(html)
+
+            started = time.perf_counter()
+            for _ in range(repeat):
+                result = extract(html)
+            total_seconds += (time.perf_counter() - started) / repeat
+
+            expected_path = page.with_suffix(".json")
+            if expected_path.exists():
+                expected = json.loads(expected_path.read_text(encoding="utf-8"))
+                for field in FIELDS:
+                    if field in expected:
+                        checked += 1
+                        if result[field] == expected[field]:
+                            correct += 1
+                        else:
+                            misses.append(
+                                f"{page.name} {field}: got {result[field]}, want {expected[field]}"
+                            )
+
+        report[platform] = {
+            "pages": len(pages),
+            "avgKb": round(total_bytes / len(pages) / 1024, 1),
+            "avgParseMs": round(total_seconds / len(pages) * 1000, 3),
+            "accuracy": round(correct / checked, 3) if checked else None,
+            "misses": misses,
+        }
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark social profile extractors")
+    parser.add_argument("corpus", type=Path, nargs="?", default=DEFAULT_CORPUS)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for platform, row in run_benchmark(args.corpus, args.repeat).items():
+        accuracy = "n/a" if row["accuracy"] is None else f"{row['accuracy']:.1%}"
+        print(
+            f"{platform:10} pages={row['pages']:4} avg={row['avgKb']:8}KB "
+            f"parse={row['avgParseMs']:8}ms accuracy={accuracy}"
+        )
+        for miss in row["misses"]:
+            print("    MISS", miss)
@@ -0,0 +1,169 @@
+import re
+from typing import Callable, Dict
+
+
+# Synchronous, browser-free parsers for social profile HTML.
+# Every pattern is compiled once at import; parsers look at the small
+# <head> meta snippet first and only scan the full document as a fallback.
+
+_COMPACT = r"(\d[\d.,]*\s*[KkMm]?)"
+
+_COMPACT_NUMBER_RE = re.compile(r"([\d.]+)\s*([KkMm])?")
+_HEAD_END_RE = re.compile(r"</head\s*>", re.I)
+_META_DESCRIPTION_RE = re.compile(
+    r"<meta[^>]+(?:property|name)=[\"'](?:og:description|description|twitter:description)[\"'][^>]*>",
+    re.I,
+)
+_CONTENT_ATTR_RE = re.compile(r"content=[\"']([^\"']*)[\"']", re.I)
+
+_FOLLOWERS_RE = re.compile(_COMPACT + r"\s+followers", re.I)
+_FOLLOWING_RE = re.compile(_COMPACT + r"\s+following", re.I)
+_POSTS_RE = re.compile(_COMPACT + r"\s+(?:posts|tweets)", re.I)
+
+# Counters some platforms embed in inline JSON
+_JSON_FOLLOWERS_RE = re.compile(
+    r"\"(?:followers_count|follower_count|edge_followed_by\"\s*:\s*\{\s*\"count)\"\s*:\s*(\d+)"
+)
+_JSON_FOLLOWING_RE = re.compile(
+    r"\"(?:friends_count|following_count|edge_follow\"\s*:\s*\{\s*\"count)\"\s*:\s*(\d+)"
+)
+_JSON_POSTS_RE = re.compile(
+    r"\"(?:statuses_count|media_count|edge_owner_to_timeline_media\"\s*:\s*\{\s*\"count)\"\s*:\s*(\d+)"
+)
+
+# X profile header: <a href="/name/followers"><span><span>1,234</span></span>...</a>
+_TWITTER_LINK_RES = {
+    "followers": re.compile(r"<a[^>]+href=\"[^\"]*/(?:verified_)?followers\"[^>]*>(.*?)</a>", re.I | re.S),
+    "following": re.compile(r"<a[^>]+href=\"[^\"]*/following\"[^>]*>(.*?)</a>", re.I | re.S),
+    "posts": re.compile(r"<a[^>]+href=\"[^\"]*/posts\"[^>]*>(.*?)</a>", re.I | re.S),
+}
+_FIRST_TEXT_NUMBER_RE = re.compile(r">\s*" + _COMPACT + r"\s*<")
+
+
+def parse_compact_number(s: str) -> int:
+    """Helper to parse 1.2K / 3.4M / 1,234 style numbers."""
+    s = (s or "").strip()
+    if not s:
+        return 0
+    s = s.replace(",", "")
+
+    m = _COMPACT_NUMBER_RE.match(s)
+    if not m:
+        try:
+            return int(s)
+        except ValueError:
+            return 0
+    try:
+        num = float(m.group(1))
+    except ValueError:
+        return 0
+    suffix = m.group(2)
+    if suffix in ("K", "k"):
+        num *= 1_000
+    elif suffix in ("M", "m"):
+        num *= 1_000_000
+    return int(num)
+
+
+def _empty() -> dict:
+    return {"posts": 0, "followers": 0, "following": 0}
+
+
+def meta_description_text(html: str) -> str:
+    """Joined content of the description meta tags, read from <head> only."""
+    head_end = _HEAD_END_RE.search(html)
+    head = html[: head_end.start()] if head_end else html
+    parts = []
+    for tag in _META_DESCRIPTION_RE.findall(head):
+        m = _CONTENT_ATTR_RE.search(tag)
+        if m:
+            parts.append(m.group(1))
+    return " ".join(parts)
+
+
+def _fill_from_text(metrics: dict, text: str, patterns: Dict[str, re.Pattern]) -> None:
+    for key, pattern in patterns.items():
+        if not metrics[key]:
+            found = pattern.search(text)
+            if found:
+                metrics[key] = parse_compact_number(found.group(1))
+
+
+def _fill_from_json(metrics: dict, html: str) -> None:
+    for key, pattern in (
+        ("followers", _JSON_FOLLOWERS_RE),
+        ("following", _JSON_FOLLOWING_RE),
+        ("posts", _JSON_POSTS_RE),
+    ):
+        if not metrics[key]:
+            found = pattern.search(html)
+            if found:
+                metrics[key] = int(found.group(1))
+
+
+_ALL_TEXT_PATTERNS = {
+    "followers": _FOLLOWERS_RE,
+    "following": _FOLLOWING_RE,
+    "posts": _POSTS_RE,
+}
+
+
+def extract_static(html: str) -> dict:
+    """Platform-agnostic: meta descriptions, then embedded JSON counters."""
+    metrics = _empty()
+    _fill_from_text(metrics, meta_description_text(html), _ALL_TEXT_PATTERNS)
+    _fill_from_json(metrics, html)
+    return metrics
+
+
+def extract_instagram(html: str) -> dict:
+    """og:description reads "1,234 Followers, 56 Following, 78 Posts - ..."."""
+    metrics = extract_static(html)
+    if not metrics["followers"]:
+        _fill_from_text(metrics, html, _ALL_TEXT_PATTERNS)
+    return metrics
+
+
+def extract_facebook(html: str) -> dict:
+    """Often only followers is reliable."""
+    metrics = extract_static(html)
+    metrics["following"] = 0
+    if not metrics["followers"]:
+        _fill_from_text(
+            metrics, html, {"followers": _FOLLOWERS_RE, "posts": _POSTS_RE}
+        )
+    return metrics
+
+
+def extract_twitter(html: str) -> dict:
+    """Counters from the profile header links, embedded JSON as a fallback."""
+    metrics = _empty()
+    for key, link_re in _TWITTER_LINK_RES.items():
+        link = link_re.search(html)
+        if link:
+            number = _FIRST_TEXT_NUMBER_RE.search(link.group(1))
+            if number:
+                metrics[key] = parse_compact_number(number.group(1))
+    _fill_from_json(metrics, html)
+    return metrics
+
+
+def extract_linkedin(html: str) -> dict:
+    """Many pages show 'X followers'; nothing else is public."""
+    metrics = _empty()
+    _fill_from_text(metrics, meta_description_text(html), {"followers": _FOLLOWERS_RE})
+    if not metrics["followers"]:
+        _fill_from_text(metrics, html, {"followers": _FOLLOWERS_RE})
+    return metrics
+
+
+EXTRACTORS: Dict[str, Callable[[str], dict]] = {
+    "instagram": extract_instagram,
+    "facebook": extract_facebook,
+    "twitter": extract_twitter,
+    "linkedin": extract_linkedin,
+}
+
+
+def extract_metrics(platform: str, html: str) -> dict:
+    return EXTRACTORS[platform](html)
@@ -0,0 +1,65 @@
+from typing import Optional
+
+import httpx
+
+from .extractors import extract_metrics
+
+
+# Desktop browser headers; several platforms serve an empty shell to unknown clients.
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+class HttpMetricsFetcher:
+    """
+    Cheap first tier for social metrics: one pooled HTTP GET, no JavaScript.
+    Returns None when the page doesn't expose a follower count so the caller
+    can fall back to the headless browser.
+    """
+
+    def __init__(self, timeout: float = 5.0, max_connections: int = 20):
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+        self._stats = {"answered": 0, "fellBack": 0, "errors": 0}
+
+    async def start(self) -> None:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=self.max_connections),
+            )
+
+    async def stop(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch(self, platform: str, url: str) -> Optional[dict]:
+        if self._client is None:
+            await self.start()
+        try:
+            res = await self._client.get(url)
+            res.raise_for_status()
+        except httpx.HTTPError:
+            self._stats["errors"] += 1
+            self._stats["fellBack"] += 1
+            return None
+
+        metrics = extract_metrics(platform, res.text)
+        if not metrics["followers"]:
+            self._stats["fellBack"] += 1
+            return None
+        self._stats["answered"] += 1
+        return metrics
+
+    def stats(self) -> dict:
+        return dict(self._stats)
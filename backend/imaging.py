@@ -0,0 +1,52 @@
+"""
+Pillow work for thumbnails. Kept free of app imports: it runs in spawned
+pool processes, which import only this module.
+"""
+import os
+from io import BytesIO
+from typing import Dict, Tuple
+
+from PIL import Image, ImageOps
+
+CONTENT_TYPES = {"WEBP": "image/webp", "JPEG": "image/jpeg"}
+
+THUMBNAIL_SIZES = {
+    name: int(px)
+    for name, px in (
+        part.split(":")
+        for part in os.getenv("THUMBNAIL_SIZES", "sm:160,md:480,lg:1024").split(",")
+    )
+}
+THUMBNAIL_FORMAT = os.getenv("THUMBNAIL_FORMAT", "WEBP").upper()
+THUMBNAIL_QUALITY = int(os.getenv("THUMBNAIL_QUALITY", "80"))
+
+
+def render_thumbnails(
+    data: bytes, sizes: Dict[str, int], fmt: str = "WEBP", quality: int = 80
+) -> Dict[str, Tuple[bytes, int, int]]:
+    """
+    Return {name: (encoded bytes, width, height)}, each fitted inside a
+    size x size box. Sizes larger than the original are skipped; the
+    original already serves them.
+    """
+    img = Image.open(BytesIO(data))
+    # JPEG can decode at 1/2..1/8 scale, far cheaper than a full decode
+    largest = max(sizes.values())
+    img.draft("RGB", (largest, largest))
+    img = ImageOps.exif_transpose(img)
+    if fmt == "JPEG" or img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if fmt != "JPEG" and "A" in img.getbands() else "RGB")
+
+    out = {}
+    # largest first, each smaller one resized from the previous result
+    for name, size in sorted(sizes.items(), key=lambda kv: -kv[1]):
+        if size >= max(img.size):
+            continue
+        img.thumbnail((size, size), Image.LANCZOS)
+        buf = BytesIO()
+        if fmt == "WEBP":
+            img.save(buf, fmt, quality=quality, method=4)
+        else:
+            img.save(buf, fmt, quality=quality, optimize=True, progressive=True)
+        out[name] = (buf.getvalue(), img.width, img.height)
+    return out
@@ -0,0 +1,201 @@
+"""
+Index registry for every collection in backend/models.py.
+
+ensure_indexes() runs at startup; create_index is a no-op when the index
+already exists, so it is safe on every boot. To check that the hot query
+shapes below are index-backed (no COLLSCAN, no in-memory SORT), point MONGODB_URI at a local mongod and run:
+
+    python -m backend.indexes --check
+"""
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from pymongo import ASCENDING, IndexModel
+
+from .models import (
+    backlink_contributions_collection,
+    backlink_rollups_collection,
+    backlinks_collection,
+    cache_invalidations_collection,
+    categories_collection,
+    placements_collection,
+    project_media_collection,
+    projects_collection,
+    social_jobs_collection,
+    social_metrics_cache_collection,
+    social_metrics_history_collection,
+    tools_collection,
+    users_collection,
+)
+
+ID = ("_id", ASCENDING)
+
+INDEXES = [
+    (users_collection, [
+        # every auth handler looks users up by email; create_user assumes one per email
+        IndexModel([("email", ASCENDING)], unique=True, name="email_unique"),
+    ]),
+    (projects_collection, [
+        IndexModel([("ownerUserId", ASCENDING), ID], name="owner_id"),
+        # the expanded backlink listing resolves old name references
+        IndexModel([("name", ASCENDING)], name="name"),
+    ]),
+    (backlinks_collection, [
+        IndexModel([("projectId", ASCENDING), ID], name="project_id"),
+        IndexModel([("projectId", ASCENDING), ("categoryId", ASCENDING), ID], name="project_category_id"),
+        IndexModel([("categoryId", ASCENDING), ID], name="category_id"),
+        IndexModel([("ownerUserId", ASCENDING), ID], name="owner_id"),
+        IndexModel([("createdByUserId", ASCENDING), ID], name="creator_id"),
+        # the analytics refresh scans what changed since its watermark
+        IndexModel([("updatedAt", ASCENDING)], name="updatedAt"),
+    ]),
+    (backlink_contributions_collection, [
+        IndexModel([("backlinkId", ASCENDING), ID], name="backlink_id"),
+        IndexModel([("userId", ASCENDING), ID], name="user_id"),
+        IndexModel([("projectId", ASCENDING), ID], name="project_id"),
+        IndexModel([("createdAt", ASCENDING)], name="createdAt"),
+        # migrated entries are upserted by their position in the old embedded array
+        IndexModel(
+            [("backlinkId", ASCENDING), ("legacyIndex", ASCENDING)],
+            unique=True,
+            partialFilterExpression={"legacyIndex": {"$exists": True}},
+            name="backlink_legacyIndex",
+        ),
+    ]),
+    (project_media_collection, [
+        IndexModel([("projectId", ASCENDING), ID], name="project_id"),
+        IndexModel([("projectId", ASCENDING), ("kind", ASCENDING), ID], name="project_kind_id"),
+    ]),
+    (tools_collection, [
+        # create_tool rejects duplicates by name or by link
+        IndexModel([("toolName", ASCENDING)], unique=True, name="toolName_unique"),
+        IndexModel([("link", ASCENDING)], unique=True, name="link_unique"),
+    ]),
+    (categories_collection, [
+        IndexModel([("isActive", ASCENDING), ID], name="active_id"),
+        IndexModel([("name", ASCENDING)], name="name"),
+    ]),
+    (placements_collection, []),
+    (social_metrics_history_collection, [
+        IndexModel(
+            [("projectId", ASCENDING), ("platform", ASCENDING), ("bucketStart", ASCENDING)],
+            name="project_platform_bucket",
+        ),
+        IndexModel([("granularity", ASCENDING), ("bucketStart", ASCENDING)], name="granularity_bucket"),
+    ]),
+    (social_metrics_cache_collection, [
+        # each entry carries its own expiry, so the cache TTL can change without a reindex
+        IndexModel([("expiresAt", ASCENDING)], expireAfterSeconds=0, name="expiresAt_ttl"),
+    ]),
+    (social_jobs_collection, [
+        # polled by id only; finished jobs are dropped after retain_seconds
+        IndexModel([("expiresAt", ASCENDING)], expireAfterSeconds=0, name="expiresAt_ttl"),
+    ]),
+    (cache_invalidations_collection, [
+        IndexModel([("channel", ASCENDING), ("seq", ASCENDING)], name="channel_seq"),
+        # workers poll every few seconds; an hour of backlog is plenty
+        IndexModel([("createdAt", ASCENDING)], expireAfterSeconds=3600, name="createdAt_ttl"),
+    ]),
+    (backlink_rollups_collection, [
+        IndexModel([("dim", ASCENDING), ("key", ASCENDING), ("month", ASCENDING)], name="dim_key_month"),
+    ]),
+]
+
+
+async def ensure_indexes() -> None:
+    """
+    Create every registered index. A failure (e.g. existing duplicates blocking
+    a unique index) is logged and does not stop the app from starting.
+    """
+    for collection, models in INDEXES:
+        for model in models:
+            try:
+                await collection.create_indexes([model])
+            except Exception as e:
+                print(f"Failed to create index {model.document['name']} on {collection.name}:", e)
+
+
+# ==== QUERY-PLAN GUARD ====
+
+# (collection, filter, sort) for the hot query shapes of the handlers
+QUERY_SHAPES: List[Tuple[object, dict, list]] = [
+    (users_collection, {"email": "someone@example.com"}, []),
+    (projects_collection, {"ownerUserId": "x"}, [ID]),
+    (projects_collection, {}, [ID]),
+    (backlinks_collection, {"projectId": "x"}, [ID]),
+    (backlinks_collection, {"categoryId": "x"}, [ID]),
+    (backlinks_collection, {"projectId": "x", "categoryId": "y"}, [ID]),
+    (backlinks_collection, {"ownerUserId": "x"}, [ID]),
+    (backlink_contributions_collection, {"backlinkId": "x"}, [ID]),
+    (backlink_contributions_collection, {"projectId": "x"}, [ID]),
+    (backlink_contributions_collection, {"userId": "x"}, [ID]),
+    (project_media_collection, {"projectId": "x"}, [ID]),
+    (project_media_collection, {"projectId": "x", "kind": "image"}, [ID]),
+    (tools_collection, {"$or": [{"toolName": "x"}, {"link": "y"}]}, []),
+    (categories_collection, {"isActive": True}, [ID]),
+    (projects_collection, {"$or": [{"_id": {"$in": []}}, {"name": {"$in": ["x"]}}]}, []),
+    (categories_collection, {"$or": [{"_id": {"$in": []}}, {"name": {"$in": ["x"]}}]}, []),
+    (
+        social_metrics_history_collection,
+        {"projectId": "x", "platform": "instagram", "bucketStart": {"$gte": datetime(2000, 1, 1)}},
+        [("bucketStart", ASCENDING)],
+    ),
+    (cache_invalidations_collection, {"channel": "projects", "seq": {"$gt": 0}}, [("seq", ASCENDING)]),
+    (backlinks_collection, {"updatedAt": {"$gt": datetime(2000, 1, 1)}}, []),
+    (backlink_contributions_collection, {"createdAt": {"$gt": datetime(2000, 1, 1)}}, []),
+    (backlink_rollups_collection, {"dim": "project"}, [("key", ASCENDING), ("month", ASCENDING)]),
+]
+
+
+UNINDEXED_STAGES = ("COLLSCAN", "SORT")
+
+
+def _unindexed_stage(plan) -> Optional[str]:
+    """The first COLLSCAN or in-memory SORT stage in an explain plan, if any."""
+    if isinstance(plan, dict):
+        if plan.get("stage") in UNINDEXED_STAGES:
+            return plan["stage"]
+        plan = list(plan.values())
+    if isinstance(plan, list):
+        for value in plan:
+            stage = _unindexed_stage(value)
+            if stage:
+                return stage
+    return None
+
+
+async def find_unindexed_queries() -> List[str]:
+    """Explain each registered query shape; return the ones that scan the collection or sort in memory."""
+    offenders = []
+    for collection, query, sort in QUERY_SHAPES:
+        cursor = collection.find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        explained = await cursor.explain()
+        stage = _unindexed_stage(explained.get("queryPlanner", {}).get("winningPlan", {}))
+        if stage:
+            offenders.append(f"{stage} {collection.name}: filter={query} sort={sort}")
+    return offenders
+
+
+async def _cli(args) -> int:
+    await ensure_indexes()
+    if not args.check:
+        print("Indexes ensured")
+        return 0
+    offenders = await find_unindexed_queries()
+    for offender in offenders:
+        print(offender)
+    print(f"{len(QUERY_SHAPES) - len(offenders)}/{len(QUERY_SHAPES)} query shapes use an index")
+    return 1 if offenders else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create indexes and verify query plans")
+    parser.add_argument(
+        "--check", action="store_true", help="fail if a hot query does a COLLSCAN or an in-memory SORT"
+    )
+    sys.exit(asyncio.run(_cli(parser.parse_args())))
@@ -0,0 +1,167 @@
+import asyncio
+import smtplib
+import time
+from collections import deque
+from email.message import Message
+from typing import Optional
+
+
+class MailQueueFull(Exception):
+    """Raised when too many emails are waiting to be sent."""
+
+
+class MailDispatcher:
+    """
+    Sends email from a background worker so handlers never block on SMTP.
+
+    The worker keeps one authenticated SMTP connection open and reuses it,
+    reconnecting when the server drops it. The blocking smtplib calls run in
+    a thread. A failed send is retried with exponential backoff. The
+    connection is closed after `idle_timeout` seconds without mail.
+
+    `enqueue()` is fire-and-forget; `await send()` waits for the outcome
+    (without blocking the event loop) and raises if every attempt failed.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        secure: bool = True,
+        max_retries: int = 3,
+        backoff_seconds: float = 1.0,
+        idle_timeout: float = 30.0,
+        connect_timeout: float = 15.0,
+        max_queue: int = 1000,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.secure = secure  # STARTTLS + AUTH; off only for a local sink
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.max_queue = max_queue
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._conn: Optional[smtplib.SMTP] = None
+        self._latencies = deque(maxlen=500)
+        self._stats = {"sent": 0, "failed": 0, "retries": 0, "connects": 0}
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._task = asyncio.create_task(self._worker())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await asyncio.to_thread(self._close)
+
+    # ---- blocking part, runs in a thread ----
+
+    def _connect(self) -> smtplib.SMTP:
+        conn = smtplib.SMTP(self.host, self.port, timeout=self.connect_timeout)
+        if self.secure:
+            conn.starttls()
+            if self.user and self.password:
+                conn.login(self.user, self.password)
+        self._stats["connects"] += 1
+        return conn
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.quit()
+            except Exception:
+                pass
+            self._conn = None
+
+    def _deliver(self, msg: Message) -> None:
+        if self._conn is None:
+            self._conn = self._connect()
+            self._conn.send_message(msg)
+            return
+        try:
+            self._conn.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # the server dropped the idle connection; reconnect once, no backoff
+            self._conn = self._connect()
+            self._conn.send_message(msg)
+
+    # ---- async side ----
+
+    def enqueue(self, msg: Message) -> asyncio.Future:
+        if self._queue is None:
+            raise RuntimeError("Mail dispatcher is not started")
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((msg, future))
+        except asyncio.QueueFull:
+            raise MailQueueFull("Mail queue is full")
+        # nobody may await a fire-and-forget send; don't warn about its exception
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        return future
+
+    async def send(self, msg: Message) -> None:
+        await self.enqueue(msg)
+
+    async def _send_with_retries(self, msg: Message) -> None:
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            try:
+                await asyncio.to_thread(self._deliver, msg)
+                self._latencies.append(time.monotonic() - started)
+                self._stats["sent"] += 1
+                return
+            except Exception:
+                # the connection may be half-dead; start fresh next attempt
+                await asyncio.to_thread(self._close)
+                attempt += 1
+                if attempt > self.max_retries:
+                    self._stats["failed"] += 1
+                    raise
+                self._stats["retries"] += 1
+                await asyncio.sleep(self.backoff_seconds * 2 ** (attempt - 1))
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                msg, future = await asyncio.wait_for(self._queue.get(), self.idle_timeout)
+            except asyncio.TimeoutError:
+                await asyncio.to_thread(self._close)
+                continue
+            try:
+                await self._send_with_retries(msg)
+                if not future.done():
+                    future.set_result(None)
+            except Exception as e:
+                print("Failed to send email to", msg.get("To"), ":", e)
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    def stats(self) -> dict:
+        values = sorted(self._latencies)
+
+        def pct(p: float) -> int:
+            if not values:
+                return 0
+            return round(values[min(len(values) - 1, int(p / 100 * len(values)))] * 1000)
+
+        return {
+            **self._stats,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "connected": self._conn is not None,
+            "p50Ms": pct(50),
+            "p95Ms": pct(95),
+        }
@@ -1,26 +1,31 @@
-from datetime import datetime, timedelta
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 import os
 from dotenv import load_dotenv
 import random
 import string
-import smtplib
 from email.mime.text import MIMEText
 from email.message import EmailMessage
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from bson import ObjectId
-from passlib.hash import bcrypt
+from pymongo.errors import DuplicateKeyError
 
 from .models import (
     users_collection,
     projects_collection,
     categories_collection,
     backlinks_collection,
+    backlink_contributions_collection,
     project_media_collection,
     tools_collection,
     placements_collection,
+    social_sweeps_collection,
+    scoring_runs_collection,
 )
 
 from .schemas import (
@@ -34,11 +39,116 @@ from .schemas import (
     CategoryOut,
     BacklinkCreate,
     BacklinkOut,
+    ContributionOut,
     PlacementCreate,
     PlacementOut,
+    PROJECT_VIEWS,
+    BACKLINK_VIEWS,
 )
+from .analytics import (
+    DIMENSIONS as ANALYTICS_DIMENSIONS,
+    mark_dirty as mark_analytics_dirty,
+    read_rollups,
+    refresh as refresh_analytics,
+    run_refresh_loop as run_analytics_loop,
+)
+from .blob_store import (
+    decode_data_url,
+    find_blob,
+    iter_blob,
+    parse_range,
+    put_blob,
+    release_blob,
+)
+from .browser_pool import BrowserPoolFull
+from .expand import Ref, expand_refs
+from .indexes import ensure_indexes
+from .mailer import MailDispatcher, MailQueueFull
+from .pagination import (
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    facet_pages,
+    find_page,
+    ndjson_response,
+)
+from .passwords import hash_password, shutdown as shutdown_password_pool, verify_password
+from .project_cache import project_cache
+from .request_blocking import blocking_totals
+from .scoring import is_running as scoring_is_running, start_scoring, stop_scoring
+from .scrapers import SOCIAL_PLATFORMS, scrape_latency
+from .serialization import ModelView, json_response
+from .social import (
+    browser_pool,
+    fetch_social_metrics,
+    http_fetcher,
+    social_cache,
+    social_jobs,
+)
+from .social_history import (
+    compact_history,
+    query_series,
+    record_snapshots,
+    run_compaction_loop,
+    snapshot_update,
+)
+from .social_jobs import JobQueueFull
+from .stats import (
+    bump as bump_stats,
+    read_counters,
+    reconcile as reconcile_stats,
+    run_reconcile_loop,
+)
+from .social_sweep import (
+    is_running as sweep_is_running,
+    parse_platform_limits,
+    start_sweep,
+    stop_sweeps,
+)
+from .thumbnails import make_thumbnails, shutdown as shutdown_thumbnail_pool
+
 
-app = FastAPI(title="Backlink Digital API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await ensure_indexes()
+    # seed the counters before serving; bumps only ever adjust a counted base
+    try:
+        await reconcile_stats()
+    except Exception as e:
+        print("Stats reconciliation failed:", e)
+    await http_fetcher.start()
+    await browser_pool.start()
+    await social_jobs.start()
+    await mail_dispatcher.start()
+    compactor = asyncio.create_task(
+        run_compaction_loop(float(os.getenv("SOCIAL_HISTORY_COMPACT_HOURS", "24")) * 3600)
+    )
+    stats_reconciler = asyncio.create_task(
+        run_reconcile_loop(float(os.getenv("STATS_RECONCILE_MINUTES", "10")) * 60)
+    )
+    cache_sync = asyncio.create_task(
+        project_cache.run_sync_loop(float(os.getenv("CACHE_SYNC_SECONDS", "2")))
+    )
+    analytics_refresher = asyncio.create_task(
+        run_analytics_loop(float(os.getenv("ANALYTICS_REFRESH_MINUTES", "5")) * 60)
+    )
+    try:
+        yield
+    finally:
+        analytics_refresher.cancel()
+        cache_sync.cancel()
+        stats_reconciler.cancel()
+        compactor.cancel()
+        await stop_sweeps()
+        await stop_scoring()
+        await mail_dispatcher.stop()
+        await social_jobs.stop()
+        await browser_pool.stop()
+        await http_fetcher.stop()
+        shutdown_password_pool()
+        shutdown_thumbnail_pool()
+
+
+app = FastAPI(title="Backlink Digital API", lifespan=lifespan)
 
 # Allow your React dev server
 origins = [
@@ -54,6 +164,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # ================= SMTP / OTP HELPERS =================
@@ -69,6 +180,20 @@ SMTP_FROM = os.getenv("SMTP_FROM")
 if not all([SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASS, SMTP_FROM]):
     raise RuntimeError("SMTP environment variables are not fully set")
 
+# One worker with a persistent SMTP connection; handlers only enqueue.
+# SMTP_SECURE=0 skips STARTTLS/AUTH, e.g. for a local sink
+# (python -m aiosmtpd -n -l localhost:1025).
+mail_dispatcher = MailDispatcher(
+    SMTP_HOST,
+    SMTP_PORT,
+    user=SMTP_USER,
+    password=SMTP_PASS,
+    secure=os.getenv("SMTP_SECURE", "1") != "0",
+    max_retries=int(os.getenv("SMTP_MAX_RETRIES", "3")),
+    backoff_seconds=float(os.getenv("SMTP_RETRY_BACKOFF_SECONDS", "1")),
+    idle_timeout=float(os.getenv("SMTP_IDLE_SECONDS", "30")),
+)
+
 # Admin credentials (can override via .env)
 ADMIN_USERNAME = os.getenv("ADMIN_USERNAME", "admin")
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "admin123")
@@ -84,17 +209,14 @@ admin_otp_store = {
 }
 
 
-def send_admin_otp_email(to_email: str, otp_code: str):
-    """Send admin login OTP to fixed email."""
+async def send_admin_otp_email(to_email: str, otp_code: str):
+    """Send admin login OTP to fixed email; waits until it is delivered."""
     msg = MIMEText(f"Your admin login OTP is: {otp_code}")
     msg["Subject"] = "Klon Admin Login OTP"
     msg["From"] = SMTP_FROM or SMTP_USER  # match MAIL FROM you configured
     msg["To"] = to_email
 
-    with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-        server.starttls()
-        server.login(SMTP_USER, SMTP_PASS)
-        server.send_message(msg)
+    await mail_dispatcher.send(msg)
 
 
 def generate_otp(length: int = 6) -> str:
@@ -140,7 +262,7 @@ def build_login_otp_email_body(otp: str) -> str:
 
 
 def send_otp_email(to_email: str, otp: str) -> None:
-    """Send user OTP email via SMTP."""
+    """Queue user OTP email; delivery happens in the background."""
     msg = EmailMessage()
     msg["Subject"] = "Your OTP Code"
     msg["From"] = SMTP_FROM
@@ -151,10 +273,7 @@ def send_otp_email(to_email: str, otp: str) -> None:
     html_body = build_login_otp_email_body(otp)
     msg.add_alternative(html_body, subtype="html")
 
-    with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-        server.starttls()
-        server.login(SMTP_USER, SMTP_PASS)
-        server.send_message(msg)
+    mail_dispatcher.enqueue(msg)
 
 
 @app.get("/health")
@@ -201,7 +320,7 @@ async def request_otp(payload: dict):
 
     try:
         send_otp_email(email, otp)
-    except Exception as e:
+    except MailQueueFull as e:
         print("Failed to send OTP email:", e)
 
     print("TEST OTP for", email, "=", otp)
@@ -281,7 +400,7 @@ async def verify_otp_set_password(payload: dict):
     if otp != stored_otp:
         raise HTTPException(status_code=400, detail="Invalid OTP")
 
-    password_hash = bcrypt.hash(password)
+    password_hash = await hash_password(password)
 
     await users_collection.update_one(
         {"_id": user["_id"]},
@@ -323,9 +442,17 @@ async def login(payload: dict):
             detail="Account not activated. Please sign up with OTP first.",
         )
 
-    if not bcrypt.verify(password, user["passwordHash"]):
+    ok, new_hash = await verify_password(password, user["passwordHash"])
+    if not ok:
         raise HTTPException(status_code=400, detail="Invalid credentials")
 
+    if new_hash:
+        # BCRYPT_ROUNDS changed since this hash was made
+        await users_collection.update_one(
+            {"_id": user["_id"], "passwordHash": user["passwordHash"]},
+            {"$set": {"passwordHash": new_hash}},
+        )
+
     return {
         "message": "Login OK",
         "userId": str(user["_id"]),
@@ -362,7 +489,7 @@ async def admin_login(payload: dict):
     }
 
     try:
-        send_admin_otp_email(email, otp_code)
+        await send_admin_otp_email(email, otp_code)
     except Exception as e:
         print("Failed to send admin OTP email:", e)
         raise HTTPException(status_code=500, detail="Failed to send admin OTP email")
@@ -414,7 +541,11 @@ async def create_user(user: UserCreate):
         "createdAt": now,
         "updatedAt": now,
     }
-    res = await users_collection.insert_one(doc)
+    try:
+        res = await users_collection.insert_one(doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already exists")
+    await bump_stats("users", doc, 1)
     created = await users_collection.find_one({"_id": res.inserted_id})
     if created and "_id" in created:
         created["_id"] = str(created["_id"])
@@ -436,11 +567,14 @@ async def update_user(user_id: str, user: UserCreate):
         "points": user.points,
         "updatedAt": now,
     }
-    res = await users_collection.find_one_and_update(
-        {"_id": ObjectId(user_id)},
-        {"$set": update_doc},
-        return_document=True,
-    )
+    try:
+        res = await users_collection.find_one_and_update(
+            {"_id": ObjectId(user_id)},
+            {"$set": update_doc},
+            return_document=True,
+        )
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already exists")
     if not res:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -453,20 +587,37 @@ async def delete_user(user_id: str):
     if not ObjectId.is_valid(user_id):
         raise HTTPException(status_code=400, detail="Invalid user id")
 
-    result = await users_collection.delete_one({"_id": ObjectId(user_id)})
-    if result.deleted_count == 0:
+    deleted = await users_collection.find_one_and_delete({"_id": ObjectId(user_id)})
+    if not deleted:
         raise HTTPException(status_code=404, detail="User not found")
+    await bump_stats("users", deleted, -1)
 
     return {"deleted": True}
 
 
+USER_VIEW = ModelView(UserOut)
+
+
 @app.get("/api/admin/users", response_model=List[UserOut])
-async def list_users():
-    users = await users_collection.find().to_list(length=1000)
-    for u in users:
-        if "_id" in u:
-            u["_id"] = str(u["_id"])
-    return users
+async def list_users(
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+    stream: bool = False,
+):
+    if stream:
+        # the list response_model drops these; the raw stream has to as well
+        return ndjson_response(
+            users_collection,
+            {},
+            after=after,
+            projection={"passwordHash": 0, "otpCode": 0, "otpExpiresAt": 0},
+        )
+
+    users = await find_page(
+        users_collection, {}, response, limit, after, projection=USER_VIEW.projection
+    )
+    return USER_VIEW.response(users, response)
 
 
 # ==== PROJECTS (social links update) ====
@@ -535,6 +686,24 @@ async def update_project_info(project_id: str, payload: dict):
     updated = await projects_collection.find_one({"_id": ObjectId(project_id)})
     if not updated:
         raise HTTPException(status_code=404, detail="Project not found")
+    await project_cache.invalidate(project_id)
+
+    # keep a history point for every platform that has a profile set
+    await record_snapshots(
+        [
+            snapshot_update(
+                project_id,
+                platform,
+                {
+                    "posts": update_fields[f"{platform}Posts"],
+                    "followers": update_fields[f"{platform}Followers"],
+                    "following": update_fields[f"{platform}Following"],
+                },
+            )
+            for platform in SOCIAL_PLATFORMS
+            if update_fields[f"{platform}Url"]
+        ]
+    )
 
     updated["id"] = str(updated["_id"])
     del updated["_id"]
@@ -557,6 +726,7 @@ async def create_project(project: ProjectCreate):
         "updatedAt": now,
     }
     res = await projects_collection.insert_one(doc)
+    await bump_stats("projects", doc, 1)
     created = await projects_collection.find_one({"_id": res.inserted_id})
     if created and "_id" in created:
         created["_id"] = str(created["_id"])
@@ -577,6 +747,15 @@ async def add_project_media(project_id: str, items: List[ProjectMediaCreate]):
         doc = item.dict()
         doc["projectId"] = project_id
         doc["createdAt"] = doc.get("createdAt") or now
+        data_url = doc.pop("dataUrl", None)
+        if data_url:
+            try:
+                data, content_type = decode_data_url(data_url)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            doc.update(await put_blob(data, content_type))
+            if doc["kind"] == "image":
+                doc["thumbnails"] = await make_thumbnails(data, content_type)
         docs.append(doc)
 
     if not docs:
@@ -594,20 +773,53 @@ async def add_project_media(project_id: str, items: List[ProjectMediaCreate]):
     return saved
 
 
+MEDIA_VIEW = ModelView(ProjectMediaOut)
+MEDIA_KINDS = ("image", "video", "file")
+
+
 @app.get(
     "/api/projects/{project_id}/media",
     response_model=List[ProjectMediaOut],
 )
-async def list_project_media(project_id: str, kind: str | None = None):
+async def list_project_media(
+    project_id: str,
+    response: Response,
+    kind: str | None = None,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+    stream: bool = False,
+    grouped: bool = False,
+):
+    """
+    ?grouped=true returns every kind in one response (one aggregation):
+    {"image": {"items", "count", "nextCursor"}, "video": ..., "file": ...},
+    with `limit` applied per kind. Further pages of a kind come from
+    ?kind=...&after=<nextCursor>.
+    """
     query = {"projectId": project_id}
+    if grouped:
+        groups = await facet_pages(
+            project_media_collection, query, "kind", MEDIA_KINDS, limit,
+            projection=MEDIA_VIEW.projection,
+        )
+        for group in groups.values():
+            group["items"] = [MEDIA_VIEW.shape(doc) for doc in group["items"]]
+        return json_response(groups)
+
     if kind:
         query["kind"] = kind
 
-    items = await project_media_collection.find(query).to_list(length=1000)
-    for it in items:
-        if "_id" in it:
-            it["_id"] = str(it["_id"])
-    return items
+    if stream:
+        return ndjson_response(
+            project_media_collection, query, after=after,
+            transform=MEDIA_VIEW.shape, projection=MEDIA_VIEW.projection,
+        )
+
+    items = await find_page(
+        project_media_collection, query, response, limit, after,
+        projection=MEDIA_VIEW.projection,
+    )
+    return MEDIA_VIEW.response(items, response)
 
 
 @app.delete("/api/projects/{project_id}/media/{media_id}")
@@ -615,14 +827,70 @@ async def delete_project_media(project_id: str, media_id: str):
     if not ObjectId.is_valid(media_id):
         raise HTTPException(status_code=400, detail="Invalid media id")
 
-    result = await project_media_collection.delete_one(
-        {"_id": ObjectId(media_id), "projectId": project_id}
+    deleted = await project_media_collection.find_one_and_delete(
+        {"_id": ObjectId(media_id), "projectId": project_id},
+        projection={"blobId": 1, "thumbnails": 1},
     )
-    if result.deleted_count == 0:
+    if not deleted:
         raise HTTPException(status_code=404, detail="Media not found")
+    # the media held one reference on its original and one on each thumbnail
+    await release_blob(deleted.get("blobId"))
+    for thumb in (deleted.get("thumbnails") or {}).values():
+        await release_blob(thumb.get("blobId"))
     return {"deleted": True}
 
 
+@app.get("/api/media/blobs/{blob_id}")
+async def download_media_blob(
+    blob_id: str,
+    range_header: str | None = Header(None, alias="Range"),
+    if_none_match: str | None = Header(None),
+):
+    """
+    Stream a media blob. Blob ids are content hashes, so the response is
+    immutable: cached for a year and revalidated by ETag. Single byte
+    ranges get 206.
+    """
+    file_doc = await find_blob(blob_id)
+    if not file_doc:
+        raise HTTPException(status_code=404, detail="Blob not found")
+
+    etag = f'"{blob_id}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=31536000, immutable",
+        "Accept-Ranges": "bytes",
+    }
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    size = file_doc["length"]
+    try:
+        byte_range = parse_range(range_header, size)
+    except ValueError:
+        raise HTTPException(
+            status_code=416,
+            detail="Range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+
+    status_code = 200
+    start, end = 0, size - 1
+    if byte_range:
+        start, end = byte_range
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+
+    return StreamingResponse(
+        iter_blob(file_doc, start, end),
+        status_code=status_code,
+        media_type=(file_doc.get("metadata") or {}).get("contentType")
+        or "application/octet-stream",
+        headers=headers,
+    )
+
+
 @app.put("/api/admin/projects/{project_id}", response_model=ProjectOut)
 async def update_project(project_id: str, project: ProjectCreate):
     if not ObjectId.is_valid(project_id):
@@ -644,6 +912,7 @@ async def update_project(project_id: str, project: ProjectCreate):
     )
     if not res:
         raise HTTPException(status_code=404, detail="Project not found")
+    await project_cache.invalidate(project_id)
 
     res["_id"] = str(res["_id"])
     return res
@@ -654,43 +923,114 @@ async def delete_project(project_id: str):
     if not ObjectId.is_valid(project_id):
         raise HTTPException(status_code=400, detail="Invalid project id")
 
-    result = await projects_collection.delete_one({"_id": ObjectId(project_id)})
-    if result.deleted_count == 0:
+    deleted = await projects_collection.find_one_and_delete(
+        {"_id": ObjectId(project_id)}, projection={"status": 1}
+    )
+    if not deleted:
         raise HTTPException(status_code=404, detail="Project not found")
+    await bump_stats("projects", deleted, -1)
+    await project_cache.invalidate(project_id)
 
     return {"deleted": True}
 
 
+PROJECT_VIEW = ModelView(ProjectOut)
+
+
 @app.get("/api/projects", response_model=List[ProjectOut])
 async def list_projects(
+    response: Response,
     search: str | None = None,
     ownerUserId: str | None = None,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+    stream: bool = False,
+    view: str | None = None,
+    fields: str | None = None,
 ):
+    """
+    ?view=summary|full or ?fields=name,url,... picks the returned fields;
+    the projection is applied in Mongo, so unused fields are never read.
+    """
     query: dict = {}
     if search:
         query["name"] = {"$regex": search, "$options": "i"}
     if ownerUserId:
         query["ownerUserId"] = ownerUserId
 
-    projects = await projects_collection.find(query).to_list(length=1000)
-    for p in projects:
-        if "_id" in p:
-            p["_id"] = str(p["_id"])
-    return projects
+    selected = PROJECT_VIEW.select(view, fields, PROJECT_VIEWS)
+    if stream:
+        return ndjson_response(
+            projects_collection, query, after=after,
+            transform=selected.shape, projection=selected.projection,
+        )
+
+    projects = await find_page(
+        projects_collection, query, response, limit, after,
+        projection=selected.projection,
+    )
+    return selected.response(projects, response)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(",")]
+    # weak comparison, as If-None-Match requires
+    return "*" in tags or etag in (t[2:] if t.startswith("W/") else t for t in tags)
+
+
+@app.get("/api/projects/{project_id}")
+async def get_project(
+    project_id: str,
+    if_none_match: str | None = Header(None),
+):
+    """
+    The full project document, served from the read-through project_cache.
+    Sends an ETag; a matching If-None-Match gets 304 with no body.
+    """
+    if not ObjectId.is_valid(project_id):
+        raise HTTPException(status_code=400, detail="Invalid project id")
+
+    cached = await project_cache.get(project_id)
+    if cached is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    # no-cache: browsers may keep it but must revalidate with the ETag
+    headers = {"ETag": cached.etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(cached.body, media_type="application/json", headers=headers)
 
 
 # ==== PLACEMENTS (Master of Placement page) ====
 
 
+PLACEMENT_VIEW = ModelView(PlacementOut)
+
+
+def _placement_out(doc: dict) -> dict:
+    doc["id"] = str(doc.pop("_id"))
+    return doc
+
+
 @app.get("/api/placements", response_model=List[PlacementOut])
-async def list_placements():
-    docs = await placements_collection.find({}).to_list(length=1000)
-    results: List[PlacementOut] = []
-    for d in docs:
-        d["id"] = str(d["_id"])
-        del d["_id"]
-        results.append(PlacementOut(**d))
-    return results
+async def list_placements(
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+    stream: bool = False,
+):
+    if stream:
+        return ndjson_response(
+            placements_collection, {}, after=after, transform=_placement_out
+        )
+
+    docs = await find_page(
+        placements_collection, {}, response, limit, after,
+        projection=PLACEMENT_VIEW.projection,
+    )
+    return PLACEMENT_VIEW.response((_placement_out(d) for d in docs), response)
 
 
 @app.post("/api/placements", response_model=PlacementOut)
@@ -761,7 +1101,11 @@ async def create_tool(payload: dict):
         "createdAt": datetime.utcnow(),
         "ownerUserId": (payload.get("ownerUserId") or "").strip(),
     }
-    res = await tools_collection.insert_one(doc)
+    try:
+        res = await tools_collection.insert_one(doc)
+    except DuplicateKeyError:
+        # lost a race with another create of the same tool
+        raise HTTPException(status_code=400, detail="Tool already exists")
     created = await tools_collection.find_one({"_id": res.inserted_id})
     created["_id"] = str(created["_id"])
     return created
@@ -780,11 +1124,17 @@ async def delete_tool(tool_id: str):
 
 
 @app.get("/api/tools")
-async def list_tools():
-    tools = await tools_collection.find({}).to_list(length=1000)
-    for t in tools:
-        t["_id"] = str(t["_id"])
-    return tools
+async def list_tools(
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+    stream: bool = False,
+):
+    if stream:
+        return ndjson_response(tools_collection, {}, after=after)
+
+    tools = await find_page(tools_collection, {}, response, limit, after)
+    return json_response(tools, response)
 
 
 @app.post("/api/admin/categories", response_model=CategoryOut)
@@ -840,13 +1190,20 @@ async def delete_category(category_id: str):
     return {"deleted": True}
 
 
+CATEGORY_VIEW = ModelView(CategoryOut)
+
+
 @app.get("/api/categories", response_model=List[CategoryOut])
-async def list_categories():
-    cats = await categories_collection.find({"isActive": True}).to_list(length=1000)
-    for c in cats:
-        if "_id" in c:
-            c["_id"] = str(c["_id"])
-    return cats
+async def list_categories(
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+):
+    cats = await find_page(
+        categories_collection, {"isActive": True}, response, limit, after,
+        projection=CATEGORY_VIEW.projection,
+    )
+    return CATEGORY_VIEW.response(cats, response)
 
 
 # ==== BACKLINKS (User Backlinks page) ====
@@ -858,22 +1215,33 @@ async def create_backlink(backlink: BacklinkCreate):
     doc = backlink.dict()
     doc["createdAt"] = now
     doc["updatedAt"] = now
-    doc.setdefault("contributions", [])
-    doc.setdefault("contribute", {"points": 0})
+    if not doc.get("contribute"):
+        doc["contribute"] = {"points": 0}
 
     res = await backlinks_collection.insert_one(doc)
+    await bump_stats("backlinks", doc, 1)
     created = await backlinks_collection.find_one({"_id": res.inserted_id})
     if created and "_id" in created:
         created["_id"] = str(created["_id"])
     return created
 
 
+BACKLINK_VIEW = ModelView(BacklinkOut)
+
+
 @app.get("/api/user/backlinks", response_model=List[BacklinkOut])
 async def list_backlinks(
+    response: Response,
     projectId: str | None = None,
     categoryId: str | None = None,
     ownerUserId: str | None = None,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+    stream: bool = False,
+    view: str | None = None,
+    fields: str | None = None,
 ):
+    """?view=summary|full or ?fields=domain,url,... picks the returned fields."""
     query: dict = {}
     if projectId:
         query["projectId"] = projectId
@@ -882,11 +1250,75 @@ async def list_backlinks(
     if ownerUserId:
         query["ownerUserId"] = ownerUserId
 
-    links = await backlinks_collection.find(query).to_list(length=1000)
-    for l in links:
-        if "_id" in l:
-            l["_id"] = str(l["_id"])
-    return links
+    # contributions are served by /api/user/backlinks/{id}/contributions;
+    # the projection also hides arrays on documents not yet migrated
+    selected = BACKLINK_VIEW.select(view, fields, BACKLINK_VIEWS)
+    if stream:
+        return ndjson_response(
+            backlinks_collection, query, after=after,
+            transform=selected.shape, projection=selected.projection,
+        )
+
+    links = await find_page(
+        backlinks_collection, query, response, limit, after,
+        projection=selected.projection,
+    )
+    return selected.response(links, response)
+
+
+# display fields of the expanded listing; references come back as objects
+EXPANDED_BACKLINK_VIEW = ModelView(
+    fields=[
+        (key, None)
+        for key in (
+            "_id", "domain", "url", "da", "ss", "status", "contribute",
+            "projectId", "categoryId", "createdByUserId", "createdAt",
+            "project", "category", "createdBy",
+        )
+    ]
+)
+BACKLINK_REFS = [
+    Ref("projectId", "project", projects_collection, {"name": 1, "url": 1}, name_field="name"),
+    Ref("categoryId", "category", categories_collection, {"name": 1}, name_field="name"),
+    Ref("createdByUserId", "createdBy", users_collection, {"name": 1, "email": 1}),
+]
+
+
+@app.get("/api/user/backlinks/expanded")
+async def list_backlinks_expanded(
+    response: Response,
+    projectId: str | None = None,
+    categoryId: str | None = None,
+    ownerUserId: str | None = None,
+    createdByUserId: str | None = None,
+    status: str | None = None,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+):
+    """
+    Backlinks with project / category / createdBy resolved on the server:
+    one $in query per referenced collection for the page. Old documents
+    that store a project or category name instead of its id are matched by
+    name. Paginated like list_backlinks.
+    """
+    query: dict = {}
+    if projectId:
+        query["projectId"] = projectId
+    if categoryId:
+        query["categoryId"] = categoryId
+    if ownerUserId:
+        query["ownerUserId"] = ownerUserId
+    if createdByUserId:
+        query["createdByUserId"] = createdByUserId
+    if status:
+        query["status"] = status
+
+    links = await find_page(
+        backlinks_collection, query, response, limit, after,
+        projection=EXPANDED_BACKLINK_VIEW.projection,
+    )
+    await expand_refs(links, BACKLINK_REFS)
+    return EXPANDED_BACKLINK_VIEW.response(links, response)
 
 
 @app.put("/api/user/backlinks/{backlink_id}", response_model=BacklinkOut)
@@ -895,26 +1327,28 @@ async def update_backlink(backlink_id: str, backlink: BacklinkCreate):
         raise HTTPException(status_code=400, detail="Invalid backlink id")
 
     now = datetime.utcnow()
-    update_doc = backlink.dict()
+    # points are maintained by the contribute endpoint
+    update_doc = backlink.dict(exclude={"contribute"})
     update_doc["updatedAt"] = now
 
-    res = await backlinks_collection.find_one_and_update(
+    before = await backlinks_collection.find_one_and_update(
         {"_id": ObjectId(backlink_id)},
         {"$set": update_doc},
-        return_document=True,
+        projection={"contributions": 0},
     )
-    if not res:
+    if not before:
         raise HTTPException(status_code=404, detail="Backlink not found")
 
+    # the rollups of the groups it left need recomputing too
+    if any(before.get(f) != update_doc.get(f, before.get(f)) for f in ("projectId", "categoryId", "createdByUserId")):
+        await mark_analytics_dirty(before)
+
+    res = {**before, **update_doc}
     res["_id"] = str(res["_id"])
     return res
 
 
-from playwright.async_api import async_playwright
-
-
-@app.post("/api/social/metrics")
-async def get_social_metrics(payload: dict):
+def _social_request_params(payload: dict):
     platform = (payload.get("platform") or "").lower().strip()
     url = (payload.get("url") or "").strip()
 
@@ -925,157 +1359,138 @@ async def get_social_metrics(payload: dict):
     if not (url.startswith("http://") or url.startswith("https://")):
         raise HTTPException(status_code=400, detail="Invalid URL")
 
+    if platform not in SOCIAL_PLATFORMS:
+        raise HTTPException(status_code=400, detail="Unsupported platform")
+
+    return platform, url
+
+
+@app.post("/api/social/metrics")
+async def get_social_metrics(payload: dict, force: bool = False):
+    platform, url = _social_request_params(payload)
+
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-
-            await page.goto(url, wait_until="networkidle")
-
-            if platform == "instagram":
-                metrics = await scrape_instagram(page)
-            elif platform == "facebook":
-                metrics = await scrape_facebook(page)
-            elif platform == "twitter":
-                metrics = await scrape_twitter(page)
-            elif platform == "linkedin":
-                metrics = await scrape_linkedin(page)
-            else:
-                await browser.close()
-                raise HTTPException(status_code=400, detail="Unsupported platform")
-
-            await browser.close()
-            return metrics
-    except HTTPException:
-        raise
+        return await fetch_social_metrics(platform, url, force=force)
+    except BrowserPoolFull:
+        raise HTTPException(
+            status_code=503, detail="Social metrics service is busy, try again shortly"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to fetch social metrics: {str(e)}"
         )
 
 
-async def _parse_compact_number(s: str) -> int:
-    """Helper to parse 1.2K / 3.4M / 1,234 style numbers."""
-    s = (s or "").strip()
-    if not s:
-        return 0
-    s = s.replace(",", "")
-    import re
-
-    m = re.match(r"([\d.]+)\s*([KkMm])?", s)
-    if not m:
-        try:
-            return int(s)
-        except ValueError:
-            return 0
-    num = float(m.group(1))
-    suffix = m.group(2)
-    if suffix in ("K", "k"):
-        num *= 1_000
-    elif suffix in ("M", "m"):
-        num *= 1_000_000
-    return int(num)
-
-
-async def scrape_instagram(page):
+@app.post("/api/social/jobs", status_code=202)
+async def create_social_job(payload: dict, force: bool = False):
     """
-    Example-only: Instagram HTML changes often and many pages require login,
-    so you will have to adapt selectors / logic and possibly handle login.
+    Queue a metrics scrape and return its job id right away.
+    With projectId, the counts are written to that project when the job is done.
     """
-    await page.wait_for_timeout(3000)
-
-    content = await page.content()
-
-    import re
-
-    followers = 0
-    following = 0
-    posts = 0
+    platform, url = _social_request_params(payload)
+    project_id = (payload.get("projectId") or "").strip() or None
+    if project_id and not ObjectId.is_valid(project_id):
+        raise HTTPException(status_code=400, detail="Invalid project id")
 
-    followers_match = re.search(r"([\d,.]+)\s+followers", content, re.I)
-    following_match = re.search(r"([\d,.]+)\s+following", content, re.I)
-    posts_match = re.search(r"([\d,.]+)\s+posts", content, re.I)
+    try:
+        job = await social_jobs.submit(platform, url, project_id=project_id, force=force)
+    except JobQueueFull:
+        raise HTTPException(
+            status_code=503, detail="Social metrics queue is full, try again shortly"
+        )
+    return {"jobId": job["id"], "status": job["status"]}
 
-    if followers_match:
-        followers = await _parse_compact_number(followers_match.group(1))
-    if following_match:
-        following = await _parse_compact_number(following_match.group(1))
-    if posts_match:
-        posts = await _parse_compact_number(posts_match.group(1))
 
-    return {"posts": posts, "followers": followers, "following": following}
+@app.get("/api/social/jobs/{job_id}")
+async def get_social_job(job_id: str):
+    job = await social_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
 
 
-async def scrape_facebook(page):
+@app.post("/api/admin/social/sweep", status_code=202)
+async def start_social_sweep(payload: dict):
     """
-    Heuristic scraping of a public Facebook page. Often only followers is reliable.
+    Refresh every project's social counters in the background.
+    Pass resumeId to continue an interrupted sweep, and platformLimits
+    (e.g. {"instagram": 1}) to override the per-platform caps.
     """
-    await page.wait_for_timeout(4000)
-    content = await page.content()
-    import re
+    resume_id = (payload.get("resumeId") or "").strip() or None
+    if resume_id and not ObjectId.is_valid(resume_id):
+        raise HTTPException(status_code=400, detail="Invalid sweep id")
 
-    followers = 0
-    following = 0
-    posts = 0
-
-    followers_match = re.search(r"([\d.,KkMm]+)\s+followers", content, re.I)
-    if followers_match:
-        followers = await _parse_compact_number(followers_match.group(1))
+    try:
+        sweep_id = await start_sweep(
+            concurrency=int(payload.get("concurrency") or os.getenv("SOCIAL_SWEEP_CONCURRENCY", "4")),
+            force=bool(payload.get("force", True)),
+            resume_id=resume_id,
+            platform_limits=parse_platform_limits(payload.get("platformLimits") or {}),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"sweepId": sweep_id, "status": "running"}
 
-    posts_match = re.search(r"([\d.,KkMm]+)\s+posts", content, re.I)
-    if posts_match:
-        posts = await _parse_compact_number(posts_match.group(1))
 
-    return {"posts": posts, "followers": followers, "following": following}
+@app.get("/api/admin/social/sweep/{sweep_id}")
+async def get_social_sweep(sweep_id: str):
+    if not ObjectId.is_valid(sweep_id):
+        raise HTTPException(status_code=400, detail="Invalid sweep id")
 
+    doc = await social_sweeps_collection.find_one(
+        {"_id": ObjectId(sweep_id)}, {"completedKeys": 0, "failedKeys": 0}
+    )
+    if not doc:
+        raise HTTPException(status_code=404, detail="Sweep not found")
 
-async def scrape_twitter(page):
-    """
-    Heuristic scraping for X (Twitter). Very brittle, depends on public profile HTML.
-    """
-    await page.wait_for_timeout(5000)
+    doc["_id"] = str(doc["_id"])
+    doc["runningHere"] = sweep_is_running(sweep_id)
+    return doc
 
-    followers = 0
-    following = 0
-    posts = 0
 
-    try:
-        followers_text = await page.locator(
-            'a[href$="/followers"] span span'
-        ).first.text_content()
-        following_text = await page.locator(
-            'a[href$="/following"] span span'
-        ).first.text_content()
-        posts_text = await page.locator(
-            'a[href$="/posts"] span span'
-        ).first.text_content()
-
-        followers = await _parse_compact_number(followers_text)
-        following = await _parse_compact_number(following_text)
-        posts = await _parse_compact_number(posts_text)
-    except Exception:
-        pass
+@app.get("/api/projects/{project_id}/social-history")
+async def get_social_history(
+    project_id: str,
+    platform: str,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    resolution: str = "auto",
+):
+    """Chart-ready series of a project's social counts (default: last 90 days)."""
+    platform = platform.lower().strip()
+    if platform not in SOCIAL_PLATFORMS:
+        raise HTTPException(status_code=400, detail="Unsupported platform")
+    if resolution not in ("auto", "raw", "daily", "weekly"):
+        raise HTTPException(status_code=400, detail="Invalid resolution")
 
-    return {"posts": posts, "followers": followers, "following": following}
+    # stored timestamps are naive UTC
+    if end and end.tzinfo:
+        end = end.astimezone(timezone.utc).replace(tzinfo=None)
+    if start and start.tzinfo:
+        start = start.astimezone(timezone.utc).replace(tzinfo=None)
+    end = end or datetime.utcnow()
+    start = start or end - timedelta(days=90)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be before end")
 
+    return await query_series(project_id, platform, start, end, resolution)
 
-async def scrape_linkedin(page):
-    """
-    Basic LinkedIn scraper. Many pages show 'X followers'.
-    """
-    await page.wait_for_timeout(4000)
-    content = await page.content()
-    import re
 
-    followers = 0
-    following = 0
-    posts = 0
+@app.post("/api/admin/social/history/compact")
+async def compact_social_history():
+    return await compact_history()
 
-    followers_match = re.search(r"([\d.,KkMm]+)\s+followers", content, re.I)
-    if followers_match:
-        followers = await _parse_compact_number(followers_match.group(1))
 
-    return {"posts": posts, "followers": followers, "following": following}
+@app.get("/api/social/stats")
+async def social_stats():
+    return {
+        "httpTier": http_fetcher.stats(),
+        "pool": browser_pool.stats(),
+        "latency": scrape_latency.snapshot(),
+        "blocking": blocking_totals.snapshot(),
+        "cache": social_cache.stats(),
+        "jobs": social_jobs.stats(),
+    }
 
 
 # ==== BACKLINKS CONTRIBUTIONS & DELETE ====
@@ -1093,55 +1508,131 @@ async def set_backlink_contribution(backlink_id: str, payload: dict):
     user_name = (payload.get("userName") or "").strip()
     project_id = (payload.get("projectId") or "").strip()  # NEW
 
-    doc = await backlinks_collection.find_one({"_id": ObjectId(backlink_id)})
-    if not doc:
+    # the grouping fields, in case projectId moves the backlink
+    backlink = await backlinks_collection.find_one(
+        {"_id": ObjectId(backlink_id)},
+        {"projectId": 1, "categoryId": 1, "createdByUserId": 1, "status": 1},
+    )
+    if not backlink:
         raise HTTPException(status_code=404, detail="Backlink not found")
 
-    contributions = doc.get("contributions") or []
-
-    new_entry = {
-        "subBacklinkId": sub_backlink_id,
-        "password": password,
-        "subUrl": sub_url,
-        "createdAt": datetime.utcnow(),
-        "userId": user_id,
-        "userName": user_name,
-        "projectId": project_id or doc.get("projectId", ""),  # NEW
-    }
-    contributions.append(new_entry)
-
-    total_points = len(contributions)
+    # The row goes in first and the counter follows it, so a failure in
+    # between can only leave points short of the rows, never ahead of them.
+    now = datetime.utcnow()
+    contribution = await backlink_contributions_collection.insert_one(
+        {
+            "backlinkId": backlink_id,
+            "subBacklinkId": sub_backlink_id,
+            "password": password,
+            "subUrl": sub_url,
+            "createdAt": now,
+            "userId": user_id,
+            "userName": user_name,
+            "projectId": project_id or backlink.get("projectId", ""),
+        }
+    )
 
-    update_fields = {
-        "contributions": contributions,
-        "contribute": {"points": total_points},
-        "updatedAt": datetime.utcnow(),
+    set_fields = {
+        "contribute": {"points": {"$add": [{"$ifNull": ["$contribute.points", 0]}, 1]}},
+        "updatedAt": now,
     }
     if project_id:
-        update_fields["projectId"] = project_id
+        # $literal so a value like "$x" is never read as a field path
+        set_fields["projectId"] = {"$literal": project_id}
 
-    result = await backlinks_collection.update_one(
-        {"_id": ObjectId(backlink_id)},
-        {"$set": update_fields},
-    )
-
-    if result.matched_count == 0:
+    # pipeline form because older documents store contribute: null
+    try:
+        updated = await backlinks_collection.find_one_and_update(
+            {"_id": ObjectId(backlink_id)},
+            [{"$set": set_fields}],
+            projection={"contributions": 0},
+            return_document=True,
+        )
+    except Exception:
+        await backlink_contributions_collection.delete_one({"_id": contribution.inserted_id})
+        raise
+    if not updated:
+        # deleted while we were inserting
+        await backlink_contributions_collection.delete_one({"_id": contribution.inserted_id})
         raise HTTPException(status_code=404, detail="Backlink not found")
 
-    updated = await backlinks_collection.find_one({"_id": ObjectId(backlink_id)})
+    if project_id and project_id != backlink.get("projectId"):
+        # the rollups and counters of the project it left need updating too
+        await mark_analytics_dirty(backlink)
+        await bump_stats("backlinks", backlink, -1)
+        await bump_stats("backlinks", {**backlink, "projectId": project_id}, 1)
+
     updated["id"] = str(updated["_id"])
     del updated["_id"]
     return updated
 
 
+CONTRIBUTION_VIEW = ModelView(ContributionOut)
+
+
+@app.get(
+    "/api/user/backlinks/{backlink_id}/contributions",
+    response_model=List[ContributionOut],
+)
+async def list_backlink_contributions(
+    backlink_id: str,
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+):
+    if not ObjectId.is_valid(backlink_id):
+        raise HTTPException(status_code=400, detail="Invalid backlink id")
+
+    items = await find_page(
+        backlink_contributions_collection,
+        {"backlinkId": backlink_id},
+        response,
+        limit,
+        after,
+        projection=CONTRIBUTION_VIEW.projection,
+    )
+    return CONTRIBUTION_VIEW.response(items, response)
+
+
+@app.get("/api/user/contributions", response_model=List[ContributionOut])
+async def list_contributions(
+    response: Response,
+    projectId: str | None = None,
+    userId: str | None = None,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = None,
+):
+    query: dict = {}
+    if projectId:
+        query["projectId"] = projectId
+    if userId:
+        query["userId"] = userId
+
+    items = await find_page(
+        backlink_contributions_collection, query, response, limit, after,
+        projection=CONTRIBUTION_VIEW.projection,
+    )
+    return CONTRIBUTION_VIEW.response(items, response)
+
+
 @app.delete("/api/user/backlinks/{backlink_id}")
 async def delete_backlink(backlink_id: str):
     if not ObjectId.is_valid(backlink_id):
         raise HTTPException(status_code=400, detail="Invalid backlink id")
 
-    result = await backlinks_collection.delete_one({"_id": ObjectId(backlink_id)})
-    if result.deleted_count == 0:
+    deleted = await backlinks_collection.find_one_and_delete(
+        {"_id": ObjectId(backlink_id)},
+        projection={"status": 1, "projectId": 1, "categoryId": 1, "createdByUserId": 1},
+    )
+    if not deleted:
         raise HTTPException(status_code=404, detail="Backlink not found")
+    await bump_stats("backlinks", deleted, -1)
+
+    contributors = await backlink_contributions_collection.distinct(
+        "userId", {"backlinkId": backlink_id}
+    )
+    await backlink_contributions_collection.delete_many({"backlinkId": backlink_id})
+    await mark_analytics_dirty(deleted, contributors)
 
     return {"deleted": True}
 
@@ -1151,11 +1642,87 @@ async def delete_backlink(backlink_id: str):
 
 @app.get("/api/admin/stats")
 async def admin_stats():
-    total_users = await users_collection.count_documents({})
-    total_projects = await projects_collection.count_documents({})
-    total_backlinks = await backlinks_collection.count_documents({})
+    """
+    Served from counters kept up to date by the create/delete handlers and
+    recounted every STATS_RECONCILE_MINUTES, so no collection scans here.
+    """
+    counters = await read_counters()
+    users = counters.get("users", {})
+    projects = counters.get("projects", {})
+    backlinks = counters.get("backlinks", {})
+
+    reconciled = [c.get("reconciledAt") for c in counters.values() if c.get("reconciledAt")]
+    last_reconciled = min(reconciled) if reconciled else None
     return {
-        "totalUsers": total_users,
-        "totalProjects": total_projects,
-        "totalBacklinks": total_backlinks,
-    }
\ No newline at end of file
+        "totalUsers": users.get("total", 0),
+        "totalProjects": projects.get("total", 0),
+        "totalBacklinks": backlinks.get("total", 0),
+        "usersByStatus": users.get("byStatus", {}),
+        "projectsByStatus": projects.get("byStatus", {}),
+        "backlinksByStatus": backlinks.get("byStatus", {}),
+        "backlinksByProject": backlinks.get("byProject", {}),
+        "backlinksByCategory": backlinks.get("byCategory", {}),
+        "reconciledAt": last_reconciled,
+        "secondsSinceReconcile": (
+            int((datetime.utcnow() - last_reconciled).total_seconds())
+            if last_reconciled
+            else None
+        ),
+    }
+
+
+@app.post("/api/admin/stats/reconcile")
+async def admin_stats_reconcile():
+    return await reconcile_stats()
+
+
+# ==== BACKLINK ANALYTICS ====
+
+
+@app.get("/api/admin/analytics/backlinks")
+async def admin_backlink_analytics(dim: str = "project", key: str | None = None):
+    """
+    Precomputed rollups per project, category, creator, category and month,
+    or contributor; refreshed every ANALYTICS_REFRESH_MINUTES.
+    """
+    if dim not in ANALYTICS_DIMENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown dim; use one of {', '.join(ANALYTICS_DIMENSIONS)}",
+        )
+    return json_response(await read_rollups(dim, key))
+
+
+@app.post("/api/admin/analytics/backlinks/refresh")
+async def admin_backlink_analytics_refresh(full: bool = False):
+    return await refresh_analytics(full=full)
+
+
+@app.post("/api/admin/backlinks/score", status_code=202)
+async def admin_score_backlinks(projectId: str | None = None, dryRun: bool = False):
+    """
+    Recompute quality scores for one project, or every backlink without
+    projectId, in the background. Poll the returned runId for the result.
+    """
+    run_id = await start_scoring(projectId, dry_run=dryRun)
+    return {"runId": run_id, "status": "running"}
+
+
+@app.get("/api/admin/backlinks/score/{run_id}")
+async def get_score_run(run_id: str):
+    if not ObjectId.is_valid(run_id):
+        raise HTTPException(status_code=400, detail="Invalid run id")
+
+    doc = await scoring_runs_collection.find_one({"_id": ObjectId(run_id)})
+    if not doc:
+        raise HTTPException(status_code=404, detail="Scoring run not found")
+
+    doc["_id"] = str(doc["_id"])
+    doc["runningHere"] = scoring_is_running(run_id)
+    return doc
+
+
+@app.get("/api/admin/mail/stats")
+async def admin_mail_stats():
+    """Queue depth, retries and send latency of the OTP mail worker."""
+    return mail_dispatcher.stats()
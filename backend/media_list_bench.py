@@ -0,0 +1,102 @@
+"""
+Media page load: three per-kind list queries (the old ProjectMediaPage
+path) vs. one grouped $facet query. Reports latency and the number of
+Mongo commands per page load.
+
+Needs a disposable mongod; the data goes into a scratch database that is
+dropped afterwards:
+
+    MONGODB_URI=mongodb://localhost:27017/x python -m backend.media_list_bench [--per-kind 40]
+"""
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime
+
+from fastapi import Response
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, monitoring
+
+from .pagination import facet_pages, find_page
+
+KINDS = ("image", "video", "file")
+PROJECTION = {"projectId": 1, "kind": 1, "name": 1, "url": 1, "blobId": 1, "thumbnails": 1}
+
+
+class CommandCounter(monitoring.CommandListener):
+    def __init__(self):
+        self.count = 0
+
+    def started(self, event):
+        if event.command_name in ("find", "aggregate", "getMore"):
+            self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+async def _old(collection, project_id):
+    await asyncio.gather(
+        *(
+            find_page(collection, {"projectId": project_id, "kind": kind}, Response(), projection=PROJECTION)
+            for kind in KINDS
+        )
+    )
+
+
+async def _new(collection, project_id):
+    await facet_pages(collection, {"projectId": project_id}, "kind", KINDS, projection=PROJECTION)
+
+
+async def main(args) -> None:
+    counter = CommandCounter()
+    client = AsyncIOMotorClient(os.environ["MONGODB_URI"], event_listeners=[counter])
+    db = client["media_list_bench"]
+    collection = db["project_media"]
+    try:
+        await collection.create_index(
+            [("projectId", ASCENDING), ("kind", ASCENDING), ("_id", ASCENDING)]
+        )
+        now = datetime.utcnow()
+        await collection.insert_many(
+            [
+                {
+                    "projectId": f"p{p}",
+                    "kind": kind,
+                    "name": f"{kind} {i}",
+                    "blobId": "0" * 64,
+                    "thumbnails": {"md": {"blobId": "1" * 64, "width": 480, "height": 320}},
+                    "createdAt": now,
+                }
+                for p in range(args.projects)
+                for kind in KINDS
+                for i in range(args.per_kind)
+            ]
+        )
+
+        for name, load in (("3 x find", _old), ("1 x $facet", _new)):
+            await load(collection, "p0")  # warm up
+            counter.count = 0
+            started = time.perf_counter()
+            for i in range(args.repeat):
+                await load(collection, f"p{i % args.projects}")
+            elapsed = (time.perf_counter() - started) / args.repeat * 1000
+            print(
+                f"{name:11} page load={elapsed:6.2f}ms "
+                f"mongo commands/load={counter.count / args.repeat:.1f}"
+            )
+    finally:
+        await client.drop_database("media_list_bench")
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark grouped media listing")
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--per-kind", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=200)
+    asyncio.run(main(parser.parse_args()))
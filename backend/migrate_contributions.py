@@ -0,0 +1,76 @@
+"""
+Move embedded backlink.contributions arrays into backlink_contributions.
+
+    python -m backend.migrate_contributions [--dry-run]
+
+Entries are upserted by (backlinkId, legacyIndex), so the script can be
+re-run after an interruption without duplicating anything. A backlink's
+array is only unset after all its entries are stored, and contribute.points
+is reset to the stored count.
+"""
+import argparse
+import asyncio
+
+from pymongo import UpdateOne
+
+from .indexes import ensure_indexes
+from .models import backlink_contributions_collection, backlinks_collection
+
+
+async def migrate(dry_run: bool = False) -> dict:
+    migrated_backlinks = 0
+    migrated_entries = 0
+
+    cursor = backlinks_collection.find(
+        {"contributions": {"$exists": True}}, {"contributions": 1, "projectId": 1}
+    )
+    async for doc in cursor:
+        backlink_id = str(doc["_id"])
+        entries = doc.get("contributions") or []
+
+        ops = [
+            UpdateOne(
+                {"backlinkId": backlink_id, "legacyIndex": idx},
+                {
+                    "$setOnInsert": {
+                        **entry,
+                        "backlinkId": backlink_id,
+                        "legacyIndex": idx,
+                        "projectId": entry.get("projectId") or doc.get("projectId", ""),
+                    }
+                },
+                upsert=True,
+            )
+            for idx, entry in enumerate(entries)
+        ]
+        migrated_backlinks += 1
+        migrated_entries += len(ops)
+        if dry_run:
+            continue
+
+        if ops:
+            await backlink_contributions_collection.bulk_write(ops, ordered=False)
+        total = await backlink_contributions_collection.count_documents(
+            {"backlinkId": backlink_id}
+        )
+        await backlinks_collection.update_one(
+            {"_id": doc["_id"]},
+            {"$unset": {"contributions": ""}, "$set": {"contribute": {"points": total}}},
+        )
+
+    return {
+        "backlinks": migrated_backlinks,
+        "entries": migrated_entries,
+        "dryRun": dry_run,
+    }
+
+
+async def _cli(args) -> None:
+    await ensure_indexes()
+    print(await migrate(dry_run=args.dry_run))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move embedded contributions to their own collection")
+    parser.add_argument("--dry-run", action="store_true")
+    asyncio.run(_cli(parser.parse_args()))
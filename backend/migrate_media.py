@@ -0,0 +1,67 @@
+"""
+Move inline base64 project_media.dataUrl values into the GridFS blob store.
+
+    python -m backend.migrate_media [--dry-run] [--recount-refs]
+
+Each document gets blobId / contentType / size and loses dataUrl. Blobs
+are content-addressed, so re-running after an interruption stores nothing
+twice. Documents whose dataUrl isn't a base64 data: URL are reported and
+left alone.
+
+--recount-refs also rebuilds the blob reference counts from project_media,
+to repair counts that drifted; run it without concurrent media uploads or
+deletes.
+"""
+import argparse
+import asyncio
+
+from .blob_store import decode_data_url, put_blob, recount_refs
+from .indexes import ensure_indexes
+from .models import project_media_collection
+
+
+async def migrate(dry_run: bool = False) -> dict:
+    migrated = 0
+    bytes_moved = 0
+    skipped = []
+
+    cursor = project_media_collection.find(
+        {"dataUrl": {"$type": "string", "$ne": ""}}, {"dataUrl": 1}
+    )
+    async for doc in cursor:
+        try:
+            data, content_type = decode_data_url(doc["dataUrl"])
+        except ValueError as e:
+            skipped.append(f"{doc['_id']}: {e}")
+            continue
+        migrated += 1
+        bytes_moved += len(data)
+        if dry_run:
+            continue
+
+        meta = await put_blob(data, content_type)
+        await project_media_collection.update_one(
+            {"_id": doc["_id"]},
+            {"$set": meta, "$unset": {"dataUrl": ""}},
+        )
+
+    return {
+        "media": migrated,
+        "bytes": bytes_moved,
+        "skipped": skipped,
+        "dryRun": dry_run,
+    }
+
+
+async def _cli(args) -> None:
+    await ensure_indexes()
+    print(await migrate(dry_run=args.dry_run))
+    if args.recount_refs and not args.dry_run:
+        print(await recount_refs())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move inline media data URLs to the blob store")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--recount-refs", action="store_true", help="rebuild blob reference counts")
+    asyncio.run(_cli(parser.parse_args()))
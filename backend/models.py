@@ -6,4 +6,19 @@ categories_collection = db["categories"]
 backlinks_collection = db["backlinks"]
 project_media_collection = db["project_media"]
 tools_collection = db["tools"]   # NEW
-placements_collection = db["placements"]
\ No newline at end of file
+placements_collection = db["placements"]
+backlink_contributions_collection = db["backlink_contributions"]
+social_metrics_cache_collection = db["social_metrics_cache"]
+social_sweeps_collection = db["social_sweeps"]
+social_jobs_collection = db["social_jobs"]
+social_metrics_history_collection = db["social_metrics_history"]
+stats_counters_collection = db["stats_counters"]
+cache_versions_collection = db["cache_versions"]
+cache_invalidations_collection = db["cache_invalidations"]
+media_files_collection = db["media.files"]
+media_chunks_collection = db["media.chunks"]
+media_blobs_collection = db["media_blobs"]
+backlink_rollups_collection = db["backlink_rollups"]
+analytics_state_collection = db["analytics_state"]
+analytics_dirty_collection = db["analytics_dirty"]
+scoring_runs_collection = db["scoring_runs"]
\ No newline at end of file
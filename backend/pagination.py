@@ -0,0 +1,122 @@
+from typing import Callable, Dict, List, Optional, Sequence
+
+from bson import ObjectId
+from fastapi import HTTPException, Response
+from fastapi.responses import StreamingResponse
+from pymongo import ASCENDING
+
+from .serialization import dumps
+
+# Max page size for ?limit=
+MAX_PAGE_SIZE = 1000
+
+# Page size when ?limit= is omitted; clients follow X-Next-Cursor for more
+DEFAULT_PAGE_SIZE = 100
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _id_to_str(doc: dict) -> dict:
+    if "_id" in doc:
+        doc["_id"] = str(doc["_id"])
+    return doc
+
+
+def keyset_query(query: dict, after: Optional[str]) -> dict:
+    """Add the `_id > after` condition used for keyset pagination."""
+    if not after:
+        return query
+    if not ObjectId.is_valid(after):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return {"$and": [query, {"_id": {"$gt": ObjectId(after)}}]} if query else {
+        "_id": {"$gt": ObjectId(after)}
+    }
+
+
+async def find_page(
+    collection,
+    query: dict,
+    response: Response,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+    projection: Optional[dict] = None,
+) -> List[dict]:
+    """
+    One page ordered by _id, DEFAULT_PAGE_SIZE documents unless `limit` says
+    otherwise. The cursor for the next page is sent in the X-Next-Cursor
+    header (absent on the last page); use ndjson_response for everything.
+    """
+    page_size = min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+    docs = (
+        await collection.find(keyset_query(query, after), projection)
+        .sort("_id", ASCENDING)
+        .limit(page_size + 1)
+        .to_list(length=page_size + 1)
+    )
+    if len(docs) > page_size:
+        docs = docs[:page_size]
+        response.headers[NEXT_CURSOR_HEADER] = str(docs[-1]["_id"])
+    return docs
+
+
+async def facet_pages(
+    collection,
+    query: dict,
+    field: str,
+    values: Sequence[str],
+    limit: Optional[int] = None,
+    projection: Optional[dict] = None,
+) -> Dict[str, dict]:
+    """
+    The first page for each `field` value in one $facet aggregation:
+    {value: {"items": [...], "count": total, "nextCursor": id or None}}.
+    Later pages come from find_page with {field: value} and the cursor.
+    `projection` must keep `field`.
+    """
+    page_size = min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+    pipeline: List[dict] = [{"$match": {**query, field: {"$in": list(values)}}}]
+    if projection:
+        pipeline.append({"$project": projection})
+    # facet names can't contain "." or start with "$", so use positions
+    facets = {
+        f"g{i}": [{"$match": {field: value}}, {"$sort": {"_id": 1}}, {"$limit": page_size + 1}]
+        for i, value in enumerate(values)
+    }
+    facets["counts"] = [{"$group": {"_id": f"${field}", "n": {"$sum": 1}}}]
+    pipeline.append({"$facet": facets})
+
+    rows = await collection.aggregate(pipeline).to_list(length=1)
+    row = rows[0] if rows else {}
+    counts = {c["_id"]: c["n"] for c in row.get("counts", [])}
+
+    groups = {}
+    for i, value in enumerate(values):
+        docs = row.get(f"g{i}", [])
+        next_cursor = None
+        if len(docs) > page_size:
+            docs = docs[:page_size]
+            next_cursor = str(docs[-1]["_id"])
+        groups[value] = {"items": docs, "count": counts.get(value, 0), "nextCursor": next_cursor}
+    return groups
+
+
+def ndjson_response(
+    collection,
+    query: dict,
+    after: Optional[str] = None,
+    transform: Callable[[dict], dict] = _id_to_str,
+    projection: Optional[dict] = None,
+    batch_size: int = 200,
+) -> StreamingResponse:
+    """Stream matching documents as NDJSON while the Motor cursor yields them."""
+    cursor = (
+        collection.find(keyset_query(query, after), projection)
+        .sort("_id", ASCENDING)
+        .batch_size(batch_size)
+    )
+
+    async def lines():
+        async for doc in cursor:
+            yield dumps(transform(doc)) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
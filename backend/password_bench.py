@@ -0,0 +1,77 @@
+"""
+Login load benchmark: bcrypt inline on the event loop vs. in the pool.
+
+Runs `--logins` concurrent verifications while a probe coroutine (standing
+in for an unrelated endpoint) wakes every `--probe-ms` and records how late
+it was scheduled. No server or database needed:
+
+    python -m backend.password_bench [--logins 64] [--rounds 12]
+"""
+import argparse
+import asyncio
+import time
+
+from passlib.hash import bcrypt
+
+from . import passwords
+
+
+def _pct(values, p: float) -> float:
+    values = sorted(values)
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+async def _probe(delays: list, interval: float, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        delays.append((time.perf_counter() - started - interval) * 1000)
+
+
+async def _run(mode: str, password: str, stored: str, logins: int, interval: float) -> dict:
+    async def inline_login():
+        passwords.hasher.verify(password, stored)
+
+    async def pooled_login():
+        await passwords.verify_password(password, stored)
+
+    login = inline_login if mode == "inline" else pooled_login
+
+    delays = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(delays, interval, stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+
+    return {
+        "mode": mode,
+        "loginsPerSec": round(logins / elapsed, 1),
+        "probeP50Ms": round(_pct(delays, 50), 1),
+        "probeP99Ms": round(_pct(delays, 99), 1),
+        "probeMaxMs": round(max(delays, default=0.0), 1),
+    }
+
+
+async def main(args) -> None:
+    passwords.hasher = bcrypt.using(rounds=args.rounds)
+    stored = passwords.hasher.hash("correct horse")
+    print(f"rounds={args.rounds} workers={passwords.HASH_WORKERS} logins={args.logins}")
+    for mode in ("inline", "pool"):
+        row = await _run(mode, "correct horse", stored, args.logins, args.probe_ms / 1000)
+        print(
+            f"{row['mode']:6} logins/s={row['loginsPerSec']:7} "
+            f"probe p50={row['probeP50Ms']}ms p99={row['probeP99Ms']}ms max={row['probeMaxMs']}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark bcrypt under concurrent logins")
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=passwords.BCRYPT_ROUNDS)
+    parser.add_argument("--probe-ms", type=float, default=10)
+    asyncio.run(main(parser.parse_args()))
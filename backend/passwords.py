@@ -0,0 +1,52 @@
+"""
+bcrypt hashing off the event loop.
+
+Each hash/verify is tens to hundreds of ms of CPU. They run in a bounded
+thread pool (the bcrypt backend releases the GIL), so concurrent logins
+don't stall other requests. BCRYPT_ROUNDS sets the cost; stored hashes
+with a different cost are rehashed on the next successful login.
+"""
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from passlib.hash import bcrypt
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# rounds= pins min/default/max, so needs_update() flags any other cost
+hasher = bcrypt.using(rounds=BCRYPT_ROUNDS)
+
+_executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="bcrypt")
+
+
+def _verify_and_update(password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+    try:
+        if not hasher.verify(password, password_hash):
+            return False, None
+    except ValueError:
+        # malformed hash in the db
+        return False, None
+    if hasher.needs_update(password_hash):
+        return True, hasher.hash(password)
+    return True, None
+
+
+async def hash_password(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, hasher.hash, password)
+
+
+async def verify_password(password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+    """
+    Returns (ok, new_hash). new_hash is set when the password is correct but
+    the stored hash uses a different cost and should be replaced.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, _verify_and_update, password, password_hash)
+
+
+def shutdown() -> None:
+    _executor.shutdown(wait=False, cancel_futures=True)
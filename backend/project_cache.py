@@ -0,0 +1,185 @@
+"""
+Read-through cache for GET /api/projects/{id}.
+
+Each worker keeps an in-process TTL + LRU map of project id -> (encoded
+JSON, ETag). Writers call `await project_cache.invalidate(id)`: the local
+entry is dropped at once, and the id is published to cache_invalidations
+under a sequence number taken from cache_versions. Every worker polls for
+sequence numbers above the last one it saw (CACHE_SYNC_SECONDS) and evicts
+those ids, so other workers serve a stale copy for at most one poll.
+
+A sequence number is taken before the row that publishes it is inserted, so
+rows can land out of order. A poller that skips past a number remembers it
+and keeps asking for it until it shows up or ttl_seconds have passed (by then
+any entry it would have evicted has expired anyway).
+"""
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, NamedTuple, Optional
+
+from bson import ObjectId
+
+from .models import (
+    cache_invalidations_collection,
+    cache_versions_collection,
+    projects_collection,
+)
+from .serialization import dumps
+
+
+class CachedDocument(NamedTuple):
+    body: bytes
+    etag: str
+
+
+class DocumentCache:
+    def __init__(
+        self,
+        channel: str,
+        load: Callable[[str], Awaitable[Optional[dict]]],
+        ttl_seconds: float = 60,
+        max_entries: int = 1000,
+    ):
+        self.channel = channel
+        self.load = load
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # bumped on every invalidation so a load that raced a write isn't stored
+        self._generations: Dict[str, int] = {}
+        # keys with a load in flight; their generations must survive pruning
+        self._loading: Dict[str, int] = {}
+        self._last_seq: Optional[int] = None
+        # skipped seq -> monotonic deadline for it to show up
+        self._missing_seqs: Dict[int, float] = {}
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0, "remoteInvalidations": 0}
+
+    def _evict(self, key: str) -> None:
+        self._entries.pop(key, None)
+        self._generations[key] = self._generations.get(key, 0) + 1
+        if len(self._generations) > self.max_entries * 4:
+            self._generations = {k: v for k, v in self._generations.items() if k in self._loading}
+
+    async def get(self, key: str) -> Optional[CachedDocument]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] >= time.monotonic():
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[1]
+
+        self._stats["misses"] += 1
+        generation = self._generations.get(key, 0)
+        self._loading[key] = self._loading.get(key, 0) + 1
+        try:
+            doc = await self.load(key)
+        finally:
+            if self._loading[key] == 1:
+                del self._loading[key]
+            else:
+                self._loading[key] -= 1
+        if doc is None:
+            return None
+        body = dumps(doc)
+        cached = CachedDocument(body, '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"')
+        if self._generations.get(key, 0) == generation:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, cached)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return cached
+
+    async def invalidate(self, *keys: str) -> None:
+        """Drop `keys` here and tell the other workers to drop them too."""
+        keys = [k for k in dict.fromkeys(keys) if k]
+        if not keys:
+            return
+        for key in keys:
+            self._evict(key)
+        self._stats["invalidations"] += len(keys)
+        try:
+            counter = await cache_versions_collection.find_one_and_update(
+                {"_id": self.channel},
+                {"$inc": {"seq": 1}},
+                upsert=True,
+                return_document=True,
+            )
+            await cache_invalidations_collection.insert_one(
+                {
+                    "channel": self.channel,
+                    "seq": counter["seq"],
+                    "keys": keys,
+                    "createdAt": datetime.utcnow(),
+                }
+            )
+        except Exception as e:
+            # other workers still expire the entry after ttl_seconds
+            print("Failed to publish cache invalidation:", e)
+
+    async def sync(self) -> None:
+        """Apply invalidations published by other workers since the last call."""
+        if self._last_seq is None:
+            counter = await cache_versions_collection.find_one({"_id": self.channel})
+            self._last_seq = counter["seq"] if counter else 0
+            return
+        now = time.monotonic()
+        self._missing_seqs = {
+            seq: deadline for seq, deadline in self._missing_seqs.items() if deadline >= now
+        }
+        query = {"channel": self.channel, "seq": {"$gt": self._last_seq}}
+        if self._missing_seqs:
+            query = {
+                "channel": self.channel,
+                "$or": [
+                    {"seq": {"$gt": self._last_seq}},
+                    {"seq": {"$in": list(self._missing_seqs)}},
+                ],
+            }
+        cursor = cache_invalidations_collection.find(query).sort("seq", 1)
+        async for row in cursor:
+            seq = row["seq"]
+            if seq > self._last_seq:
+                for skipped in range(self._last_seq + 1, seq):
+                    self._missing_seqs[skipped] = now + self.ttl_seconds
+                self._last_seq = seq
+            else:
+                self._missing_seqs.pop(seq, None)
+            for key in row["keys"]:
+                if key in self._entries:
+                    self._stats["remoteInvalidations"] += 1
+                self._evict(key)
+
+    async def run_sync_loop(self, interval_seconds: float) -> None:
+        while True:
+            try:
+                await self.sync()
+            except Exception as e:
+                print("Cache invalidation sync failed:", e)
+            await asyncio.sleep(interval_seconds)
+
+    def stats(self) -> dict:
+        return {
+            **self._stats,
+            "entries": len(self._entries),
+            "ttlSeconds": self.ttl_seconds,
+            "maxEntries": self.max_entries,
+            "lastSeq": self._last_seq,
+            "missingSeqs": len(self._missing_seqs),
+        }
+
+
+async def _load_project(project_id: str) -> Optional[dict]:
+    if not ObjectId.is_valid(project_id):
+        return None
+    return await projects_collection.find_one({"_id": ObjectId(project_id)})
+
+
+project_cache = DocumentCache(
+    "projects",
+    _load_project,
+    ttl_seconds=float(os.getenv("PROJECT_CACHE_TTL_SECONDS", "60")),
+    max_entries=int(os.getenv("PROJECT_CACHE_MAX_ENTRIES", "1000")),
+)
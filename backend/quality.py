@@ -0,0 +1,138 @@
+"""
+Backlink quality scoring over columnar NumPy arrays. Kept free of app
+imports so the benchmark can run it on synthetic data.
+
+    score               0-100, weighted DA, inverted spam score and contribution points
+    percentile          share of the scored backlinks with a lower score
+    categoryPercentile  the same within the backlink's category
+    outlier             modified z-score (median/MAD) beyond OUTLIER_Z within its category
+"""
+import os
+from typing import Dict, Iterable, List, NamedTuple
+
+import numpy as np
+
+# only the ratios matter; the weights are normalized
+WEIGHT_DA = float(os.getenv("SCORE_WEIGHT_DA", "0.6"))
+WEIGHT_SS = float(os.getenv("SCORE_WEIGHT_SS", "0.3"))
+WEIGHT_POINTS = float(os.getenv("SCORE_WEIGHT_POINTS", "0.1"))
+OUTLIER_Z = float(os.getenv("SCORE_OUTLIER_Z", "3.5"))
+LOAD_BATCH = int(os.getenv("SCORE_LOAD_BATCH", "10000"))
+WRITE_BATCH = int(os.getenv("SCORE_WRITE_BATCH", "1000"))
+
+# scores are 0-100, so category * GROUP_STRIDE + score sorts by category, then score
+GROUP_STRIDE = 101.0
+
+
+class Columns(NamedTuple):
+    ids: np.ndarray        # V12: raw ObjectId bytes
+    da: np.ndarray         # float32
+    ss: np.ndarray         # float32
+    points: np.ndarray     # float32
+    category: np.ndarray   # int32 codes, see ColumnBuilder.categories
+
+
+class Scores(NamedTuple):
+    score: np.ndarray
+    percentile: np.ndarray
+    category_percentile: np.ndarray
+    outlier: np.ndarray
+
+
+class ColumnBuilder:
+    """Turns batches of backlink documents into Columns, one array per field."""
+
+    def __init__(self):
+        self.categories: Dict[str, int] = {}
+        self._chunks: List[tuple] = []
+
+    def add(self, docs: List[dict]) -> None:
+        if not docs:
+            return
+        n = len(docs)
+        codes = self.categories
+        self._chunks.append((
+            # not S12: that dtype strips trailing NUL bytes
+            np.frombuffer(b"".join(doc["_id"].binary for doc in docs), dtype="V12"),
+            np.fromiter((doc.get("da") or 0 for doc in docs), np.float32, n),
+            np.fromiter((doc.get("ss") or 0 for doc in docs), np.float32, n),
+            np.fromiter(((doc.get("contribute") or {}).get("points") or 0 for doc in docs), np.float32, n),
+            np.fromiter(
+                (codes.setdefault(doc.get("categoryId") or "", len(codes)) for doc in docs), np.int32, n
+            ),
+        ))
+
+    def build(self) -> Columns:
+        if not self._chunks:
+            return Columns(
+                np.empty(0, "V12"), *(np.empty(0, np.float32) for _ in range(3)), np.empty(0, np.int32)
+            )
+        columns = Columns(*(np.concatenate(parts) for parts in zip(*self._chunks)))
+        self._chunks = []
+        return columns
+
+
+def _group_medians(values: np.ndarray, groups: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Median of `values` (0-100) per group code, without a Python loop over groups."""
+    ordered = np.sort(groups * GROUP_STRIDE + values) - np.repeat(
+        np.arange(len(counts)) * GROUP_STRIDE, counts
+    )
+    starts = np.cumsum(counts) - counts
+    present = counts > 0
+    lo = starts + np.maximum(counts - 1, 0) // 2
+    hi = starts + counts // 2
+    medians = np.zeros(len(counts))
+    medians[present] = (ordered[lo[present]] + ordered[hi[present]]) / 2
+    return medians
+
+
+def score(columns: Columns) -> Scores:
+    n = len(columns.ids)
+    if n == 0:
+        empty = np.empty(0, np.float32)
+        return Scores(empty, empty, empty, np.empty(0, bool))
+
+    points = np.log1p(np.maximum(columns.points, 0))
+    top = points.max()
+    if top > 0:
+        points /= top
+    total = WEIGHT_DA + WEIGHT_SS + WEIGHT_POINTS
+    raw = (
+        WEIGHT_DA * np.clip(columns.da, 0, 100) / 100
+        + WEIGHT_SS * (1 - np.clip(columns.ss, 0, 100) / 100)
+        + WEIGHT_POINTS * points
+    )
+    scores = (100 / total * raw).astype(np.float32)
+
+    # ties get the same percentile: rows strictly below / n
+    percentile = np.searchsorted(np.sort(scores), scores, "left") * (100 / n)
+
+    groups = columns.category
+    counts = np.bincount(groups)
+    starts = np.cumsum(counts) - counts
+    keys = groups * GROUP_STRIDE + scores
+    below = np.searchsorted(np.sort(keys), keys, "left") - starts[groups]
+    category_percentile = below * 100 / counts[groups]
+
+    medians = _group_medians(scores, groups, counts)
+    deviation = np.abs(scores - medians[groups])
+    mad = _group_medians(deviation, groups, counts)[groups]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.where(mad > 0, 0.6745 * deviation / mad, 0)
+    return Scores(
+        scores,
+        percentile.astype(np.float32),
+        category_percentile.astype(np.float32),
+        z > OUTLIER_Z,
+    )
+
+
+def records(columns: Columns, scores: Scores, start: int, stop: int) -> Iterable[tuple]:
+    """(ObjectId bytes, score, percentile, categoryPercentile, outlier) rounded for storage."""
+    return zip(
+        columns.ids[start:stop].tolist(),
+        np.round(scores.score[start:stop].astype(np.float64), 2).tolist(),
+        np.round(scores.percentile[start:stop].astype(np.float64), 1).tolist(),
+        np.round(scores.category_percentile[start:stop].astype(np.float64), 1).tolist(),
+        scores.outlier[start:stop].tolist(),
+    )
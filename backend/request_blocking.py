@@ -0,0 +1,126 @@
+import os
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+
+def _env_list(name: str, default: str) -> Tuple[str, ...]:
+    raw = os.getenv(name, default)
+    return tuple(item.strip().lower() for item in raw.split(",") if item.strip())
+
+
+# Resource types we never need to read counts from the page
+BLOCKED_RESOURCE_TYPES = set(
+    _env_list("SOCIAL_BLOCK_RESOURCE_TYPES", "image,media,font,stylesheet")
+)
+
+# Analytics / ad / tracking hosts (suffix match on the request host)
+BLOCKED_HOSTS = _env_list(
+    "SOCIAL_BLOCK_HOSTS",
+    "google-analytics.com,googletagmanager.com,doubleclick.net,googlesyndication.com,"
+    "connect.facebook.net,analytics.twitter.com,ads-twitter.com,ads-api.twitter.com,"
+    "px.ads.linkedin.com,snap.licdn.com,scorecardresearch.com,hotjar.com,"
+    "segment.io,segment.com,branch.io,sentry.io,newrelic.com,nr-data.net",
+)
+
+# URL fragments a platform needs even when a rule above would block them
+PLATFORM_ALLOWLIST: Dict[str, Tuple[str, ...]] = {
+    "instagram": _env_list("SOCIAL_ALLOW_INSTAGRAM", ""),
+    "facebook": _env_list("SOCIAL_ALLOW_FACEBOOK", ""),
+    "twitter": _env_list("SOCIAL_ALLOW_TWITTER", "abs.twimg.com/responsive-web"),
+    "linkedin": _env_list("SOCIAL_ALLOW_LINKEDIN", ""),
+}
+
+# Rough average transfer size per blocked request, used for the savings estimate
+ESTIMATED_BYTES = {
+    "image": 60_000,
+    "media": 500_000,
+    "font": 40_000,
+    "stylesheet": 30_000,
+    "script": 50_000,
+}
+DEFAULT_ESTIMATED_BYTES = 10_000
+
+BLOCKING_ENABLED = os.getenv("SOCIAL_BLOCK_RESOURCES", "1").lower() in ("1", "true", "yes")
+
+
+def _host_blocked(host: str) -> bool:
+    return any(host == h or host.endswith("." + h) for h in BLOCKED_HOSTS)
+
+
+class RequestBlocker:
+    """
+    Route handler that aborts requests the scrapers don't need.
+    One instance per page load; `summary()` reports what it saved.
+    """
+
+    def __init__(self, platform: str):
+        self.allow = PLATFORM_ALLOWLIST.get(platform, ())
+        self.allowed = 0
+        self.blocked: Dict[str, int] = {}
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        lowered = url.lower()
+        if any(fragment in lowered for fragment in self.allow):
+            return False
+        if resource_type in BLOCKED_RESOURCE_TYPES:
+            return True
+        return _host_blocked((urlsplit(lowered).hostname or ""))
+
+    async def handle(self, route) -> None:
+        request = route.request
+        resource_type = request.resource_type
+        if self.should_block(request.url, resource_type):
+            self.blocked[resource_type] = self.blocked.get(resource_type, 0) + 1
+            await route.abort()
+        else:
+            self.allowed += 1
+            await route.continue_()
+
+    def summary(self) -> dict:
+        estimated = sum(
+            count * ESTIMATED_BYTES.get(kind, DEFAULT_ESTIMATED_BYTES)
+            for kind, count in self.blocked.items()
+        )
+        return {
+            "allowedRequests": self.allowed,
+            "blockedRequests": sum(self.blocked.values()),
+            "blockedByType": dict(self.blocked),
+            "estimatedBytesSaved": estimated,
+        }
+
+
+class BlockingTotals:
+    """Running totals across all page loads, for /api/social/stats."""
+
+    def __init__(self):
+        self.pages = 0
+        self.allowed = 0
+        self.blocked = 0
+        self.estimated_bytes = 0
+
+    def add(self, summary: dict) -> None:
+        self.pages += 1
+        self.allowed += summary["allowedRequests"]
+        self.blocked += summary["blockedRequests"]
+        self.estimated_bytes += summary["estimatedBytesSaved"]
+
+    def snapshot(self) -> dict:
+        return {
+            "enabled": BLOCKING_ENABLED,
+            "pages": self.pages,
+            "allowedRequests": self.allowed,
+            "blockedRequests": self.blocked,
+            "estimatedBytesSaved": self.estimated_bytes,
+        }
+
+
+blocking_totals = BlockingTotals()
+
+
+async def install_request_blocking(page, platform: str):
+    """Attach a RequestBlocker to `page`; returns None when blocking is disabled."""
+    if not BLOCKING_ENABLED:
+        return None
+    blocker = RequestBlocker(platform)
+    await page.route("**/*", blocker.handle)
+    return blocker
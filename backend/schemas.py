@@ -1,4 +1,4 @@
-from typing import Optional, Any, List, Dict
+from typing import Optional, Any, Dict
 from datetime import datetime
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 from bson import ObjectId
@@ -61,6 +61,13 @@ class ProjectOut(ProjectBase):
     id: Any = Field(alias="_id")
     createdAt: datetime
     updatedAt: datetime
+
+
+# named ?view= fieldsets for list_projects (None = every field)
+PROJECT_VIEWS = {
+    "summary": ("name", "url"),  # dropdowns and project tables
+    "full": None,
+}
 # ==== PROJECT MEDIA ====
 
 class ProjectMediaBase(BaseMongoModel):
@@ -68,14 +75,18 @@ class ProjectMediaBase(BaseMongoModel):
     kind: str               # "image", "video", "file"
     name: str               # display name (Image Name 1, etc.)
     url: str | None = None  # optional; for videos/files or external images
-    dataUrl: str | None = None  # for inline image data (base64), optional
     createdAt: datetime | None = None
 
 class ProjectMediaCreate(ProjectMediaBase):
-    pass
+    dataUrl: str | None = None  # base64 upload; stored as a blob, never saved inline
 
 class ProjectMediaOut(ProjectMediaBase):
     id: Any = Field(alias="_id")
+    blobId: str | None = None       # sha256; bytes at /api/media/blobs/{blobId}
+    contentType: str | None = None
+    size: int | None = None
+    # {"sm": {"blobId", "width", "height", "contentType"}, ...} for images
+    thumbnails: Optional[Dict[str, Any]] = None
 
 # ==== CATEGORY ====
 
@@ -122,6 +133,13 @@ class ContributionEntry(BaseMongoModel):
     instagramFollowers: Optional[int] = None
     instagramFollowing: Optional[int] = None
     infoExtraFields: Optional[list] = None  # if you keep using it later
+
+
+class ContributionOut(ContributionEntry):
+    id: Any = Field(alias="_id")
+    backlinkId: str
+
+
 class BacklinkBase(BaseMongoModel):
     projectId: str              # string id of project
     createdByUserId: str        # string id of user
@@ -131,9 +149,8 @@ class BacklinkBase(BaseMongoModel):
     ss: int
     url: str
     # total points summary, e.g. {"points": 190}
+    # sub backlinks live in backlink_contributions, see ContributionOut
     contribute: Optional[Dict[str, int]] = None
-    # list of sub backlinks
-    contributions: Optional[List[ContributionEntry]] = None
     status: str = "approved"
 
 
@@ -144,4 +161,13 @@ class BacklinkCreate(BacklinkBase):
 class BacklinkOut(BacklinkBase):
     id: Any = Field(alias="_id")
     createdAt: datetime
-    updatedAt: datetime
\ No newline at end of file
+    updatedAt: datetime
+    # written by backend/scoring.py: {score, percentile, categoryPercentile, outlier, scoredAt}
+    quality: Optional[Dict[str, Any]] = None
+
+
+# named ?view= fieldsets for list_backlinks (None = every field)
+BACKLINK_VIEWS = {
+    "summary": ("projectId", "categoryId", "domain", "url", "status"),
+    "full": None,
+}
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+Store a quality score on every backlink (see backend/quality.py):
+
+    quality: {score, percentile, categoryPercentile, outlier, scoredAt}
+
+    python -m backend.scoring [--project ID] [--dry-run]
+
+The API runs the same pass in the background (start_scoring) and records
+its status and result in scoring_runs, where clients poll it.
+
+Percentiles and outliers are relative to what was scored together: one
+project, or the whole collection. Backlinks are read in batches into
+columnar arrays and written back with unordered bulk_write batches.
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from .models import backlinks_collection, scoring_runs_collection
+from .quality import LOAD_BATCH, WRITE_BATCH, ColumnBuilder, Columns, Scores, records, score
+
+PROJECTION = {"da": 1, "ss": 1, "categoryId": 1, "contribute.points": 1}
+
+
+async def load(query: dict) -> ColumnBuilder:
+    builder = ColumnBuilder()
+    batch = []
+    async for doc in backlinks_collection.find(query, PROJECTION).batch_size(LOAD_BATCH):
+        batch.append(doc)
+        if len(batch) >= LOAD_BATCH:
+            builder.add(batch)
+            batch = []
+    builder.add(batch)
+    return builder
+
+
+async def write(columns: Columns, scores: Scores, scored_at: datetime) -> int:
+    written = 0
+    for start in range(0, len(columns.ids), WRITE_BATCH):
+        # quality only: updatedAt stays, so the analytics watermark ignores this
+        ops = [
+            UpdateOne(
+                {"_id": ObjectId(oid)},
+                {
+                    "$set": {
+                        "quality": {
+                            "score": value,
+                            "percentile": percentile,
+                            "categoryPercentile": category_percentile,
+                            "outlier": outlier,
+                            "scoredAt": scored_at,
+                        }
+                    }
+                },
+            )
+            for oid, value, percentile, category_percentile, outlier in records(
+                columns, scores, start, start + WRITE_BATCH
+            )
+        ]
+        result = await backlinks_collection.bulk_write(ops, ordered=False)
+        written += result.modified_count
+    return written
+
+
+async def score_backlinks(project_id: Optional[str] = None, dry_run: bool = False) -> dict:
+    scored_at = datetime.utcnow()
+    started = time.perf_counter()
+    builder = await load({"projectId": project_id} if project_id else {})
+    columns = builder.build()
+    loaded = time.perf_counter()
+
+    # a few hundred ms of NumPy at 1M rows; keep it off the event loop
+    scores = await asyncio.to_thread(score, columns)
+    computed = time.perf_counter()
+
+    written = 0 if dry_run else await write(columns, scores, scored_at)
+    return {
+        "projectId": project_id,
+        "scored": len(columns.ids),
+        "written": written,
+        "categories": len(builder.categories),
+        "outliers": int(scores.outlier.sum()),
+        "meanScore": round(float(scores.score.mean()), 2) if len(columns.ids) else None,
+        "loadSeconds": round(loaded - started, 3),
+        "scoreSeconds": round(computed - loaded, 3),
+        "writeSeconds": round(time.perf_counter() - computed, 3),
+        "scoredAt": scored_at,
+        "dryRun": dry_run,
+    }
+
+
+# ==== BACKGROUND RUNS (API) ====
+
+_running: Dict[str, asyncio.Task] = {}
+
+
+async def start_scoring(project_id: Optional[str] = None, dry_run: bool = False) -> str:
+    """Score in the background; return the id of its scoring_runs document."""
+    res = await scoring_runs_collection.insert_one(
+        {
+            "status": "running",
+            "projectId": project_id,
+            "dryRun": dry_run,
+            "startedAt": datetime.utcnow(),
+            "finishedAt": None,
+        }
+    )
+    run_id = str(res.inserted_id)
+
+    async def _finish(fields: dict) -> None:
+        await scoring_runs_collection.update_one(
+            {"_id": res.inserted_id},
+            {"$set": {**fields, "finishedAt": datetime.utcnow()}},
+        )
+
+    async def _run():
+        try:
+            result = await score_backlinks(project_id, dry_run=dry_run)
+            await _finish({**result, "status": "done"})
+        except asyncio.CancelledError:
+            await asyncio.shield(_finish({"status": "interrupted"}))
+            raise
+        except Exception as e:
+            print("Backlink scoring failed:", e)
+            await _finish({"status": "failed", "error": str(e)})
+        finally:
+            _running.pop(run_id, None)
+
+    _running[run_id] = asyncio.create_task(_run())
+    return run_id
+
+
+async def stop_scoring() -> None:
+    tasks = list(_running.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def is_running(run_id: str) -> bool:
+    return run_id in _running
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score backlink quality")
+    parser.add_argument("--project", help="score one project instead of every backlink")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    print(asyncio.run(score_backlinks(args.project, dry_run=args.dry_run)))
@@ -0,0 +1,98 @@
+"""
+Quality scoring throughput and memory at portfolio scale.
+
+Synthetic backlinks go through the same path as a real run minus MongoDB:
+ColumnBuilder batches, score(), and the per-row records() written back.
+Memory is the tracemalloc peak of a second pass; bytes/row staying flat
+as rows grow means memory grows linearly. No database needed:
+
+    python -m backend.scoring_bench [--rows 1000000] [--steps 4] [--categories 40]
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+from bson import ObjectId
+
+from .quality import LOAD_BATCH, WRITE_BATCH, ColumnBuilder, records, score
+
+
+def _batches(rows: int, categories: int, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    names = [f"category-{i}" for i in range(categories)]
+    for start in range(0, rows, LOAD_BATCH):
+        n = min(LOAD_BATCH, rows - start)
+        da = rng.integers(0, 101, n).tolist()
+        ss = rng.integers(0, 101, n).tolist()
+        points = rng.poisson(3, n).tolist()
+        cats = rng.integers(0, categories, n).tolist()
+        yield [
+            {
+                "_id": ObjectId(),
+                "da": da[i],
+                "ss": ss[i],
+                "categoryId": names[cats[i]],
+                "contribute": {"points": points[i]},
+            }
+            for i in range(n)
+        ]
+
+
+def run(rows: int, categories: int) -> dict:
+    build_seconds = 0.0
+    builder = ColumnBuilder()
+    for batch in _batches(rows, categories):
+        started = time.perf_counter()
+        builder.add(batch)
+        build_seconds += time.perf_counter() - started
+    started = time.perf_counter()
+    columns = builder.build()
+    build_seconds += time.perf_counter() - started
+
+    started = time.perf_counter()
+    scores = score(columns)
+    score_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for start in range(0, rows, WRITE_BATCH):
+        for _ in records(columns, scores, start, start + WRITE_BATCH):
+            pass
+    records_seconds = time.perf_counter() - started
+
+    # memory pass: only the columns and score arrays, not the synthetic docs
+    tracemalloc.start()
+    builder = ColumnBuilder()
+    for batch in _batches(rows, categories):
+        tracemalloc.reset_peak()
+        builder.add(batch)
+        del batch
+    columns = builder.build()
+    base, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    scores = score(columns)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "rows": rows,
+        "buildRowsPerSec": round(rows / build_seconds),
+        "scoreRowsPerSec": round(rows / score_seconds),
+        "recordsRowsPerSec": round(rows / records_seconds),
+        "scoreMs": round(score_seconds * 1000),
+        "columnsMB": round(base / 2**20, 1),
+        "peakMB": round(peak / 2**20, 1),
+        "peakBytesPerRow": round(peak / rows, 1),
+        "outliers": int(scores.outlier.sum()),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark backlink quality scoring")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--steps", type=int, default=4, help="also run at rows/steps, 2*rows/steps, ...")
+    parser.add_argument("--categories", type=int, default=40)
+    args = parser.parse_args()
+
+    for step in range(1, args.steps + 1):
+        print(run(args.rows * step // args.steps, args.categories))
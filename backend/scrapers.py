@@ -0,0 +1,141 @@
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Dict
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from .extractors import EXTRACTORS, extract_metrics
+from .request_blocking import blocking_totals, install_request_blocking
+
+SOCIAL_PLATFORMS = tuple(EXTRACTORS)
+
+
+# ==== PER-PLATFORM CONFIG ====
+
+# Overall time budget (seconds) for one scrape, navigation included.
+PLATFORM_BUDGETS = {
+    "instagram": float(os.getenv("SOCIAL_BUDGET_INSTAGRAM", "12")),
+    "facebook": float(os.getenv("SOCIAL_BUDGET_FACEBOOK", "12")),
+    "twitter": float(os.getenv("SOCIAL_BUDGET_TWITTER", "15")),
+    "linkedin": float(os.getenv("SOCIAL_BUDGET_LINKEDIN", "12")),
+}
+
+# Extra time allowed after the budget to read whatever already rendered.
+EXTRACT_GRACE_SECONDS = 2.0
+
+# What each scraper actually needs before it can read counts.
+# Meta tags are never visible, so these are waited for as "attached".
+READY_SELECTORS = {
+    "instagram": (
+        'meta[property="og:description"][content*="followers" i], '
+        'meta[name="description"][content*="followers" i]'
+    ),
+    "facebook": (
+        'meta[property="og:description"][content*="followers" i], '
+        ':text-matches("[\\\\d.,KkMm]+\\\\s+followers", "i")'
+    ),
+    "twitter": 'a[href$="/followers"] span span',
+    "linkedin": (
+        'meta[property="og:description"][content*="followers" i], '
+        ':text-matches("[\\\\d.,KkMm]+\\\\s+followers", "i")'
+    ),
+}
+
+
+# ==== LATENCY TRACKING ====
+
+
+class LatencyTracker:
+    """Rolling window of scrape durations per platform."""
+
+    def __init__(self, window: int = 500):
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+        self._timeouts: Dict[str, int] = {}
+        self._count: Dict[str, int] = {}
+
+    def record(self, platform: str, seconds: float, timed_out: bool) -> None:
+        samples = self._samples.setdefault(platform, deque(maxlen=self.window))
+        samples.append(seconds)
+        self._count[platform] = self._count.get(platform, 0) + 1
+        if timed_out:
+            self._timeouts[platform] = self._timeouts.get(platform, 0) + 1
+
+    @staticmethod
+    def _percentile(sorted_values, pct: float) -> float:
+        if not sorted_values:
+            return 0.0
+        idx = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+        return sorted_values[idx]
+
+    def snapshot(self) -> dict:
+        out = {}
+        for platform, samples in self._samples.items():
+            values = sorted(samples)
+            out[platform] = {
+                "count": self._count.get(platform, 0),
+                "timedOut": self._timeouts.get(platform, 0),
+                "p50Ms": round(self._percentile(values, 50) * 1000),
+                "p95Ms": round(self._percentile(values, 95) * 1000),
+            }
+        return out
+
+
+scrape_latency = LatencyTracker()
+
+
+# ==== ENTRY POINT ====
+
+
+def _remaining_ms(deadline: float) -> float:
+    return max(1.0, (deadline - time.monotonic()) * 1000)
+
+
+def _empty_metrics() -> dict:
+    return {"posts": 0, "followers": 0, "following": 0}
+
+
+async def scrape_profile(page, platform: str, url: str) -> dict:
+    """
+    Load `url` and read counts for `platform` within its time budget.
+
+    Waits for the element the platform scraper needs instead of a fixed sleep.
+    When the budget runs out, whatever is on the page is still parsed and the
+    result carries timedOut=True.
+    """
+    started = time.monotonic()
+    deadline = started + PLATFORM_BUDGETS[platform]
+    timed_out = False
+    blocker = await install_request_blocking(page, platform)
+
+    try:
+        await page.goto(url, wait_until="domcontentloaded", timeout=_remaining_ms(deadline))
+        await page.wait_for_selector(
+            READY_SELECTORS[platform], state="attached", timeout=_remaining_ms(deadline)
+        )
+    except PlaywrightTimeoutError:
+        timed_out = True
+
+    extract_timeout = max(deadline - time.monotonic(), 0) + EXTRACT_GRACE_SECONDS
+    try:
+        content = await asyncio.wait_for(page.content(), timeout=extract_timeout)
+        metrics = extract_metrics(platform, content)
+    except asyncio.TimeoutError:
+        metrics = _empty_metrics()
+        timed_out = True
+
+    metrics["timedOut"] = timed_out
+    elapsed = time.monotonic() - started
+    scrape_latency.record(platform, elapsed, timed_out)
+    if blocker is not None:
+        saved = blocker.summary()
+        blocking_totals.add(saved)
+        print(
+            f"Scraped {platform} in {elapsed:.2f}s: blocked "
+            f"{saved['blockedRequests']} requests {saved['blockedByType']}, "
+            f"~{saved['estimatedBytesSaved'] // 1024} KB saved, "
+            f"{saved['allowedRequests']} allowed"
+        )
+    return metrics
@@ -0,0 +1,98 @@
+"""
+Fast JSON path for read-only list endpoints.
+
+FastAPI validates every returned document against the route's
+response_model and then encodes it again, which dominates large pages.
+List routes instead shape documents with a ModelView (same keys and
+defaults the model would produce, fetched with a matching projection) and
+return the orjson-encoded bytes directly. The response_model stays on the
+route for the OpenAPI schema only.
+"""
+from typing import Dict, Iterable, Optional, Sequence
+
+import orjson
+from bson import Decimal128, ObjectId
+from fastapi import HTTPException, Response
+
+_MISSING = object()
+
+
+def bson_default(value):
+    """orjson fallback for BSON types (datetime is handled natively)."""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, Decimal128):
+        return str(value.to_decimal())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value) -> bytes:
+    return orjson.dumps(value, default=bson_default)
+
+
+def json_response(content, response: Optional[Response] = None) -> Response:
+    """
+    Encoded JSON response. Pass the route's injected `response` so headers
+    set on it (e.g. X-Next-Cursor) are kept; FastAPI drops them when a
+    Response is returned directly.
+    """
+    headers = dict(response.headers) if response is not None else None
+    return Response(dumps(content), media_type="application/json", headers=headers)
+
+
+class ModelView:
+    """Output keys (aliases, in field order) and defaults of a pydantic model."""
+
+    def __init__(self, model=None, fields=None):
+        if fields is None:
+            fields = []
+            for name, info in model.model_fields.items():
+                default = (
+                    _MISSING if info.is_required() else info.get_default(call_default_factory=True)
+                )
+                fields.append((info.alias or name, default))
+        self.fields = fields
+        self.projection = {key: 1 for key, _ in self.fields}
+
+    def select(
+        self,
+        view: Optional[str] = None,
+        fields: Optional[str] = None,
+        named: Optional[Dict[str, Optional[Sequence[str]]]] = None,
+    ) -> "ModelView":
+        """
+        Narrow the view for ?view= / ?fields=. `named` maps view names to
+        keys (None = every field); `fields` is a comma list and wins over
+        `view`. _id is always kept.
+        """
+        if fields:
+            keys = {"_id" if k == "id" else k for k in fields.replace(" ", "").split(",") if k}
+        elif view:
+            if not named or view not in named:
+                raise HTTPException(status_code=400, detail=f"Unknown view: {view}")
+            if named[view] is None:
+                return self
+            keys = set(named[view])
+        else:
+            return self
+
+        known = {key for key, _ in self.fields}
+        unknown = keys - known
+        if unknown:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+            )
+        keys.add("_id")
+        return ModelView(fields=[(key, d) for key, d in self.fields if key in keys])
+
+    def shape(self, doc: dict) -> dict:
+        out = {}
+        for key, default in self.fields:
+            if key in doc:
+                out[key] = doc[key]
+            elif default is not _MISSING:
+                out[key] = default
+        return out
+
+    def response(self, docs: Iterable[dict], response: Optional[Response] = None) -> Response:
+        return json_response([self.shape(doc) for doc in docs], response)
@@ -0,0 +1,115 @@
+"""
+Serialization time per 1000 list documents: response_model validation +
+re-encoding (the old path) vs. ModelView + orjson, and the payload size of
+each named ?view=. Synthetic documents shaped like the stored ones; no
+database needed.
+
+    python -m backend.serialize_bench [--docs 1000] [--repeat 20]
+"""
+import argparse
+import json
+import time
+from datetime import datetime
+from typing import List
+
+from bson import ObjectId
+from pydantic import TypeAdapter
+
+from .schemas import BACKLINK_VIEWS, PROJECT_VIEWS, BacklinkOut, ProjectOut
+from .serialization import ModelView, dumps
+
+
+def _backlink(i: int) -> dict:
+    now = datetime.utcnow()
+    return {
+        "_id": ObjectId(),
+        "projectId": str(ObjectId()),
+        "createdByUserId": str(ObjectId()),
+        "domain": f"site{i}.example.com",
+        "categoryId": str(ObjectId()),
+        "da": i % 100,
+        "ss": i % 17,
+        "url": f"https://site{i}.example.com/profile",
+        "contribute": {"points": i % 50},
+        "status": "approved",
+        "createdAt": now,
+        "updatedAt": now,
+    }
+
+
+def _project(i: int) -> dict:
+    now = datetime.utcnow()
+    return {
+        "_id": ObjectId(),
+        "name": f"Project {i}",
+        "url": f"https://project{i}.example.com",
+        "description": "Lorem ipsum dolor sit amet " * 4,
+        "ownerUserId": str(ObjectId()),
+        "status": "active",
+        "instagramUrl": f"https://instagram.com/project{i}",
+        "instagramPosts": i,
+        "instagramFollowers": i * 10,
+        "instagramFollowing": i * 2,
+        # stored info* fields that ProjectOut doesn't return
+        **{f"info{n}": f"value {n} for project {i}" for n in range(40)},
+        "infoExtraFields": [{"label": "Extra", "value": "x" * 40}] * 3,
+        "createdAt": now,
+        "updatedAt": now,
+    }
+
+
+def _old_path(adapter: TypeAdapter, docs: List[dict]) -> bytes:
+    # handler loop + FastAPI's validate/serialize + JSONResponse encoding
+    for d in docs:
+        d["_id"] = str(d["_id"])
+    validated = adapter.validate_python(docs)
+    content = adapter.dump_python(validated, mode="json", by_alias=True)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _new_path(view: ModelView, docs: List[dict]) -> bytes:
+    return view.response(docs).body
+
+
+def _time(fn, make_docs, repeat: int) -> float:
+    total = 0.0
+    for _ in range(repeat):
+        docs = make_docs()  # the old path mutates its input
+        started = time.perf_counter()
+        fn(docs)
+        total += time.perf_counter() - started
+    return total / repeat * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark list endpoint serialization")
+    parser.add_argument("--docs", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for name, model, factory, views in (
+        ("backlinks", BacklinkOut, _backlink, BACKLINK_VIEWS),
+        ("projects", ProjectOut, _project, PROJECT_VIEWS),
+    ):
+        template = [factory(i) for i in range(args.docs)]
+
+        def make_docs():
+            return [dict(d) for d in template]
+
+        adapter = TypeAdapter(List[model])
+        view = ModelView(model)
+        old_ms = _time(lambda docs: _old_path(adapter, docs), make_docs, args.repeat)
+        new_ms = _time(lambda docs: _new_path(view, docs), make_docs, args.repeat)
+        print(
+            f"{name:10} docs={args.docs} response_model={old_ms:7.2f}ms "
+            f"orjson={new_ms:7.2f}ms speedup={old_ms / new_ms:4.1f}x"
+        )
+
+        sizes = {"stored": len(dumps(template))}
+        for view_name in views:
+            selected = view.select(view_name, None, views)
+            sizes[view_name] = len(selected.response(template).body)
+        print(
+            f"{'':10} payload "
+            + " ".join(f"{k}={v / 1024:.1f}KB" for k, v in sizes.items())
+        )
@@ -0,0 +1,122 @@
+import os
+from typing import Optional
+
+from bson import ObjectId
+
+from .browser_pool import BrowserPool
+from .http_metrics import HttpMetricsFetcher
+from .models import (
+    projects_collection,
+    social_jobs_collection,
+    social_metrics_cache_collection,
+)
+from .project_cache import project_cache
+from .scrapers import scrape_profile
+from .social_cache import SocialMetricsCache
+from .social_history import record_snapshot
+from .social_jobs import SocialJobQueue
+
+
+# Warm Chromium instances shared by every social metrics lookup
+browser_pool = BrowserPool(
+    size=int(os.getenv("SOCIAL_BROWSER_POOL_SIZE", "2")),
+    contexts_per_browser=int(os.getenv("SOCIAL_CONTEXTS_PER_BROWSER", "2")),
+    max_pages_per_browser=int(os.getenv("SOCIAL_BROWSER_MAX_PAGES", "100")),
+    max_waiters=int(os.getenv("SOCIAL_BROWSER_MAX_WAITERS", "20")),
+    acquire_timeout=float(os.getenv("SOCIAL_BROWSER_ACQUIRE_TIMEOUT", "30")),
+)
+
+# Plain HTTP first tier; set SOCIAL_HTTP_TIER=0 to always render in Chromium
+HTTP_TIER_ENABLED = os.getenv("SOCIAL_HTTP_TIER", "1").lower() in ("1", "true", "yes")
+http_fetcher = HttpMetricsFetcher(
+    timeout=float(os.getenv("SOCIAL_HTTP_TIMEOUT", "5")),
+    max_connections=int(os.getenv("SOCIAL_HTTP_MAX_CONNECTIONS", "20")),
+)
+
+# Scraped metrics per (platform, profile url); Mongo tier is opt-in
+social_cache = SocialMetricsCache(
+    ttl_seconds=float(os.getenv("SOCIAL_CACHE_TTL_SECONDS", "900")),
+    max_entries=int(os.getenv("SOCIAL_CACHE_MAX_ENTRIES", "1000")),
+    collection=(
+        social_metrics_cache_collection
+        if os.getenv("SOCIAL_CACHE_MONGO", "").lower() in ("1", "true", "yes")
+        else None
+    ),
+)
+
+
+async def _fetch_uncached(platform: str, url: str) -> dict:
+    """Try the HTTP tier, fall back to a pooled browser; "tier" says which answered."""
+    if HTTP_TIER_ENABLED:
+        metrics = await http_fetcher.fetch(platform, url)
+        if metrics is not None:
+            metrics["timedOut"] = False
+            metrics["tier"] = "http"
+            return metrics
+
+    async with browser_pool.page() as page:
+        metrics = await scrape_profile(page, platform, url)
+    metrics["tier"] = "browser"
+    return metrics
+
+
+async def fetch_social_metrics(platform: str, url: str, force: bool = False) -> dict:
+    """Cached, single-flight metrics lookup; adds "cache" = memory / mongo / fetch."""
+    metrics, source = await social_cache.get_or_fetch(
+        platform,
+        url,
+        lambda: _fetch_uncached(platform, url),
+        force=force,
+    )
+    metrics["cache"] = source
+    return metrics
+
+
+def project_metric_fields(platform: str, metrics: dict) -> dict:
+    """Map scraped counts to the project fields managed by update_project_info."""
+    return {
+        f"{platform}Posts": metrics.get("posts", 0),
+        f"{platform}Followers": metrics.get("followers", 0),
+        f"{platform}Following": metrics.get("following", 0),
+    }
+
+
+async def store_project_metrics(project_id: str, platform: str, metrics: dict) -> bool:
+    """
+    Write counts onto the project document and its history. Timed-out
+    (partial) results are not stored so they can't overwrite good counts with zeros.
+    """
+    if metrics.get("timedOut") or not ObjectId.is_valid(project_id):
+        return False
+    res = await projects_collection.update_one(
+        {"_id": ObjectId(project_id)},
+        {"$set": project_metric_fields(platform, metrics)},
+    )
+    if res.matched_count == 0:
+        return False
+    await project_cache.invalidate(project_id)
+    await record_snapshot(project_id, platform, metrics)
+    return True
+
+
+async def _store_job_result(job: dict, metrics: dict) -> None:
+    project_id: Optional[str] = job.get("projectId")
+    if project_id:
+        job["projectUpdated"] = await store_project_metrics(
+            project_id, job["platform"], metrics
+        )
+
+
+social_jobs = SocialJobQueue(
+    run=fetch_social_metrics,
+    on_done=_store_job_result,
+    workers=int(os.getenv("SOCIAL_JOB_WORKERS", "4")),
+    platform_limits={
+        "instagram": int(os.getenv("SOCIAL_JOB_LIMIT_INSTAGRAM", "2")),
+        "facebook": int(os.getenv("SOCIAL_JOB_LIMIT_FACEBOOK", "2")),
+        "twitter": int(os.getenv("SOCIAL_JOB_LIMIT_TWITTER", "1")),
+        "linkedin": int(os.getenv("SOCIAL_JOB_LIMIT_LINKEDIN", "1")),
+    },
+    max_queue=int(os.getenv("SOCIAL_JOB_MAX_QUEUE", "500")),
+    collection=social_jobs_collection,
+)
@@ -0,0 +1,186 @@
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# share/tracking parameters that never change which profile a URL points at
+_IGNORED_QUERY_PARAMS = {"fbclid", "igshid", "igsh", "si", "ref", "ref_src", "hl", "locale"}
+
+
+def normalize_profile_url(url: str) -> str:
+    """
+    Reduce a profile URL to a stable cache key part:
+    lower-case host without "www.", no fragment, no trailing slash, and a
+    sorted query without tracking parameters (profile.php?id=N keeps its id).
+    """
+    parts = urlsplit((url or "").strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if host.startswith("m."):
+        host = host[2:]
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query)
+        if k.lower() not in _IGNORED_QUERY_PARAMS and not k.lower().startswith("utm_")
+    ))
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+class SocialMetricsCache:
+    """
+    TTL + LRU cache for scraped social metrics with single-flight fetches.
+
+    Lookups go memory -> Mongo (optional second tier) -> fetch. Concurrent
+    misses for the same (platform, url) share one in-flight fetch.
+    Results flagged timedOut are returned but not cached.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 900,
+        max_entries: int = 1000,
+        collection=None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.collection = collection  # motor collection or None
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, dict]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._stats = {
+            "hits": 0,
+            "mongoHits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "forced": 0,
+        }
+
+    @staticmethod
+    def make_key(platform: str, url: str) -> Tuple[str, str]:
+        return (platform.lower(), normalize_profile_url(url))
+
+    # ---- memory tier ----
+
+    def _get_memory(self, key) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set_memory(self, key, value: dict) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    # ---- mongo tier ----
+
+    @staticmethod
+    def _mongo_id(key) -> str:
+        return f"{key[0]}|{key[1]}"
+
+    async def _get_mongo(self, key) -> Optional[dict]:
+        if self.collection is None:
+            return None
+        cutoff = datetime.utcnow() - timedelta(seconds=self.ttl_seconds)
+        doc = await self.collection.find_one(
+            {"_id": self._mongo_id(key), "fetchedAt": {"$gte": cutoff}}
+        )
+        return doc["metrics"] if doc else None
+
+    async def _set_mongo(self, key, value: dict) -> None:
+        if self.collection is None:
+            return
+        now = datetime.utcnow()
+        # expiresAt drives the TTL index registered in indexes.py
+        await self.collection.update_one(
+            {"_id": self._mongo_id(key)},
+            {
+                "$set": {
+                    "metrics": value,
+                    "fetchedAt": now,
+                    "expiresAt": now + timedelta(seconds=self.ttl_seconds),
+                }
+            },
+            upsert=True,
+        )
+
+    # ---- public API ----
+
+    async def _fetch_and_store(self, key, fetch: Callable[[], Awaitable[dict]]) -> dict:
+        try:
+            value = await fetch()
+            if not value.get("timedOut"):
+                self._set_memory(key, value)
+                try:
+                    await self._set_mongo(key, value)
+                except Exception as e:
+                    print("Failed to write social metrics cache:", e)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    async def get_or_fetch(
+        self,
+        platform: str,
+        url: str,
+        fetch: Callable[[], Awaitable[dict]],
+        force: bool = False,
+    ) -> Tuple[dict, str]:
+        """Return (metrics, source) where source is memory / mongo / fetch."""
+        key = self.make_key(platform, url)
+
+        if force:
+            self._stats["forced"] += 1
+        else:
+            value = self._get_memory(key)
+            if value is not None:
+                self._stats["hits"] += 1
+                return dict(value), "memory"
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self._stats["coalesced"] += 1
+            return dict(await asyncio.shield(task)), "fetch"
+
+        if not force:
+            try:
+                value = await self._get_mongo(key)
+            except Exception as e:
+                print("Failed to read social metrics cache:", e)
+                value = None
+            if value is not None:
+                self._stats["mongoHits"] += 1
+                self._set_memory(key, value)
+                return dict(value), "mongo"
+            # another request may have started the fetch while we were in Mongo
+            task = self._inflight.get(key)
+            if task is not None:
+                self._stats["coalesced"] += 1
+                return dict(await asyncio.shield(task)), "fetch"
+
+        self._stats["misses"] += 1
+        task = asyncio.ensure_future(self._fetch_and_store(key, fetch))
+        self._inflight[key] = task
+        return dict(await asyncio.shield(task)), "fetch"
+
+    def invalidate(self, platform: str, url: str) -> None:
+        self._entries.pop(self.make_key(platform, url), None)
+
+    def stats(self) -> dict:
+        return {
+            **self._stats,
+            "entries": len(self._entries),
+            "inflight": len(self._inflight),
+            "ttlSeconds": self.ttl_seconds,
+            "maxEntries": self.max_entries,
+            "mongoTier": self.collection is not None,
+        }
@@ -0,0 +1,249 @@
+import asyncio
+import os
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from pymongo import ASCENDING, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from .models import social_metrics_history_collection
+
+
+# Buckets:
+# - "raw":    one doc per project/platform/day, every sample of that day
+# - "daily":  one doc per project/platform/month, one point per day
+# - "weekly": same month doc once it is older than the daily retention,
+#             thinned out to one point per ISO week
+RAW_RETENTION_DAYS = int(os.getenv("SOCIAL_HISTORY_RAW_DAYS", "30"))
+DAILY_RETENTION_DAYS = int(os.getenv("SOCIAL_HISTORY_DAILY_DAYS", "365"))
+COMPACT_BATCH = 500
+
+SERIES_FIELDS = ["t", "followers", "following", "posts"]
+
+
+def _day_start(dt: datetime) -> datetime:
+    return datetime(dt.year, dt.month, dt.day)
+
+
+def _month_start(dt: datetime) -> datetime:
+    return datetime(dt.year, dt.month, 1)
+
+
+def _point(metrics: dict, at: datetime) -> dict:
+    return {
+        "t": at,
+        "followers": int(metrics.get("followers") or 0),
+        "following": int(metrics.get("following") or 0),
+        "posts": int(metrics.get("posts") or 0),
+    }
+
+
+# ==== WRITES ====
+
+
+def snapshot_update(
+    project_id: str, platform: str, metrics: dict, at: Optional[datetime] = None
+) -> UpdateOne:
+    """Upsert that appends one sample to the project/platform/day bucket."""
+    at = at or datetime.utcnow()
+    day = _day_start(at)
+    point = _point(metrics, at)
+    return UpdateOne(
+        {"_id": f"{project_id}|{platform}|D|{day:%Y-%m-%d}"},
+        {
+            "$setOnInsert": {
+                "projectId": project_id,
+                "platform": platform,
+                "granularity": "raw",
+                "bucketStart": day,
+            },
+            "$push": {"samples": point},
+            "$inc": {"count": 1},
+            "$set": {"last": point},
+        },
+        upsert=True,
+    )
+
+
+async def record_snapshots(ops: List[UpdateOne]) -> None:
+    if ops:
+        await social_metrics_history_collection.bulk_write(ops, ordered=False)
+
+
+async def record_snapshot(project_id: str, platform: str, metrics: dict) -> None:
+    await record_snapshots([snapshot_update(project_id, platform, metrics)])
+
+
+# ==== RETENTION ====
+
+
+async def _bulk_ignore_duplicates(ops: List[UpdateOne]) -> None:
+    try:
+        await social_metrics_history_collection.bulk_write(ops, ordered=False)
+    except BulkWriteError as e:
+        # the day is already in its month bucket (earlier run stopped half way)
+        if any(err.get("code") != 11000 for err in e.details.get("writeErrors", [])):
+            raise
+
+
+async def _roll_days_into_months(cutoff: datetime) -> int:
+    rolled = 0
+    ops: List[UpdateOne] = []
+    day_ids: List[str] = []
+
+    async def flush():
+        nonlocal ops, day_ids
+        if ops:
+            await _bulk_ignore_duplicates(ops)
+            await social_metrics_history_collection.delete_many({"_id": {"$in": day_ids}})
+        ops, day_ids = [], []
+
+    cursor = social_metrics_history_collection.find(
+        {"granularity": "raw", "bucketStart": {"$lt": cutoff}}
+    )
+    async for bucket in cursor:
+        samples = bucket.get("samples") or []
+        if samples:
+            last = max(samples, key=lambda s: s["t"])
+            day_key = f"{bucket['bucketStart']:%Y-%m-%d}"
+            month = _month_start(bucket["bucketStart"])
+            ops.append(
+                UpdateOne(
+                    {
+                        "_id": f"{bucket['projectId']}|{bucket['platform']}|M|{month:%Y-%m}",
+                        "samples.d": {"$ne": day_key},
+                    },
+                    {
+                        "$setOnInsert": {
+                            "projectId": bucket["projectId"],
+                            "platform": bucket["platform"],
+                            "granularity": "daily",
+                            "bucketStart": month,
+                        },
+                        "$push": {
+                            "samples": {"$each": [{**last, "d": day_key}], "$sort": {"t": 1}}
+                        },
+                        "$inc": {"count": 1},
+                    },
+                    upsert=True,
+                )
+            )
+        day_ids.append(bucket["_id"])
+        rolled += 1
+        if len(day_ids) >= COMPACT_BATCH:
+            await flush()
+    await flush()
+    return rolled
+
+
+def _last_per_week(samples: List[dict]) -> List[dict]:
+    weeks = {}
+    for sample in sorted(samples, key=lambda s: s["t"]):
+        weeks[sample["t"].isocalendar()[:2]] = sample
+    return list(weeks.values())
+
+
+async def _thin_months_to_weeks(cutoff: datetime) -> int:
+    thinned = 0
+    cursor = social_metrics_history_collection.find(
+        {"granularity": "daily", "bucketStart": {"$lt": cutoff}}
+    )
+    async for bucket in cursor:
+        weekly = _last_per_week(bucket.get("samples") or [])
+        await social_metrics_history_collection.update_one(
+            {"_id": bucket["_id"]},
+            {"$set": {"samples": weekly, "count": len(weekly), "granularity": "weekly"}},
+        )
+        thinned += 1
+    return thinned
+
+
+async def compact_history(now: Optional[datetime] = None) -> dict:
+    """Downsample old buckets; safe to re-run after an interruption."""
+    now = now or datetime.utcnow()
+    rolled = await _roll_days_into_months(_day_start(now - timedelta(days=RAW_RETENTION_DAYS)))
+    thinned = await _thin_months_to_weeks(
+        _month_start(now - timedelta(days=DAILY_RETENTION_DAYS))
+    )
+    return {"dayBucketsRolled": rolled, "monthBucketsThinned": thinned}
+
+
+async def run_compaction_loop(interval_seconds: float) -> None:
+    while True:
+        try:
+            result = await compact_history()
+            print("Social history compaction:", result)
+        except Exception as e:
+            print("Social history compaction failed:", e)
+        await asyncio.sleep(interval_seconds)
+
+
+# ==== READS ====
+
+
+def _resolution_for(start: datetime, end: datetime) -> str:
+    span = end - start
+    if span <= timedelta(days=7):
+        return "raw"
+    if span <= timedelta(days=180):
+        return "daily"
+    return "weekly"
+
+
+def _bucket_key(t: datetime, resolution: str):
+    if resolution == "daily":
+        return t.date()
+    if resolution == "weekly":
+        return t.isocalendar()[:2]
+    return t
+
+
+async def query_series(
+    project_id: str,
+    platform: str,
+    start: datetime,
+    end: datetime,
+    resolution: str = "auto",
+) -> dict:
+    """
+    Samples in [start, end] as compact rows [epochMs, followers, following, posts],
+    reduced to the last point per day / week for longer ranges.
+    """
+    if resolution == "auto":
+        resolution = _resolution_for(start, end)
+
+    cursor = social_metrics_history_collection.find(
+        {
+            "projectId": project_id,
+            "platform": platform,
+            "bucketStart": {"$gte": _month_start(start), "$lte": end},
+        },
+        {"samples": 1},
+    ).sort("bucketStart", ASCENDING)
+
+    reduced = {}
+    async for bucket in cursor:
+        for sample in bucket.get("samples") or []:
+            t = sample["t"]
+            if start <= t <= end:
+                key = _bucket_key(t, resolution)
+                current = reduced.get(key)
+                if current is None or current["t"] <= t:
+                    reduced[key] = sample
+
+    points = [
+        [
+            int((s["t"] - datetime(1970, 1, 1)).total_seconds() * 1000),
+            s["followers"],
+            s["following"],
+            s["posts"],
+        ]
+        for s in sorted(reduced.values(), key=lambda s: s["t"])
+    ]
+    return {
+        "projectId": project_id,
+        "platform": platform,
+        "resolution": resolution,
+        "fields": SERIES_FIELDS,
+        "points": points,
+    }
@@ -0,0 +1,189 @@
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+class JobQueueFull(Exception):
+    """Raised when the job queue is at its size limit."""
+
+
+class SocialJobQueue:
+    """
+    In-process queue of social-metrics scrape jobs.
+
+    A fixed number of workers drain the queue; each job additionally holds a
+    per-platform semaphore so one slow platform can't take every worker.
+    `run(platform, url, force)` produces the metrics and `on_done(job, metrics)`
+    is awaited after a successful run (e.g. to write counts to the project).
+    Finished jobs are kept for `retain_seconds` so clients can poll them.
+
+    With a `collection`, every status change is also written to Mongo, so a
+    job can be polled from any app worker, not just the one running it.
+    """
+
+    def __init__(
+        self,
+        run: Callable[[str, str, bool], Awaitable[dict]],
+        on_done: Optional[Callable[[dict, dict], Awaitable[None]]] = None,
+        workers: int = 4,
+        platform_limits: Optional[Dict[str, int]] = None,
+        max_queue: int = 500,
+        retain_seconds: float = 3600,
+        collection=None,
+    ):
+        self.run = run
+        self.on_done = on_done
+        self.workers = max(1, workers)
+        self.platform_limits = platform_limits or {}
+        self.max_queue = max_queue
+        self.retain_seconds = retain_seconds
+        self.collection = collection  # motor collection or None
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._jobs: Dict[str, dict] = {}
+        self._finished_at: Dict[str, float] = {}
+        self._platform_sems: Dict[str, asyncio.Semaphore] = {}
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _platform_sem(self, platform: str) -> asyncio.Semaphore:
+        sem = self._platform_sems.get(platform)
+        if sem is None:
+            limit = self.platform_limits.get(platform, self.workers)
+            sem = asyncio.Semaphore(max(1, limit))
+            self._platform_sems[platform] = sem
+        return sem
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.retain_seconds
+        for job_id, finished in list(self._finished_at.items()):
+            if finished < cutoff:
+                del self._finished_at[job_id]
+                self._jobs.pop(job_id, None)
+
+    async def _save(self, job: dict, fields) -> None:
+        """Persist `fields` of the job; expiresAt drives the TTL index in indexes.py."""
+        if self.collection is None:
+            return
+        update = {key: job[key] for key in fields}
+        update["expiresAt"] = datetime.utcnow() + timedelta(seconds=self.retain_seconds)
+        try:
+            await self.collection.update_one({"_id": job["id"]}, {"$set": update}, upsert=True)
+        except Exception as e:
+            print("Failed to store social metrics job status:", e)
+
+    async def _discard(self, job_id: str) -> None:
+        if self.collection is None:
+            return
+        try:
+            await self.collection.delete_one({"_id": job_id})
+        except Exception as e:
+            print("Failed to remove rejected social metrics job:", e)
+
+    async def submit(
+        self,
+        platform: str,
+        url: str,
+        project_id: Optional[str] = None,
+        force: bool = False,
+    ) -> dict:
+        if self._queue is None:
+            raise RuntimeError("Job queue is not started")
+        self._prune()
+
+        job = {
+            "id": uuid.uuid4().hex,
+            "platform": platform,
+            "url": url,
+            "projectId": project_id,
+            "force": force,
+            "status": "queued",
+            "result": None,
+            "error": None,
+            "projectUpdated": False,
+            "createdAt": datetime.utcnow(),
+            "startedAt": None,
+            "finishedAt": None,
+        }
+        if self._queue.full():
+            raise JobQueueFull("Too many social metrics jobs queued")
+        # stored before it is queued, so a poll can never miss a running job
+        await self._save(job, [key for key in job if key != "id"])
+        try:
+            self._queue.put_nowait(job["id"])
+        except asyncio.QueueFull:
+            # another submit filled the queue while this one was being stored
+            await self._discard(job["id"])
+            raise JobQueueFull("Too many social metrics jobs queued")
+        self._jobs[job["id"]] = job
+        return job
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        """The job from this worker's memory, else from Mongo (another worker's job)."""
+        job = self._jobs.get(job_id)
+        if job is not None or self.collection is None:
+            return job
+        doc = await self.collection.find_one({"_id": job_id}, {"expiresAt": 0})
+        if doc is None:
+            return None
+        doc["id"] = doc.pop("_id")
+        return doc
+
+    async def _finish(self, job: dict, status: str) -> None:
+        job["status"] = status
+        job["finishedAt"] = datetime.utcnow()
+        self._finished_at[job["id"]] = time.monotonic()
+        await self._save(job, ["status", "result", "error", "projectUpdated", "finishedAt"])
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            job = self._jobs.get(job_id)
+            try:
+                if job is None:
+                    continue
+                async with self._platform_sem(job["platform"]):
+                    job["status"] = "running"
+                    job["startedAt"] = datetime.utcnow()
+                    await self._save(job, ["status", "startedAt"])
+                    try:
+                        metrics = await self.run(job["platform"], job["url"], job["force"])
+                    except Exception as e:
+                        job["error"] = str(e)
+                        await self._finish(job, "failed")
+                        continue
+
+                job["result"] = metrics
+                if self.on_done is not None:
+                    try:
+                        await self.on_done(job, metrics)
+                    except Exception as e:
+                        print("Failed to store social metrics job result:", e)
+                        job["error"] = str(e)
+                await self._finish(job, "done")
+            finally:
+                self._queue.task_done()
+
+    def stats(self) -> dict:
+        counts: Dict[str, int] = {}
+        for job in self._jobs.values():
+            counts[job["status"]] = counts.get(job["status"], 0) + 1
+        return {
+            "workers": self.workers,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "maxQueue": self.max_queue,
+            "jobs": counts,
+        }
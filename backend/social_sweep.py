@@ -0,0 +1,387 @@
+"""
+Bulk refresh of every project's social counters.
+
+Run from the API (POST /api/admin/social/sweep) or from the command line:
+
+    python -m backend.social_sweep [--concurrency 4] [--limit instagram=2 ...]
+                                   [--resume <sweepId>] [--no-force]
+
+Per-platform caps default to SOCIAL_SWEEP_LIMIT_<PLATFORM>.
+"""
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from .models import projects_collection, social_sweeps_collection
+from .project_cache import project_cache
+from .scrapers import SOCIAL_PLATFORMS
+from .social import (
+    browser_pool,
+    fetch_social_metrics,
+    http_fetcher,
+    project_metric_fields,
+)
+from .social_history import record_snapshots, snapshot_update
+
+
+PLATFORM_URL_FIELDS = {platform: f"{platform}Url" for platform in SOCIAL_PLATFORMS}
+
+# concurrent scrapes per platform, on top of the global concurrency cap
+DEFAULT_PLATFORM_LIMITS = {
+    "instagram": int(os.getenv("SOCIAL_SWEEP_LIMIT_INSTAGRAM", "2")),
+    "facebook": int(os.getenv("SOCIAL_SWEEP_LIMIT_FACEBOOK", "2")),
+    "twitter": int(os.getenv("SOCIAL_SWEEP_LIMIT_TWITTER", "1")),
+    "linkedin": int(os.getenv("SOCIAL_SWEEP_LIMIT_LINKEDIN", "1")),
+}
+
+
+def parse_platform_limits(raw) -> Dict[str, int]:
+    """
+    Validate per-platform overrides given as {"instagram": 2} or
+    ["instagram=2", ...]. Raises ValueError on unknown platforms or bad numbers.
+    """
+    if isinstance(raw, dict):
+        items = list(raw.items())
+    elif not isinstance(raw, (list, tuple)):
+        raise ValueError("platformLimits must be an object")
+    else:
+        items = [tuple(item.split("=", 1)) if "=" in item else (item, "") for item in raw]
+
+    limits = {}
+    for platform, value in items:
+        platform = str(platform).lower().strip()
+        if platform not in PLATFORM_URL_FIELDS:
+            raise ValueError(f"Unsupported platform: {platform}")
+        try:
+            limits[platform] = int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid limit for {platform}: {value!r}")
+        if limits[platform] < 1:
+            raise ValueError(f"Limit for {platform} must be at least 1")
+    return limits
+
+
+def _target_key(project_id: str, platform: str) -> str:
+    return f"{project_id}|{platform}"
+
+
+async def collect_targets() -> List[dict]:
+    """Every (project, platform, url) that has a profile URL filled in."""
+    query = {
+        "$or": [{field: {"$nin": [None, ""]}} for field in PLATFORM_URL_FIELDS.values()]
+    }
+    projection = {field: 1 for field in PLATFORM_URL_FIELDS.values()}
+    targets = []
+    async for project in projects_collection.find(query, projection):
+        for platform, field in PLATFORM_URL_FIELDS.items():
+            url = (project.get(field) or "").strip()
+            if url.startswith("http://") or url.startswith("https://"):
+                targets.append(
+                    {"projectId": str(project["_id"]), "platform": platform, "url": url}
+                )
+    return targets
+
+
+class SocialSweep:
+    """
+    Scrape all targets under a global and per-platform concurrency cap.
+
+    Results are buffered and written with one bulk_write per checkpoint
+    (every `checkpoint_every` results and at the end). Each checkpoint also
+    records the succeeded and failed keys on the sweep document, so an
+    interrupted sweep can be resumed with its id: profiles that succeeded are
+    skipped, the rest (including earlier failures) are scraped again.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        platform_limits: Optional[Dict[str, int]] = None,
+        force: bool = True,
+        checkpoint_every: int = 25,
+        on_progress: Optional[Callable[[dict], None]] = None,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.platform_limits = {**DEFAULT_PLATFORM_LIMITS, **(platform_limits or {})}
+        self.force = force
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.on_progress = on_progress
+
+        self._pending_ops: List[UpdateOne] = []
+        self._pending_history: List[UpdateOne] = []
+        self._pending_keys: List[str] = []
+        self._pending_failures: List[dict] = []
+        self._flush_lock = asyncio.Lock()
+        self.progress: dict = {}
+
+    async def _create(self, total: int) -> ObjectId:
+        now = datetime.utcnow()
+        res = await social_sweeps_collection.insert_one(
+            {
+                "status": "running",
+                "force": self.force,
+                "total": total,
+                "completed": 0,
+                "succeeded": 0,
+                "failed": 0,
+                "completedKeys": [],
+                "failedKeys": [],
+                "failures": [],
+                "profilesPerMinute": 0,
+                "startedAt": now,
+                "updatedAt": now,
+                "finishedAt": None,
+            }
+        )
+        return res.inserted_id
+
+    def _throughput(self) -> float:
+        elapsed = time.monotonic() - self._started
+        done_here = self.progress["completed"] - self._resumed_from
+        return round(done_here / elapsed * 60, 2) if elapsed > 0 else 0.0
+
+    async def _flush(self, status: Optional[str] = None) -> None:
+        async with self._flush_lock:
+            ops, self._pending_ops = self._pending_ops, []
+            history, self._pending_history = self._pending_history, []
+            keys, self._pending_keys = self._pending_keys, []
+            failures, self._pending_failures = self._pending_failures, []
+            failed_keys = {_target_key(f["projectId"], f["platform"]) for f in failures}
+
+            if ops:
+                await projects_collection.bulk_write(ops, ordered=False)
+                await project_cache.invalidate(*(key.split("|")[0] for key in keys))
+                await record_snapshots(history)
+
+            now = datetime.utcnow()
+            update: dict = {
+                "$set": {
+                    "completed": self.progress["completed"],
+                    "succeeded": self.progress["succeeded"],
+                    "failed": self.progress["failed"],
+                    "profilesPerMinute": self._throughput(),
+                    "updatedAt": now,
+                }
+            }
+            if status:
+                update["$set"]["status"] = status
+                update["$set"]["finishedAt"] = now
+            push = {}
+            succeeded_keys = [key for key in keys if key not in failed_keys]
+            if succeeded_keys:
+                push["completedKeys"] = {"$each": succeeded_keys}
+            if failures:
+                push["failedKeys"] = {"$each": sorted(failed_keys)}
+                push["failures"] = {"$each": failures}
+            if push:
+                update["$push"] = push
+            await social_sweeps_collection.update_one({"_id": self.sweep_id}, update)
+
+    async def _scrape_one(self, target: dict, global_sem, platform_sems) -> None:
+        platform = target["platform"]
+        error = None
+        metrics = None
+        async with global_sem, platform_sems[platform]:
+            try:
+                metrics = await fetch_social_metrics(platform, target["url"], force=self.force)
+                if metrics.get("timedOut"):
+                    error = "timed out"
+            except Exception as e:
+                error = str(e) or e.__class__.__name__
+
+        self._pending_keys.append(_target_key(target["projectId"], platform))
+        self.progress["completed"] += 1
+        if error:
+            self.progress["failed"] += 1
+            self._pending_failures.append({**target, "error": error})
+        else:
+            self.progress["succeeded"] += 1
+            self._pending_ops.append(
+                UpdateOne(
+                    {"_id": ObjectId(target["projectId"])},
+                    {"$set": project_metric_fields(platform, metrics)},
+                )
+            )
+            self._pending_history.append(
+                snapshot_update(target["projectId"], platform, metrics)
+            )
+        self.progress["profilesPerMinute"] = self._throughput()
+        if self.on_progress:
+            self.on_progress(dict(self.progress))
+
+        if len(self._pending_keys) >= self.checkpoint_every:
+            await self._flush()
+
+    async def prepare(self, resume_id: Optional[str] = None) -> str:
+        """Create (or reopen) the sweep document and work out what is left to do."""
+        targets = await collect_targets()
+        done_keys = set()
+
+        if resume_id:
+            doc = await social_sweeps_collection.find_one({"_id": ObjectId(resume_id)})
+            if not doc:
+                raise ValueError("Sweep not found")
+            self.sweep_id = doc["_id"]
+            self.force = doc.get("force", self.force)
+            done_keys = set(doc.get("completedKeys") or [])
+            # earlier failures are retried, so they no longer count as done
+            self.progress = {
+                "completed": doc.get("succeeded", 0),
+                "succeeded": doc.get("succeeded", 0),
+                "failed": 0,
+            }
+            remaining = [
+                t for t in targets
+                if _target_key(t["projectId"], t["platform"]) not in done_keys
+            ]
+            total = self.progress["completed"] + len(remaining)
+            await social_sweeps_collection.update_one(
+                {"_id": self.sweep_id},
+                {
+                    "$set": {
+                        "status": "running",
+                        "total": total,
+                        "completed": self.progress["completed"],
+                        "failed": 0,
+                        "failedKeys": [],
+                        "failures": [],
+                        "finishedAt": None,
+                    }
+                },
+            )
+        else:
+            remaining = targets
+            total = len(targets)
+            self.sweep_id = await self._create(total)
+            self.progress = {"completed": 0, "succeeded": 0, "failed": 0}
+
+        self.progress.update({"sweepId": str(self.sweep_id), "total": total})
+        self._remaining = remaining
+        return str(self.sweep_id)
+
+    async def execute(self) -> dict:
+        self._resumed_from = self.progress["completed"]
+        self._started = time.monotonic()
+
+        global_sem = asyncio.Semaphore(self.concurrency)
+        platform_sems = {
+            platform: asyncio.Semaphore(max(1, self.platform_limits.get(platform, self.concurrency)))
+            for platform in PLATFORM_URL_FIELDS
+        }
+
+        try:
+            await asyncio.gather(
+                *(self._scrape_one(t, global_sem, platform_sems) for t in self._remaining)
+            )
+        except asyncio.CancelledError:
+            await asyncio.shield(self._flush(status="interrupted"))
+            raise
+        except Exception:
+            await self._flush(status="failed")
+            raise
+
+        await self._flush(status="done")
+        self.progress["profilesPerMinute"] = self._throughput()
+        return dict(self.progress)
+
+    async def run(self, resume_id: Optional[str] = None) -> dict:
+        await self.prepare(resume_id)
+        return await self.execute()
+
+
+# ==== BACKGROUND RUNS (API) ====
+
+_running: Dict[str, asyncio.Task] = {}
+
+
+async def start_sweep(
+    concurrency: int,
+    force: bool = True,
+    resume_id: Optional[str] = None,
+    platform_limits: Optional[Dict[str, int]] = None,
+) -> str:
+    """Start a sweep in the background and return its id."""
+    if resume_id and resume_id in _running:
+        raise ValueError("Sweep is already running")
+
+    sweep = SocialSweep(concurrency=concurrency, platform_limits=platform_limits, force=force)
+    sweep_id = await sweep.prepare(resume_id)
+
+    async def _run():
+        try:
+            await sweep.execute()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print("Social sweep failed:", e)
+        finally:
+            _running.pop(sweep_id, None)
+
+    _running[sweep_id] = asyncio.create_task(_run())
+    return sweep_id
+
+
+async def stop_sweeps() -> None:
+    tasks = list(_running.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def is_running(sweep_id: str) -> bool:
+    return sweep_id in _running
+
+
+# ==== CLI ====
+
+
+def _print_progress(progress: dict) -> None:
+    print(
+        f"\r{progress['completed']}/{progress['total']} "
+        f"ok={progress['succeeded']} failed={progress['failed']} "
+        f"{progress['profilesPerMinute']} profiles/min",
+        end="",
+        flush=True,
+    )
+
+
+async def _cli(args) -> None:
+    await http_fetcher.start()
+    await browser_pool.start()
+    try:
+        sweep = SocialSweep(
+            concurrency=args.concurrency,
+            platform_limits=parse_platform_limits(args.limit),
+            force=not args.no_force,
+            on_progress=_print_progress,
+        )
+        result = await sweep.run(resume_id=args.resume)
+        print()
+        print("Sweep", result["sweepId"], "finished:", result)
+        doc = await social_sweeps_collection.find_one({"_id": sweep.sweep_id})
+        for failure in (doc or {}).get("failures", []):
+            print(f"  FAILED {failure['platform']} {failure['url']}: {failure['error']}")
+    finally:
+        await browser_pool.stop()
+        await http_fetcher.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh social metrics for all projects")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument(
+        "--limit",
+        action="append",
+        default=[],
+        metavar="PLATFORM=N",
+        help="per-platform concurrency cap, e.g. --limit instagram=1 (repeatable)",
+    )
+    parser.add_argument("--resume", help="id of an interrupted sweep to continue")
+    parser.add_argument("--no-force", action="store_true", help="allow cached results")
+    asyncio.run(_cli(parser.parse_args()))
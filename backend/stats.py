@@ -0,0 +1,98 @@
+import asyncio
+from datetime import datetime
+from typing import Optional
+
+from .models import (
+    backlinks_collection,
+    projects_collection,
+    stats_counters_collection,
+    users_collection,
+)
+
+# One counter document per kind: {_id, total, byStatus, byProject, byCategory}
+COUNTED = {
+    "users": (users_collection, ("status",)),
+    "projects": (projects_collection, ("status",)),
+    "backlinks": (backlinks_collection, ("status", "projectId", "categoryId")),
+}
+BREAKDOWN_FIELDS = {
+    "status": "byStatus",
+    "projectId": "byProject",
+    "categoryId": "byCategory",
+}
+
+
+def _key(value) -> str:
+    # map keys can't contain "." or start with "$"
+    return str(value if value not in (None, "") else "none").replace(".", "_").replace("$", "_")
+
+
+async def bump(kind: str, doc: Optional[dict], delta: int) -> None:
+    """Apply +1 / -1 for `doc` to the counters of `kind`."""
+    if not doc:
+        return
+    _, fields = COUNTED[kind]
+    inc = {"total": delta}
+    for field in fields:
+        inc[f"{BREAKDOWN_FIELDS[field]}.{_key(doc.get(field))}"] = delta
+    await stats_counters_collection.update_one(
+        {"_id": kind},
+        {"$inc": inc, "$set": {"updatedAt": datetime.utcnow()}},
+        upsert=True,
+    )
+
+
+async def _count(kind: str) -> dict:
+    collection, fields = COUNTED[kind]
+    facets = {
+        BREAKDOWN_FIELDS[field]: [{"$group": {"_id": f"${field}", "n": {"$sum": 1}}}]
+        for field in fields
+    }
+    facets["total"] = [{"$count": "n"}]
+    result = await collection.aggregate([{"$facet": facets}]).to_list(length=1)
+    row = result[0] if result else {}
+
+    counts = {"total": row["total"][0]["n"] if row.get("total") else 0}
+    for field in fields:
+        name = BREAKDOWN_FIELDS[field]
+        counts[name] = {}
+        for group in row.get(name, []):
+            key = _key(group["_id"])
+            counts[name][key] = counts[name].get(key, 0) + group["n"]
+    return counts
+
+
+async def reconcile() -> dict:
+    """Recount every kind from the source collections and overwrite the counters."""
+    now = datetime.utcnow()
+    for kind in COUNTED:
+        counts = await _count(kind)
+        await stats_counters_collection.replace_one(
+            {"_id": kind},
+            {**counts, "updatedAt": now, "reconciledAt": now},
+            upsert=True,
+        )
+    return {"reconciledAt": now}
+
+
+async def run_reconcile_loop(interval_seconds: float) -> None:
+    """Periodic recount; the app runs the first reconcile() itself at startup."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await reconcile()
+        except Exception as e:
+            print("Stats reconciliation failed:", e)
+
+
+async def read_counters() -> dict:
+    docs = await stats_counters_collection.find(
+        {"_id": {"$in": list(COUNTED)}}
+    ).to_list(length=len(COUNTED))
+    if len(docs) < len(COUNTED):
+        # first start: build the counters once
+        await reconcile()
+        docs = await stats_counters_collection.find(
+            {"_id": {"$in": list(COUNTED)}}
+        ).to_list(length=len(COUNTED))
+    return {doc.pop("_id"): doc for doc in docs}
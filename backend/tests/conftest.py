@@ -0,0 +1,64 @@
+"""
+Shared fixtures for the backend tests.
+
+Tests that need MongoDB run against TEST_MONGODB_URI (default: a local
+mongod) and are skipped when no server answers. The real MONGODB_URI from
+.env is never used.
+"""
+import os
+
+import pytest
+
+os.environ["MONGODB_URI"] = os.getenv(
+    "TEST_MONGODB_URI", "mongodb://localhost:27017/backlink_test"
+)
+# main.py refuses to import without SMTP settings; nothing is sent to them.
+os.environ.setdefault("SMTP_HOST", "localhost")
+os.environ.setdefault("SMTP_PORT", "1025")
+os.environ.setdefault("SMTP_USER", "test")
+os.environ.setdefault("SMTP_PASS", "test")
+os.environ.setdefault("SMTP_FROM", "test@example.com")
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    # one event loop for the whole session; the motor client binds to it
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def mongo_available() -> bool:
+    from pymongo import MongoClient
+    from pymongo.errors import PyMongoError
+
+    probe = MongoClient(os.environ["MONGODB_URI"], serverSelectionTimeoutMS=1000)
+    try:
+        probe.admin.command("ping")
+        return True
+    except PyMongoError:
+        return False
+    finally:
+        probe.close()
+
+
+@pytest.fixture
+async def mongo(mongo_available):
+    """The test database, or a skip when no mongod is reachable."""
+    if not mongo_available:
+        pytest.skip("MongoDB is not reachable at TEST_MONGODB_URI")
+
+    from backend.database import db
+
+    return db
+
+
+@pytest.fixture
+async def api():
+    """An httpx client wired to the app in-process (no lifespan)."""
+    import httpx
+
+    from backend.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def blobs(mongo):
+    from backend import blob_store
+    from backend.models import media_blobs_collection
+
+    created = []
+
+    async def put(data: bytes) -> str:
+        meta = await blob_store.put_blob(data, "application/octet-stream")
+        created.append(meta["blobId"])
+        return meta["blobId"]
+
+    yield put
+    for blob_id in set(created):
+        ref = await media_blobs_collection.find_one_and_delete({"_id": blob_id})
+        if ref and ref.get("fileId") is not None:
+            await blob_store.media_bucket.delete(ref["fileId"])
+
+
+async def _read(blob_id: str) -> bytes:
+    from backend.blob_store import find_blob, iter_blob
+
+    file_doc = await find_blob(blob_id)
+    assert file_doc is not None, "blob is dangling"
+    return b"".join([c async for c in iter_blob(file_doc, 0, file_doc["length"] - 1)])
+
+
+async def test_blob_is_deleted_with_its_last_reference(blobs):
+    from backend.blob_store import find_blob, release_blob
+
+    blob_id = await blobs(b"shared bytes")
+    assert await blobs(b"shared bytes") == blob_id
+
+    assert await release_blob(blob_id) is False
+    assert await _read(blob_id) == b"shared bytes"
+    assert await release_blob(blob_id) is True
+    assert await find_blob(blob_id) is None
+
+
+async def test_concurrent_put_and_release_never_dangle(blobs):
+    from backend.blob_store import release_blob
+
+    data = b"contended bytes"
+    blob_id = await blobs(data)
+    for _ in range(50):
+        # one media is deleted while another upload of the same bytes arrives
+        await asyncio.gather(release_blob(blob_id), blobs(data))
+        assert await _read(blob_id) == data
+
+
+async def test_put_recreates_a_vanished_file(blobs):
+    from backend.blob_store import find_blob, media_bucket
+
+    blob_id = await blobs(b"lost bytes")
+    await media_bucket.delete((await find_blob(blob_id))["_id"])
+
+    await blobs(b"lost bytes")
+    assert await _read(blob_id) == b"lost bytes"
@@ -0,0 +1,116 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backend.browser_pool import BrowserPool
+
+pytestmark = pytest.mark.anyio
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeChromium:
+    def __init__(self):
+        self.launch_delay = 0.0
+        self.launches = 0
+
+    async def launch(self, headless=True):
+        self.launches += 1
+        await asyncio.sleep(self.launch_delay)
+        return _FakeBrowser()
+
+
+async def _started_pool(size: int) -> BrowserPool:
+    pool = BrowserPool(size=size, contexts_per_browser=2)
+    chromium = _FakeChromium()
+    pool._playwright = SimpleNamespace(chromium=chromium)
+    for _ in range(pool.size):
+        pool._slots.append(await pool._launch())
+    return pool
+
+
+async def test_slow_launch_does_not_block_other_checkouts():
+    pool = await _started_pool(size=2)
+    pool._playwright.chromium.launch_delay = 0.5
+    crashed = pool._slots[0]
+    crashed.browser.connected = False
+
+    # the healthy browser serves while the crashed one is relaunched
+    healthy = await asyncio.wait_for(pool._checkout(), 0.1)
+    assert healthy is not crashed
+    await asyncio.wait_for(pool._checkin(healthy, crashed=False), 0.1)
+    again = await asyncio.wait_for(pool._checkout(), 0.1)
+    await asyncio.wait_for(pool._checkin(again, crashed=False), 0.1)
+
+    await asyncio.gather(*pool._background)
+    assert crashed not in pool._slots
+    assert crashed.retired and crashed.browser.closed
+    assert all(s.browser.is_connected() for s in pool._slots)
+    assert pool.stats()["recycled"] == 1
+
+
+async def test_checkout_waits_for_a_relaunch_when_every_browser_is_down():
+    pool = await _started_pool(size=1)
+    pool._playwright.chromium.launch_delay = 0.05
+    pool._slots[0].browser.connected = False
+
+    slot = await pool._checkout()
+    assert slot.browser.is_connected()
+    assert pool._slots == [slot]
+
+
+async def test_concurrent_replacements_share_one_launch():
+    pool = await _started_pool(size=1)
+    pool._playwright.chromium.launch_delay = 0.05
+    old = pool._slots[0]
+    old.browser.connected = False
+    launches_before = pool._playwright.chromium.launches
+
+    slots = await asyncio.gather(*(pool._checkout() for _ in range(5)))
+    assert len({id(s) for s in slots}) == 1
+    assert pool._playwright.chromium.launches == launches_before + 1
+    assert pool._slots == [slots[0]]
+
+
+async def test_retired_browser_closes_when_its_last_page_returns():
+    pool = await _started_pool(size=1)
+    pool.max_pages_per_browser = 1
+    slot = await pool._checkout()
+    other = await pool._checkout()
+
+    await pool._checkin(slot, crashed=False)  # worn out: swapped, one page still open
+    await asyncio.gather(*pool._background)
+    assert slot.retired and not slot.browser.closed
+    await pool._checkin(other, crashed=False)
+    assert slot.browser.closed
+
+
+async def test_checkin_does_not_wait_for_or_fail_on_the_relaunch():
+    pool = await _started_pool(size=1)
+    pool.max_pages_per_browser = 1
+    chromium = pool._playwright.chromium
+    chromium.launch_delay = 0.5
+
+    async def failing_launch(headless=True):
+        await asyncio.sleep(chromium.launch_delay)
+        raise RuntimeError("chromium failed to start")
+
+    chromium.launch = failing_launch
+    slot = await pool._checkout()
+    # the scrape succeeded; a worn-out browser must not hold it up or fail it
+    await asyncio.wait_for(pool._checkin(slot, crashed=False), 0.1)
+
+    await asyncio.gather(*pool._background)
+    assert pool._slots == [slot] and not slot.retired
+    assert slot.replacement is None  # the next checkin retries
@@ -0,0 +1,81 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+REQUESTS = 300
+
+
+async def test_concurrent_contributions_are_not_lost(mongo, api):
+    from backend.models import backlink_contributions_collection, backlinks_collection
+
+    now = datetime.utcnow()
+    # contribute: null is what older documents look like
+    res = await backlinks_collection.insert_one(
+        {"domain": "example.com", "contribute": None, "createdAt": now, "updatedAt": now}
+    )
+    backlink_id = str(res.inserted_id)
+
+    try:
+        responses = await asyncio.gather(*(
+            api.put(
+                f"/api/user/backlinks/{backlink_id}/contribute",
+                json={"subUrl": f"https://example.com/{i}", "userId": f"u{i % 7}"},
+            )
+            for i in range(REQUESTS)
+        ))
+        assert all(r.status_code == 200 for r in responses)
+
+        doc = await backlinks_collection.find_one({"_id": res.inserted_id})
+        assert doc["contribute"]["points"] == REQUESTS
+        assert await backlink_contributions_collection.count_documents(
+            {"backlinkId": backlink_id}
+        ) == REQUESTS
+    finally:
+        await backlinks_collection.delete_one({"_id": res.inserted_id})
+        await backlink_contributions_collection.delete_many({"backlinkId": backlink_id})
+
+
+async def test_contribution_to_missing_backlink_is_404(mongo, api):
+    r = await api.put(
+        "/api/user/backlinks/000000000000000000000000/contribute", json={}
+    )
+    assert r.status_code == 404
+
+
+async def test_contribution_moving_project_marks_the_old_one_dirty(mongo, api):
+    from backend.models import (
+        analytics_dirty_collection,
+        backlink_contributions_collection,
+        backlinks_collection,
+        stats_counters_collection,
+    )
+
+    res = await backlinks_collection.insert_one(
+        {"projectId": "move-from", "categoryId": "c1", "status": "active", "contribute": {"points": 0}}
+    )
+    backlink_id = str(res.inserted_id)
+    before = await stats_counters_collection.find_one({"_id": "backlinks"}) or {}
+    by_project = before.get("byProject", {})
+
+    try:
+        r = await api.put(
+            f"/api/user/backlinks/{backlink_id}/contribute", json={"projectId": "move-to"}
+        )
+        assert r.status_code == 200
+        assert r.json()["projectId"] == "move-to"
+
+        assert await analytics_dirty_collection.find_one({"dim": "project", "key": "move-from"})
+        after = (await stats_counters_collection.find_one({"_id": "backlinks"}))["byProject"]
+        assert after["move-from"] == by_project.get("move-from", 0) - 1
+        assert after["move-to"] == by_project.get("move-to", 0) + 1
+    finally:
+        await backlinks_collection.delete_one({"_id": res.inserted_id})
+        await backlink_contributions_collection.delete_many({"backlinkId": backlink_id})
+        await analytics_dirty_collection.delete_many({"key": {"$in": ["move-from", "move-to"]}})
+        await stats_counters_collection.update_one(
+            {"_id": "backlinks"},
+            {"$inc": {"byProject.move-from": 1, "byProject.move-to": -1}},
+        )
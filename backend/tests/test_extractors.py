@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+from backend.extract_bench import DEFAULT_CORPUS, run_benchmark
+from backend.extractors import EXTRACTORS, extract_metrics, parse_compact_number
+
+PAGES = sorted(DEFAULT_CORPUS.glob("*/*.html"))
+
+
+def test_corpus_covers_every_platform():
+    assert {page.parent.name for page in PAGES} == set(EXTRACTORS)
+
+
+@pytest.mark.parametrize("page", PAGES, ids=lambda p: f"{p.parent.name}/{p.stem}")
+def test_saved_page_matches_expected_output(page):
+    expected = json.loads(page.with_suffix(".json").read_text(encoding="utf-8"))
+    html = page.read_text(encoding="utf-8")
+    assert extract_metrics(page.parent.name, html) == expected
+
+
+def test_benchmark_reports_no_misses():
+    report = run_benchmark(DEFAULT_CORPUS, repeat=1)
+    assert set(report) == set(EXTRACTORS)
+    for platform, row in report.items():
+        assert row["misses"] == [], platform
+        assert row["accuracy"] == 1.0, platform
+
+
+@pytest.mark.parametrize(
+    "text, value",
+    [("1,234", 1234), ("1.2K", 1200), ("4.5M", 4_500_000), ("12 k", 12_000), ("", 0), ("n/a", 0)],
+)
+def test_parse_compact_number(text, value):
+    assert parse_compact_number(text) == value
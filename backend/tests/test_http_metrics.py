@@ -0,0 +1,62 @@
+import json
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from backend.http_metrics import HttpMetricsFetcher
+
+pytestmark = pytest.mark.anyio
+
+PROFILES = Path(__file__).parent / "fixtures" / "profiles"
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def profile_server():
+    """Serve the saved profile pages on a local port."""
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(_QuietHandler, directory=str(PROFILES))
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+async def fetcher():
+    fetcher = HttpMetricsFetcher(timeout=5)
+    await fetcher.start()
+    yield fetcher
+    await fetcher.stop()
+
+
+@pytest.mark.parametrize(
+    "page",
+    ["instagram/profile", "facebook/page", "twitter/profile", "linkedin/company"],
+)
+async def test_metrics_are_extracted_from_saved_pages(profile_server, fetcher, page):
+    platform = page.split("/")[0]
+    expected = json.loads((PROFILES / f"{page}.json").read_text(encoding="utf-8"))
+
+    metrics = await fetcher.fetch(platform, f"{profile_server}/{page}.html")
+    assert metrics == expected
+    assert fetcher.stats()["answered"] == 1
+
+
+async def test_page_without_counts_falls_back(profile_server, fetcher):
+    assert await fetcher.fetch("instagram", f"{profile_server}/instagram/login_wall.html") is None
+    assert fetcher.stats() == {"answered": 0, "fellBack": 1, "errors": 0}
+
+
+async def test_http_error_falls_back(profile_server, fetcher):
+    assert await fetcher.fetch("instagram", f"{profile_server}/instagram/missing.html") is None
+    assert fetcher.stats() == {"answered": 0, "fellBack": 1, "errors": 1}
@@ -0,0 +1,124 @@
+import asyncio
+import email
+import socket
+import time
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+SINK_DELAY = 0.5
+
+
+class _SlowSink:
+    """aiosmtpd handler that takes SINK_DELAY seconds to accept each message."""
+
+    def __init__(self):
+        self.messages = []
+
+    async def handle_DATA(self, server, session, envelope):
+        await asyncio.sleep(SINK_DELAY)
+        self.messages.append(email.message_from_bytes(envelope.content))
+        return "250 OK"
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_sink():
+    from aiosmtpd.controller import Controller
+
+    sink = _SlowSink()
+    controller = Controller(sink, hostname="127.0.0.1", port=_free_port())
+    controller.start()
+    yield sink, controller.port
+    controller.stop()
+
+
+@pytest.fixture
+async def dispatcher(smtp_sink, monkeypatch):
+    from backend import main
+    from backend.mailer import MailDispatcher
+
+    _, port = smtp_sink
+    dispatcher = MailDispatcher("127.0.0.1", port, secure=False, max_retries=0)
+    await dispatcher.start()
+    monkeypatch.setattr(main, "mail_dispatcher", dispatcher)
+    yield dispatcher
+    await dispatcher.stop()
+
+
+async def _max_loop_stall(until: asyncio.Future) -> float:
+    """Longest gap between 10ms ticks of the event loop until `until` is done."""
+    worst = 0.0
+    last = time.monotonic()
+    while not until.done():
+        await asyncio.sleep(0.01)
+        now = time.monotonic()
+        worst = max(worst, now - last)
+        last = now
+    return worst
+
+
+def _text_part(msg) -> str:
+    for part in msg.walk():
+        if part.get_content_type() == "text/plain":
+            return part.get_payload(decode=True).decode()
+    return ""
+
+
+async def test_otp_mail_is_delivered_without_blocking_the_loop(smtp_sink, dispatcher):
+    from backend.main import send_otp_email
+
+    sink, _ = smtp_sink
+    started = time.monotonic()
+    send_otp_email("someone@example.com", "424242")
+    # the handler only enqueues; SMTP happens in the background
+    assert time.monotonic() - started < 0.05
+
+    delivered = asyncio.ensure_future(dispatcher._queue.join())
+    stall = await _max_loop_stall(delivered)
+    assert stall < SINK_DELAY / 2
+
+    assert len(sink.messages) == 1
+    msg = sink.messages[0]
+    assert msg["To"] == "someone@example.com"
+    assert "424242" in _text_part(msg)
+    assert dispatcher.stats()["sent"] == 1
+
+
+async def test_send_waits_for_delivery_and_reuses_the_connection(smtp_sink, dispatcher):
+    from email.message import EmailMessage
+
+    sink, _ = smtp_sink
+    for i in range(2):
+        msg = EmailMessage()
+        msg["From"] = "test@example.com"
+        msg["To"] = f"user{i}@example.com"
+        msg.set_content("hello")
+        await dispatcher.send(msg)
+
+    assert [m["To"] for m in sink.messages] == ["user0@example.com", "user1@example.com"]
+    assert dispatcher.stats()["connects"] == 1
+
+
+async def test_request_otp_responds_before_the_mail_is_sent(mongo, api, smtp_sink, dispatcher):
+    from backend.models import users_collection
+
+    sink, _ = smtp_sink
+    res = await users_collection.insert_one({"email": "otp-test@example.com"})
+    try:
+        started = time.monotonic()
+        r = await api.post("/api/auth/request-otp", json={"email": "otp-test@example.com"})
+        assert r.status_code == 200
+        assert time.monotonic() - started < SINK_DELAY
+
+        await dispatcher._queue.join()
+        user = await users_collection.find_one({"_id": res.inserted_id})
+        assert user["otpCode"] in _text_part(sink.messages[0])
+    finally:
+        await users_collection.delete_one({"_id": res.inserted_id})
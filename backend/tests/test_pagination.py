@@ -0,0 +1,32 @@
+import pytest
+from fastapi import Response
+
+from backend.pagination import DEFAULT_PAGE_SIZE, NEXT_CURSOR_HEADER, find_page
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def numbers(mongo):
+    collection = mongo["test_pagination"]
+    await collection.delete_many({})
+    await collection.insert_many([{"n": i} for i in range(DEFAULT_PAGE_SIZE + 5)])
+    yield collection
+    await collection.drop()
+
+
+async def test_omitted_limit_returns_one_bounded_page(numbers):
+    response = Response()
+    docs = await find_page(numbers, {}, response)
+    assert len(docs) == DEFAULT_PAGE_SIZE
+    assert response.headers[NEXT_CURSOR_HEADER] == str(docs[-1]["_id"])
+
+    rest = await find_page(numbers, {}, Response(), after=response.headers[NEXT_CURSOR_HEADER])
+    assert [d["n"] for d in rest] == list(range(DEFAULT_PAGE_SIZE, DEFAULT_PAGE_SIZE + 5))
+
+
+async def test_last_page_has_no_cursor(numbers):
+    response = Response()
+    docs = await find_page(numbers, {"n": {"$lt": 3}}, response, limit=10)
+    assert len(docs) == 3
+    assert NEXT_CURSOR_HEADER not in response.headers
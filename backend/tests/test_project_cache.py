@@ -0,0 +1,62 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def _no_load(key):
+    return {"_id": key}
+
+
+async def test_sync_picks_up_an_invalidation_published_out_of_order(mongo):
+    from backend.models import cache_invalidations_collection, cache_versions_collection
+    from backend.project_cache import DocumentCache
+
+    channel = "test-out-of-order"
+    publisher = DocumentCache(channel, _no_load)
+    poller = DocumentCache(channel, _no_load)
+    try:
+        await poller.sync()
+        await poller.get("a")
+        await poller.get("b")
+
+        # seq N+1 lands before seq N, as when two workers race
+        first = await cache_versions_collection.find_one_and_update(
+            {"_id": channel}, {"$inc": {"seq": 1}}, upsert=True, return_document=True
+        )
+        await publisher.invalidate("b")
+        await poller.sync()
+        assert poller.stats()["missingSeqs"] == 1
+        assert "b" not in poller._entries and "a" in poller._entries
+
+        await cache_invalidations_collection.insert_one(
+            {"channel": channel, "seq": first["seq"], "keys": ["a"]}
+        )
+        await poller.sync()
+        assert "a" not in poller._entries
+        assert poller.stats()["missingSeqs"] == 0
+    finally:
+        await cache_invalidations_collection.delete_many({"channel": channel})
+        await cache_versions_collection.delete_one({"_id": channel})
+
+
+async def test_pruning_generations_keeps_loads_in_flight():
+    import asyncio
+
+    from backend.project_cache import DocumentCache
+
+    release = asyncio.Event()
+
+    async def slow_load(key):
+        await release.wait()
+        return {"_id": key}
+
+    cache = DocumentCache("test-prune", slow_load, max_entries=1)
+    pending = asyncio.ensure_future(cache.get("slow"))
+    await asyncio.sleep(0)
+    # the write lands mid-load, then enough other evictions to trigger pruning
+    cache._evict("slow")
+    for i in range(5):
+        cache._evict(f"other-{i}")
+    release.set()
+    await pending
+    assert "slow" not in cache._entries
@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+
+import pytest
+
+from backend.request_blocking import (
+    DEFAULT_ESTIMATED_BYTES,
+    ESTIMATED_BYTES,
+    BlockingTotals,
+    RequestBlocker,
+)
+
+
+@pytest.mark.parametrize("resource_type", ["image", "media", "font", "stylesheet"])
+def test_heavy_resource_types_are_blocked(resource_type):
+    blocker = RequestBlocker("instagram")
+    assert blocker.should_block("https://www.instagram.com/static/x", resource_type)
+
+
+@pytest.mark.parametrize(
+    "url, resource_type",
+    [
+        ("https://www.instagram.com/someone/", "document"),
+        ("https://www.instagram.com/api/v1/users/web_profile_info/", "xhr"),
+        ("https://www.instagram.com/graphql/query", "fetch"),
+        ("https://static.cdninstagram.com/rsrc.php/app.js", "script"),
+    ],
+)
+def test_first_party_pages_scripts_and_xhr_are_allowed(url, resource_type):
+    assert not RequestBlocker("instagram").should_block(url, resource_type)
+
+
+def test_tracking_hosts_are_blocked_by_suffix_only():
+    blocker = RequestBlocker("facebook")
+    assert blocker.should_block("https://www.google-analytics.com/collect", "xhr")
+    assert blocker.should_block("https://stats.g.doubleclick.net/j/collect", "script")
+    assert not blocker.should_block("https://notdoubleclick.net/x.js", "script")
+
+
+def test_platform_allowlist_overrides_the_block_rules():
+    url = "https://abs.twimg.com/responsive-web/client-web/main.css"
+    assert not RequestBlocker("twitter").should_block(url, "stylesheet")
+    assert RequestBlocker("linkedin").should_block(url, "stylesheet")
+
+
+@pytest.mark.anyio
+async def test_handle_counts_blocked_and_allowed_requests():
+    blocker = RequestBlocker("instagram")
+    actions = []
+
+    def route(url, resource_type):
+        async def abort():
+            actions.append("abort")
+
+        async def continue_():
+            actions.append("continue")
+
+        return SimpleNamespace(
+            request=SimpleNamespace(url=url, resource_type=resource_type),
+            abort=abort,
+            continue_=continue_,
+        )
+
+    await blocker.handle(route("https://www.instagram.com/a.jpg", "image"))
+    await blocker.handle(route("https://www.instagram.com/b.jpg", "image"))
+    await blocker.handle(route("https://www.instagram.com/c.woff2", "font"))
+    await blocker.handle(route("https://connect.facebook.net/sdk.js", "script"))
+    await blocker.handle(route("https://www.instagram.com/someone/", "document"))
+
+    assert actions == ["abort", "abort", "abort", "abort", "continue"]
+    summary = blocker.summary()
+    assert summary["allowedRequests"] == 1
+    assert summary["blockedRequests"] == 4
+    assert summary["blockedByType"] == {"image": 2, "font": 1, "script": 1}
+    assert summary["estimatedBytesSaved"] == (
+        2 * ESTIMATED_BYTES["image"] + ESTIMATED_BYTES["font"] + ESTIMATED_BYTES["script"]
+    )
+
+    totals = BlockingTotals()
+    totals.add(summary)
+    totals.add(RequestBlocker("twitter").summary())
+    snapshot = totals.snapshot()
+    assert snapshot["pages"] == 2
+    assert snapshot["blockedRequests"] == 4
+    assert snapshot["allowedRequests"] == 1
+    assert snapshot["estimatedBytesSaved"] == summary["estimatedBytesSaved"]
+
+
+def test_unknown_types_use_the_default_size_estimate():
+    blocker = RequestBlocker("instagram")
+    blocker.blocked["ping"] = 3
+    assert blocker.summary()["estimatedBytesSaved"] == 3 * DEFAULT_ESTIMATED_BYTES
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+from bson import ObjectId
+
+pytestmark = pytest.mark.anyio
+
+
+async def _poll(api, run_id: str) -> dict:
+    for _ in range(200):
+        r = await api.get(f"/api/admin/backlinks/score/{run_id}")
+        assert r.status_code == 200
+        if r.json()["status"] != "running":
+            return r.json()
+        await asyncio.sleep(0.02)
+    raise AssertionError("scoring run did not finish")
+
+
+async def test_scoring_runs_in_the_background_and_can_be_polled(mongo, api):
+    from backend.models import backlinks_collection, scoring_runs_collection
+
+    project_id = "score-test-project"
+    await backlinks_collection.insert_many([
+        {"projectId": project_id, "categoryId": "c1", "da": 10 * i, "ss": i, "contribute": {"points": i}}
+        for i in range(1, 6)
+    ])
+    run_id = None
+    try:
+        r = await api.post(f"/api/admin/backlinks/score?projectId={project_id}")
+        assert r.status_code == 202
+        run_id = r.json()["runId"]
+
+        run = await _poll(api, run_id)
+        assert run["status"] == "done"
+        assert run["scored"] == run["written"] == 5
+        assert run["runningHere"] is False
+
+        scored = await backlinks_collection.count_documents(
+            {"projectId": project_id, "quality.score": {"$exists": True}}
+        )
+        assert scored == 5
+    finally:
+        await backlinks_collection.delete_many({"projectId": project_id})
+        if run_id:
+            await scoring_runs_collection.delete_one({"_id": ObjectId(run_id)})
+
+
+async def test_unknown_run_is_404(mongo, api):
+    r = await api.get("/api/admin/backlinks/score/000000000000000000000000")
+    assert r.status_code == 404
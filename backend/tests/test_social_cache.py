@@ -0,0 +1,44 @@
+import pytest
+
+from backend.social_cache import SocialMetricsCache, normalize_profile_url
+
+pytestmark = pytest.mark.anyio
+
+
+def test_facebook_profile_ids_get_distinct_keys():
+    a = normalize_profile_url("https://www.facebook.com/profile.php?id=100001")
+    b = normalize_profile_url("https://www.facebook.com/profile.php?id=100002")
+    assert a != b
+    assert a == "facebook.com/profile.php?id=100001"
+
+
+def test_tracking_params_and_order_do_not_split_keys():
+    assert normalize_profile_url(
+        "https://m.facebook.com/profile.php?fbclid=abc&id=7&sk=about&utm_source=x#top"
+    ) == normalize_profile_url("https://facebook.com/profile.php?sk=about&id=7")
+
+
+def test_host_and_trailing_slash_are_normalized():
+    assert normalize_profile_url("https://WWW.Instagram.com/someone/?igshid=xyz") == (
+        "instagram.com/someone"
+    )
+
+
+async def test_cached_counts_are_not_shared_between_profile_ids():
+    cache = SocialMetricsCache()
+
+    async def fetch_one():
+        return {"followers": 1}
+
+    async def fetch_two():
+        return {"followers": 2}
+
+    first, _ = await cache.get_or_fetch(
+        "facebook", "https://facebook.com/profile.php?id=1", fetch_one
+    )
+    second, source = await cache.get_or_fetch(
+        "facebook", "https://facebook.com/profile.php?id=2", fetch_two
+    )
+    assert first["followers"] == 1
+    assert second["followers"] == 2
+    assert source == "fetch"
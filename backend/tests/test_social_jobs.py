@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from backend.social_jobs import JobQueueFull, SocialJobQueue
+
+pytestmark = pytest.mark.anyio
+
+
+async def _metrics(platform, url, force):
+    return {"followers": 42}
+
+
+async def _wait_finished(queue, job_id):
+    for _ in range(100):
+        job = await queue.get(job_id)
+        if job and job["status"] in ("done", "failed"):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+async def test_job_runs_and_can_be_polled():
+    queue = SocialJobQueue(run=_metrics, workers=1)
+    await queue.start()
+    try:
+        job = await queue.submit("instagram", "https://instagram.com/someone")
+        finished = await _wait_finished(queue, job["id"])
+        assert finished["result"] == {"followers": 42}
+    finally:
+        await queue.stop()
+
+
+async def test_full_queue_is_rejected():
+    queue = SocialJobQueue(run=_metrics, max_queue=1)
+    queue._queue = asyncio.Queue(maxsize=1)  # started but with no workers draining it
+    await queue.submit("instagram", "https://instagram.com/a")
+    with pytest.raises(JobQueueFull):
+        await queue.submit("instagram", "https://instagram.com/b")
+
+
+async def test_job_rejected_after_a_racing_submit_is_not_left_queued():
+    class SlowCollection:
+        def __init__(self):
+            self.docs = {}
+
+        async def update_one(self, query, update, upsert=False):
+            await asyncio.sleep(0)
+            self.docs.setdefault(query["_id"], {}).update(update["$set"])
+
+        async def delete_one(self, query):
+            self.docs.pop(query["_id"], None)
+
+    collection = SlowCollection()
+    queue = SocialJobQueue(run=_metrics, max_queue=1, collection=collection)
+    queue._queue = asyncio.Queue(maxsize=1)
+    # both pass the full() check before either is queued
+    results = await asyncio.gather(
+        queue.submit("instagram", "https://instagram.com/a"),
+        queue.submit("instagram", "https://instagram.com/b"),
+        return_exceptions=True,
+    )
+    accepted = [r for r in results if isinstance(r, dict)]
+    assert len(accepted) == 1
+    assert any(isinstance(r, JobQueueFull) for r in results)
+    assert list(collection.docs) == [accepted[0]["id"]]
+
+
+async def test_job_is_visible_from_another_worker(mongo):
+    collection = mongo["test_social_jobs"]
+    owner = SocialJobQueue(run=_metrics, workers=1, collection=collection)
+    # a second app worker: same collection, never saw the submit
+    other = SocialJobQueue(run=_metrics, collection=collection)
+    await owner.start()
+    try:
+        job = await owner.submit("facebook", "https://facebook.com/profile.php?id=1")
+        await _wait_finished(owner, job["id"])
+
+        polled = await other.get(job["id"])
+        assert polled["id"] == job["id"]
+        assert polled["status"] == "done"
+        assert polled["result"] == {"followers": 42}
+        assert await other.get("missing") is None
+    finally:
+        await owner.stop()
+        await collection.drop()
@@ -0,0 +1,68 @@
+import pytest
+
+from backend import social_sweep
+from backend.social_sweep import (
+    DEFAULT_PLATFORM_LIMITS,
+    SocialSweep,
+    parse_platform_limits,
+)
+
+
+def test_limits_parse_from_payload_and_cli_forms():
+    assert parse_platform_limits({"Instagram": "3"}) == {"instagram": 3}
+    assert parse_platform_limits(["twitter=1", "facebook=4"]) == {"twitter": 1, "facebook": 4}
+
+
+@pytest.mark.parametrize("raw", [{"myspace": 1}, {"instagram": 0}, ["twitter"], "instagram=1"])
+def test_bad_limits_are_rejected(raw):
+    with pytest.raises(ValueError):
+        parse_platform_limits(raw)
+
+
+def test_sweep_applies_default_limits_with_overrides():
+    sweep = SocialSweep(concurrency=8, platform_limits={"instagram": 5})
+    assert sweep.platform_limits == {**DEFAULT_PLATFORM_LIMITS, "instagram": 5}
+    assert SocialSweep(concurrency=8).platform_limits == DEFAULT_PLATFORM_LIMITS
+
+
+@pytest.mark.anyio
+async def test_resume_retries_failed_profiles(mongo, monkeypatch):
+    from backend.models import projects_collection, social_sweeps_collection
+
+    calls = []
+    broken = {"twitter"}
+
+    async def fake_fetch(platform, url, force=True):
+        calls.append(platform)
+        if platform in broken:
+            raise RuntimeError("blocked")
+        return {"posts": 1, "followers": 2, "following": 3}
+
+    monkeypatch.setattr(social_sweep, "fetch_social_metrics", fake_fetch)
+    project = {
+        "name": "sweep-resume",
+        "instagramUrl": "https://instagram.com/someone",
+        "twitterUrl": "https://twitter.com/someone",
+    }
+    await projects_collection.insert_one(project)
+    pid = str(project["_id"])
+    first = SocialSweep(concurrency=2)
+    try:
+        await first.run()
+        doc = await social_sweeps_collection.find_one({"_id": first.sweep_id})
+        assert f"{pid}|instagram" in doc["completedKeys"]
+        assert f"{pid}|twitter" not in doc["completedKeys"]
+        assert f"{pid}|twitter" in doc["failedKeys"]
+
+        broken.clear()
+        calls.clear()
+        result = await SocialSweep(concurrency=2).run(resume_id=str(first.sweep_id))
+        assert "twitter" in calls and "instagram" not in calls
+        assert result["failed"] == 0
+        assert result["completed"] == result["total"] == result["succeeded"]
+        doc = await social_sweeps_collection.find_one({"_id": first.sweep_id})
+        assert f"{pid}|twitter" in doc["completedKeys"]
+        assert doc["failedKeys"] == [] and doc["failures"] == []
+    finally:
+        await projects_collection.delete_one({"_id": project["_id"]})
+        await social_sweeps_collection.delete_many({"_id": first.sweep_id})
@@ -0,0 +1,28 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_reconcile_seeds_counters_from_existing_documents(mongo):
+    from backend import stats
+    from backend.models import stats_counters_collection, users_collection
+
+    docs = [{"email": f"stats-{i}@example.com", "status": "active"} for i in range(3)]
+    await users_collection.insert_many(docs)
+    try:
+        await stats_counters_collection.delete_many({})
+        before = (await stats._count("users"))["total"]
+
+        await stats.reconcile()
+        new_user = {"email": "stats-new@example.com", "status": "active"}
+        await users_collection.insert_one(new_user)
+        docs.append(new_user)
+        await stats.bump("users", new_user, 1)
+
+        counters = (await stats.read_counters())["users"]
+        recount = await stats._count("users")
+        assert counters["total"] == recount["total"] == before + 1
+        assert counters["byStatus"] == recount["byStatus"]
+    finally:
+        await users_collection.delete_many({"_id": {"$in": [d["_id"] for d in docs]}})
+        await stats.reconcile()
@@ -0,0 +1,76 @@
+"""
+Thumbnail throughput: images per second, total and per worker process.
+
+Uses the images in <dir> if given, else synthetic 12 MP JPEGs. No
+database needed:
+
+    python -m backend.thumbnail_bench [dir] [--images 32] [--workers 1,2,4]
+"""
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import List, Optional
+
+from PIL import Image
+
+from .imaging import THUMBNAIL_FORMAT, THUMBNAIL_QUALITY, THUMBNAIL_SIZES, render_thumbnails
+
+
+def _synthetic(count: int) -> List[bytes]:
+    images = []
+    for i in range(count):
+        img = Image.merge(
+            "RGB",
+            [
+                Image.effect_noise((4000, 3000), 40 + i % 20),
+                Image.linear_gradient("L").resize((4000, 3000)),
+                Image.radial_gradient("L").resize((4000, 3000)),
+            ],
+        )
+        buf = BytesIO()
+        img.save(buf, "JPEG", quality=90)
+        images.append(buf.getvalue())
+    return images
+
+
+def _load(directory: Optional[Path], count: int) -> List[bytes]:
+    if directory is None:
+        return _synthetic(count)
+    paths = sorted(p for p in directory.iterdir() if p.suffix.lower() in (".jpg", ".jpeg", ".png", ".webp"))
+    return [p.read_bytes() for p in paths[:count]]
+
+
+def run(images: List[bytes], workers: int) -> float:
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        # warm the workers up so spawn cost isn't measured
+        list(pool.map(render_thumbnails, images[:workers], [{"x": 16}] * workers))
+        started = time.perf_counter()
+        list(
+            pool.map(
+                render_thumbnails,
+                images,
+                [THUMBNAIL_SIZES] * len(images),
+                [THUMBNAIL_FORMAT] * len(images),
+                [THUMBNAIL_QUALITY] * len(images),
+            )
+        )
+        return len(images) / (time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark thumbnail generation")
+    parser.add_argument("dir", type=Path, nargs="?")
+    parser.add_argument("--images", type=int, default=32)
+    parser.add_argument("--workers", default=",".join(sorted({"1", str(os.cpu_count() or 1)})))
+    args = parser.parse_args()
+
+    images = _load(args.dir, args.images)
+    avg_kb = sum(map(len, images)) / len(images) / 1024
+    print(f"{len(images)} images, avg {avg_kb:.0f}KB, sizes={THUMBNAIL_SIZES} format={THUMBNAIL_FORMAT}")
+    for workers in sorted(int(w) for w in args.workers.split(",")):
+        rate = run(images, workers)
+        print(f"workers={workers:2} images/s={rate:7.2f} per worker={rate / workers:6.2f}")
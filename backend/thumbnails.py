@@ -0,0 +1,133 @@
+"""
+Thumbnails for project images.
+
+add_project_media renders THUMBNAIL_SIZES (WebP by default) for every
+uploaded image in a bounded process pool, stores each as a blob and keeps
+the references on the media document under `thumbnails`. Existing media
+is covered by:
+
+    python -m backend.thumbnails [--dry-run]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from .blob_store import find_blob, iter_blob, put_blob
+from .imaging import (
+    CONTENT_TYPES,
+    THUMBNAIL_FORMAT,
+    THUMBNAIL_QUALITY,
+    THUMBNAIL_SIZES,
+    render_thumbnails,
+)
+from .models import project_media_collection
+
+THUMBNAIL_WORKERS = int(os.getenv("THUMBNAIL_WORKERS", str(os.cpu_count() or 1)))
+
+_executor: Optional[ProcessPoolExecutor] = None
+_slots: Optional[asyncio.Semaphore] = None
+
+
+def _pool() -> ProcessPoolExecutor:
+    global _executor, _slots
+    if _executor is None:
+        # spawn, not fork: the app process has Motor and executor threads
+        _executor = ProcessPoolExecutor(
+            max_workers=THUMBNAIL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        # at most two images queued per worker; further callers wait here
+        _slots = asyncio.Semaphore(THUMBNAIL_WORKERS * 2)
+    return _executor
+
+
+def shutdown() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def make_thumbnails(data: bytes, content_type: str) -> dict:
+    """
+    Render and store thumbnails; returns {name: {blobId, width, height,
+    contentType}}. Non-images and undecodable images get {}.
+    """
+    if not (content_type or "").startswith("image/") or content_type == "image/svg+xml":
+        return {}
+    pool = _pool()
+    loop = asyncio.get_running_loop()
+    async with _slots:
+        try:
+            rendered = await loop.run_in_executor(
+                pool, render_thumbnails, data, THUMBNAIL_SIZES, THUMBNAIL_FORMAT, THUMBNAIL_QUALITY
+            )
+        except Exception as e:
+            print("Failed to render thumbnails:", e)
+            return {}
+
+    out_type = CONTENT_TYPES[THUMBNAIL_FORMAT]
+    thumbnails = {}
+    for name, (thumb, width, height) in rendered.items():
+        meta = await put_blob(thumb, out_type)
+        thumbnails[name] = {
+            "blobId": meta["blobId"],
+            "width": width,
+            "height": height,
+            "contentType": out_type,
+        }
+    return thumbnails
+
+
+# ==== BACKFILL ====
+
+
+async def backfill(dry_run: bool = False, concurrency: int = THUMBNAIL_WORKERS) -> dict:
+    """Add thumbnails to image media stored as blobs that don't have them yet."""
+    query = {"kind": "image", "blobId": {"$ne": None}, "thumbnails": {"$exists": False}}
+    if dry_run:
+        return {"pending": await project_media_collection.count_documents(query), "dryRun": True}
+
+    progress = {"done": 0, "skipped": 0}
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(doc: dict) -> None:
+        async with sem:
+            file_doc = await find_blob(doc["blobId"])
+            if not file_doc:
+                progress["skipped"] += 1
+                return
+            data = b"".join([chunk async for chunk in iter_blob(file_doc, 0, file_doc["length"] - 1)])
+            thumbnails = await make_thumbnails(data, doc.get("contentType") or "")
+            # {} is stored too, so undecodable images aren't retried forever
+            await project_media_collection.update_one(
+                {"_id": doc["_id"]}, {"$set": {"thumbnails": thumbnails}}
+            )
+            progress["done" if thumbnails else "skipped"] += 1
+
+    tasks = set()
+    async for doc in project_media_collection.find(query, {"blobId": 1, "contentType": 1}):
+        tasks.add(asyncio.create_task(one(doc)))
+        if len(tasks) >= concurrency * 4:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()  # surface errors; a re-run picks up where this stopped
+    if tasks:
+        await asyncio.gather(*tasks)
+    return {**progress, "dryRun": False}
+
+
+async def _cli(args) -> None:
+    try:
+        print(await backfill(dry_run=args.dry_run))
+    finally:
+        shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate thumbnails for existing image media")
+    parser.add_argument("--dry-run", action="store_true")
+    asyncio.run(_cli(parser.parse_args()))
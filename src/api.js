@@ -1,2 +1,20 @@
 // src/api.js
-export const API_BASE_URL = "https://seo-backlink-analyzer.onrender.com"; // FastAPI dev server
\ No newline at end of file
+export const API_BASE_URL = "https://seo-backlink-analyzer.onrender.com"; // FastAPI dev server
+
+// List endpoints return one page at a time; the X-Next-Cursor header holds
+// the id to pass as ?after= for the next page (absent on the last one).
+export async function fetchAllPages(url, label = "items", after = null) {
+  const items = [];
+  let cursor = after;
+  do {
+    const sep = url.includes("?") ? "&" : "?";
+    const pageUrl = cursor ? `${url}${sep}after=${encodeURIComponent(cursor)}` : url;
+    const res = await fetch(pageUrl);
+    if (!res.ok) {
+      throw new Error(`Failed to load ${label}: ${res.status}`);
+    }
+    items.push(...(await res.json()));
+    cursor = res.headers.get("X-Next-Cursor");
+  } while (cursor);
+  return items;
+}
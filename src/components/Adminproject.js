@@ -3,7 +3,7 @@ import "./AdminDashboard.css";
 import { useNavigate, useLocation } from "react-router-dom";
 
 import logo from "../assets/klon-logo-white.png";
-import { API_BASE_URL } from "../api";
+import { API_BASE_URL, fetchAllPages } from "../api";
 
 import { FaHome } from "react-icons/fa";
 import {
@@ -64,11 +64,10 @@ function Adminproject() {
   useEffect(() => {
     const fetchProjects = async () => {
       try {
-        const res = await fetch(`${API_BASE_URL}/api/projects`);
-        if (!res.ok) {
-          throw new Error(`Failed to load projects: ${res.status}`);
-        }
-        const data = await res.json();
+        const data = await fetchAllPages(
+          `${API_BASE_URL}/api/projects?fields=name,url,description,ownerUserId,status`,
+          "projects"
+        );
         setProjects(data);
       } catch (err) {
         console.error("Error loading projects", err);
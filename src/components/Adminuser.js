@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from "react";
 import "./AdminDashboard.css";
 import logo from "../assets/klon-logo-white.png";
-import { API_BASE_URL } from "../api";
+import { API_BASE_URL, fetchAllPages } from "../api";
 
 import { useNavigate, useLocation } from "react-router-dom";
 import { HiOutlineUserGroup } from "react-icons/hi";
@@ -93,11 +93,7 @@ function Adminuser() {
       try {
         setLoadingUsers(true);
         setUsersError("");
-        const res = await fetch(`${API_BASE_URL}/api/admin/users`);
-        if (!res.ok) {
-          throw new Error(`Failed to load users: ${res.status}`);
-        }
-        const data = await res.json();
+        const data = await fetchAllPages(`${API_BASE_URL}/api/admin/users`, "users");
         setUsers(data);
       } catch (err) {
         setUsersError(err.message || "Error loading users");
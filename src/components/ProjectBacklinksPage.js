@@ -2,7 +2,7 @@
 import React, { useEffect, useState } from "react";
 import { useLocation, useNavigate, useParams } from "react-router-dom";
 import "./AdminDashboard.css";
-import { API_BASE_URL } from "../api";
+import { API_BASE_URL, fetchAllPages } from "../api";
 
 import logo from "../assets/klonlogo.png";
 
@@ -26,7 +26,6 @@ function ProjectBacklinksPage() {
   const [rows, setRows] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState("");
-  const [adminUsers, setAdminUsers] = useState([]);
 
   // Filters
   const [selectedCategory, setSelectedCategory] = useState("");
@@ -69,21 +68,6 @@ function ProjectBacklinksPage() {
     );
   };
 
-  useEffect(() => {
-    const fetchAdminUsers = async () => {
-      try {
-        const res = await fetch(`${API_BASE_URL}/api/admin/users`);
-        if (!res.ok) return;
-        const data = await res.json();
-        setAdminUsers(data || []);
-      } catch (e) {
-        console.error("Failed to load admin users", e);
-      }
-    };
-
-    fetchAdminUsers();
-  }, []);
-
   useEffect(() => {
     const fetchBacklinks = async () => {
       setLoading(true);
@@ -94,15 +78,27 @@ function ProjectBacklinksPage() {
           params.append("projectId", projectId);
         }
 
-        const res = await fetch(
-          `${API_BASE_URL}/api/user/backlinks?${params.toString()}`
+        // project / category names are resolved by the server
+        const data = await fetchAllPages(
+          `${API_BASE_URL}/api/user/backlinks/expanded?${params.toString()}`,
+          "backlinks"
         );
-        if (!res.ok) {
-          throw new Error(`Failed to load backlinks: ${res.status}`);
-        }
-        const data = await res.json();
         console.log("Backlinks for project", projectName, data);
 
+        // sub backlinks are stored separately from the backlink documents
+        const contributions = await fetchAllPages(
+          `${API_BASE_URL}/api/user/contributions?${params.toString()}`,
+          "contributions"
+        ).catch((err) => {
+          console.error("Error loading contributions", err);
+          return [];
+        });
+        const contributionsByBacklink = contributions.reduce((acc, c) => {
+          if (!acc[c.backlinkId]) acc[c.backlinkId] = [];
+          acc[c.backlinkId].push(c);
+          return acc;
+        }, {});
+
         // GROUP BY domain + category + project, collect multiple URLs and sublinks
         const groupedMap = data.reduce((acc, b) => {
           const key = `${b.domain}__${b.categoryId}__${b.projectId || ""}`;
@@ -111,7 +107,7 @@ function ProjectBacklinksPage() {
             acc[key] = {
               id: b.id || b._id,
               domain: b.domain,
-              category: b.categoryId,
+              category: b.category ? b.category.name : b.categoryId,
               da: b.da,
               ss: b.ss,
               urls: [],
@@ -126,8 +122,10 @@ function ProjectBacklinksPage() {
           }
 
           // contributions on this document – add once per subUrl
-          if (b.contributions && b.contributions.length) {
-            b.contributions.forEach((c) => {
+          const backlinkContributions =
+            contributionsByBacklink[b.id || b._id] || [];
+          if (backlinkContributions.length) {
+            backlinkContributions.forEach((c) => {
               if (c.subUrl) {
                 acc[key].subUrls.push({
                   url: c.subUrl,
@@ -176,7 +174,7 @@ function ProjectBacklinksPage() {
     (a, b) => a - b
   );
   const userOptions = Array.from(
-    new Set((adminUsers || []).map((u) => u.name).filter(Boolean))
+    new Set(rows.flatMap((r) => r.contributors || []).filter(Boolean))
   );
 
   // react-select options for Categories
@@ -4,7 +4,7 @@ import { useParams, useLocation, useNavigate } from "react-router-dom";
 import "./AdminDashboard.css";
 
 import logo from "../assets/klonlogo.png";
-import { API_BASE_URL } from "../api";
+import { API_BASE_URL, fetchAllPages } from "../api";
 import { FaYoutube } from "react-icons/fa";
 import { FaHome } from "react-icons/fa";
 import { FaLink, FaDesktop } from "react-icons/fa6";
@@ -116,50 +116,70 @@ function ProjectMediaPage() {
     isVideoPreviewOpen,
   ]);
 
+  // Uploaded bytes live in the blob store; older docs may still carry a dataUrl
+  const mediaUrl = (m) =>
+    m.blobId
+      ? `${API_BASE_URL}/api/media/blobs/${m.blobId}`
+      : m.dataUrl || m.url || "";
+
+  // Grid cards use the mid-size thumbnail; preview and download keep the original
+  const thumbUrl = (m) => {
+    const thumb = m.thumbnails && (m.thumbnails.md || m.thumbnails.sm);
+    return thumb ? `${API_BASE_URL}/api/media/blobs/${thumb.blobId}` : "";
+  };
+
   // Load already-saved media for this project
   useEffect(() => {
     const loadMedia = async () => {
       try {
         if (!projectId) return;
 
-        const [imgRes, vidRes, fileRes] = await Promise.all([
-          fetch(`${API_BASE_URL}/api/projects/${projectId}/media?kind=image`),
-          fetch(`${API_BASE_URL}/api/projects/${projectId}/media?kind=video`),
-          fetch(`${API_BASE_URL}/api/projects/${projectId}/media?kind=file`),
-        ]);
-
-        if (imgRes.ok) {
-          const data = await imgRes.json();
-          setImages(
-            data.map((m) => ({
-              id: m.id || m._id,
-              name: m.name,
-              url: m.dataUrl || m.url || "",
-            }))
-          );
+        // one request for all three kinds
+        const res = await fetch(
+          `${API_BASE_URL}/api/projects/${projectId}/media?grouped=true`
+        );
+        if (!res.ok) {
+          throw new Error(`Failed to load media: ${res.status}`);
         }
+        const groups = await res.json();
+
+        // each kind comes with its first page; fetch the rest by cursor
+        await Promise.all(
+          Object.entries(groups).map(async ([kind, group]) => {
+            if (!group.nextCursor) return;
+            const rest = await fetchAllPages(
+              `${API_BASE_URL}/api/projects/${projectId}/media?kind=${kind}`,
+              "media",
+              group.nextCursor
+            );
+            group.items = group.items.concat(rest);
+          })
+        );
 
-        if (vidRes.ok) {
-          const data = await vidRes.json();
-          setVideos(
-            data.map((m) => ({
-              id: m.id || m._id,
-              name: m.name,
-              url: m.url || "",
-            }))
-          );
-        }
+        setImages(
+          groups.image.items.map((m) => ({
+            id: m.id || m._id,
+            name: m.name,
+            url: mediaUrl(m),
+            thumbUrl: thumbUrl(m),
+          }))
+        );
 
-        if (fileRes.ok) {
-          const data = await fileRes.json();
-          setFiles(
-            data.map((m) => ({
-              id: m.id || m._id,
-              name: m.name,
-              url: m.dataUrl || m.url || "",
-            }))
-          );
-        }
+        setVideos(
+          groups.video.items.map((m) => ({
+            id: m.id || m._id,
+            name: m.name,
+            url: m.url || "",
+          }))
+        );
+
+        setFiles(
+          groups.file.items.map((m) => ({
+            id: m.id || m._id,
+            name: m.name,
+            url: mediaUrl(m),
+          }))
+        );
       } catch (e) {
         console.error("Failed to load project media", e);
       }
@@ -662,8 +682,9 @@ function ProjectMediaPage() {
                   {images.map((img) => (
                     <div className="media-image-card" key={img.id}>
                       <img
-                        src={img.url}
+                        src={img.thumbUrl || img.url}
                         alt={img.name}
+                        loading="lazy"
                         onClick={() => {
                           setPreviewImage(img);
                           setIsImagePreviewOpen(true);
@@ -1016,7 +1037,8 @@ function ProjectMediaPage() {
                         ...saved.map((m) => ({
                           id: m.id || m._id,
                           name: m.name,
-                          url: m.dataUrl || m.url || "",
+                          url: mediaUrl(m),
+                          thumbUrl: thumbUrl(m),
                         })),
                       ]);
 
@@ -1232,7 +1254,7 @@ function ProjectMediaPage() {
                         ...saved.map((m) => ({
                           id: m.id || m._id,
                           name: m.name,
-                          url: m.dataUrl || m.url || "",
+                          url: mediaUrl(m),
                         })),
                       ]);
 
@@ -16,7 +16,7 @@ import { HiOutlinePencilAlt } from "react-icons/hi";
 import { RiDeleteBin6Line } from "react-icons/ri";
 import { FaHouseLaptop } from "react-icons/fa6";
 
-import { API_BASE_URL } from "../api";
+import { API_BASE_URL, fetchAllPages } from "../api";
 
 /**
  * Extract clean domain from a URL or text.
@@ -186,11 +186,11 @@ function UserBacklinks() {
       try {
         setLoading(true);
         setLoadError("");
-        const res = await fetch(`${API_BASE_URL}/api/user/backlinks`);
-        if (!res.ok) {
-          throw new Error(`Failed to load backlinks: ${res.status}`);
-        }
-        const data = await res.json();
+        // project names come resolved from the server
+        const data = await fetchAllPages(
+          `${API_BASE_URL}/api/user/backlinks/expanded`,
+          "backlinks"
+        );
         setBacklinks(data);
       } catch (err) {
         console.error("Error loading backlinks", err);
@@ -202,9 +202,10 @@ function UserBacklinks() {
 
     const fetchProjects = async () => {
       try {
-        const res = await fetch(`${API_BASE_URL}/api/projects`);
-        if (!res.ok) return;
-        const data = await res.json();
+        const data = await fetchAllPages(
+          `${API_BASE_URL}/api/projects?view=summary`,
+          "projects"
+        );
         setProjects(data);
       } catch (err) {
         console.error("Error loading projects", err);
@@ -213,9 +214,7 @@ function UserBacklinks() {
 
     const fetchCategories = async () => {
       try {
-        const res = await fetch(`${API_BASE_URL}/api/categories`);
-        if (!res.ok) return;
-        const data = await res.json();
+        const data = await fetchAllPages(`${API_BASE_URL}/api/categories`, "categories");
         setCategories(data);
       } catch (err) {
         console.error("Error loading categories", err);
@@ -460,9 +459,20 @@ function UserBacklinks() {
     setContributeModalOpen(true);
   };
 
-  const handleOpenContributeView = (item) => {
-    setContributeTarget(item);
+  const handleOpenContributeView = async (item) => {
+    setContributeTarget({ ...item, contributions: [] });
     setContributeViewModalOpen(true);
+    try {
+      const data = await fetchAllPages(
+        `${API_BASE_URL}/api/user/backlinks/${item.id}/contributions`,
+        "contributions"
+      );
+      setContributeTarget((prev) =>
+        prev && prev.id === item.id ? { ...prev, contributions: data } : prev
+      );
+    } catch (err) {
+      console.error("Error loading contributions", err);
+    }
   };
 
   const closeContributeModal = () => {
@@ -536,6 +546,7 @@ function UserBacklinks() {
           domain: b.domain,
           categoryId: b.categoryId,
           projectId: b.projectId || "",
+          projectName: b.project ? b.project.name : "",
           da: b.da,
           ss: b.ss,
           contribute: b.contribute,
@@ -857,14 +868,10 @@ function UserBacklinks() {
                           <td>
                             {(() => {
                               if (!item.projectId) return "-";
-                              const project = projects.find(
-                                (p) =>
-                                  (p.id || p._id) === item.projectId ||
-                                  p.name === item.projectId
-                              );
-                              const projName = project
-                                ? project.name
-                                : item.projectId;
+                              // rows added/edited in this session aren't expanded
+                              const projName =
+                                item.projectName ||
+                                getProjectName(item.projectId);
 
                               if (!selectedProject) return projName;
 
@@ -3,7 +3,7 @@ import "./AdminDashboard.css";
 import { useNavigate, useLocation } from "react-router-dom";
 
 import logo from "../assets/klonlogo.png";
-import { API_BASE_URL } from "../api";
+import { API_BASE_URL, fetchAllPages } from "../api";
 
 import { FaHome } from "react-icons/fa";
 import { FaLink, FaDesktop } from "react-icons/fa6";
@@ -44,10 +44,8 @@ function UserPlacements() {
       setLoading(true);
       setLoadError("");
       try {
-        const res = await fetch(`${API_BASE_URL}/api/placements`);
-        if (!res.ok) throw new Error("Failed to load placements");
-        const data = await res.json();
-        setPlacements(data || []);
+        const data = await fetchAllPages(`${API_BASE_URL}/api/placements`, "placements");
+        setPlacements(data);
       } catch (err) {
         console.error("Error loading placements", err);
         setLoadError(err.message || "Failed to load placements");
@@ -62,12 +62,11 @@ function UserProjectInfoPage() {
         setLoadError("");
         setSaveSuccess("");
 
-        const res = await fetch(`${API_BASE_URL}/api/projects`);
-        if (!res.ok) {
-          throw new Error(`Failed to load projects: ${res.status}`);
+        const res = await fetch(`${API_BASE_URL}/api/projects/${projectId}`);
+        if (!res.ok && res.status !== 404) {
+          throw new Error(`Failed to load project: ${res.status}`);
         }
-        const data = await res.json();
-        const found = data.find((p) => (p.id || p._id) === projectId);
+        const found = res.ok ? await res.json() : null;
 
         setProject(found || null);
 
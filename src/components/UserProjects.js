@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from "react";
 import "./AdminDashboard.css";
 import { useNavigate, useLocation } from "react-router-dom";
-import { API_BASE_URL } from "../api";
+import { API_BASE_URL, fetchAllPages } from "../api";
 
 import logo from "../assets/klonlogo.png";
 
@@ -29,13 +29,9 @@ function UserProjects() {
         setProjectsError("");
 
         // Show all projects
-        const url = `${API_BASE_URL}/api/projects`;
+        const url = `${API_BASE_URL}/api/projects?view=summary`;
 
-        const res = await fetch(url);
-        if (!res.ok) {
-          throw new Error(`Failed to load projects: ${res.status}`);
-        }
-        const data = await res.json();
+        const data = await fetchAllPages(url, "projects");
         setProjects(data);
       } catch (err) {
         setProjectsError(err.message || "Error loading projects");
@@ -3,7 +3,7 @@ import "./AdminDashboard.css";
 import { useNavigate, useLocation } from "react-router-dom";
 
 import logo from "../assets/klonlogo.png";
-import { API_BASE_URL } from "../api";
+import { API_BASE_URL, fetchAllPages } from "../api";
 
 import { FaHome } from "react-icons/fa";
 import { FaLink, FaDesktop } from "react-icons/fa6";
@@ -46,9 +46,7 @@ function UserTools() {
   useEffect(() => {
     const fetchTools = async () => {
       try {
-        const res = await fetch(`${API_BASE_URL}/api/tools`);
-        if (!res.ok) throw new Error("Failed to load tools");
-        const data = await res.json();
+        const data = await fetchAllPages(`${API_BASE_URL}/api/tools`, "tools");
         setSavedTools(data);
       } catch (err) {
         console.error("Error loading tools", err);